@@ -1,6 +1,12 @@
-import sqlite3
 import sys
 import os
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fvs_tools.output_parser import find_calibration_tables
+from fvs_tools.sqlite_utils import open_sqlite
 
 db_path = "/workspaces/fors591/outputs/assignment5_part1_base/CARB_99/FVSOut.db"
 
@@ -8,22 +14,19 @@ if not os.path.exists(db_path):
     print(f"DB not found: {db_path}")
     sys.exit(1)
 
-conn = sqlite3.connect(db_path)
+conn = open_sqlite(db_path, read_only=True, immutable=True)
 cursor = conn.cursor()
 cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
 tables = cursor.fetchall()
 print("Tables found:", [t[0] for t in tables])
 
-for t in tables:
-    name = t[0]
-    if "Calib" in name or "CALIB" in name:
-        print(f"Found calibration table: {name}")
-        cursor.execute(f"SELECT * FROM {name} LIMIT 5")
-        rows = cursor.fetchall()
-        names = [description[0] for description in cursor.description]
-        print(f"Columns: {names}")
-        print("Rows:")
-        for row in rows:
-            print(row)
+for name in find_calibration_tables(conn):
+    print(f"Found calibration table: {name}")
+    cursor.execute(f"SELECT * FROM {name} LIMIT 5")
+    names = [description[0] for description in cursor.description]
+    print(f"Columns: {names}")
+    print("Rows:")
+    for row in cursor:
+        print(row)
 
 conn.close()
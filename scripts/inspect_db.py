@@ -1,12 +1,17 @@
-import sqlite3
-import pandas as pd
 import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fvs_tools.output_parser import find_calibration_tables
+from fvs_tools.sqlite_utils import open_sqlite
 
 db_path = "/workspaces/fors591/outputs/assignment5_part1_base/CARB_99/FVSOut.db"
 print(f"Inspecting {db_path}")
 
 try:
-    conn = sqlite3.connect(db_path)
+    conn = open_sqlite(db_path, read_only=True, immutable=True)
 
     # List all tables
     cursor = conn.cursor()
@@ -16,16 +21,18 @@ try:
     print("Tables in DB:", table_names)
 
     # Check for calibration table and print columns/sample
-    found_calib = False
-    for table_name in table_names:
-        if "Calib" in table_name or "CALIB" in table_name:
-            found_calib = True
-            print(f"\n--- Table: {table_name} ---")
-            df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
-            print(df.head())
-            print("Columns:", df.columns.tolist())
-    
-    if not found_calib:
+    calib_tables = find_calibration_tables(conn)
+    for table_name in calib_tables:
+        print(f"\n--- Table: {table_name} ---")
+        # Only a 5-row preview is needed
+        cursor.execute(f'SELECT * FROM "{table_name}" LIMIT 5')
+        columns = [description[0] for description in cursor.description]
+        print("\t".join(columns))
+        for row in cursor:
+            print("\t".join(str(value) for value in row))
+        print("Columns:", columns)
+
+    if not calib_tables:
         print("\nNo table with 'Calib' in name found.")
 
     conn.close()
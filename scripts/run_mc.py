@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+"""
+Parametrized Monte Carlo driver for the Assignment 5 harv1 treatment.
+
+Runs a Monte Carlo batch of FVS simulations with parameters varied around the
+harv1 Q-factor thinning baseline. The demo, large-scale and timing scripts are
+thin presets over this driver.
+
+Usage:
+    cd /workspaces/fors591
+    uv run python scripts/run_mc.py --samples 50 --workers 4 \\
+        --plots 99,100,101 --vary thin_q_factor=1.5:2.5 \\
+        --output outputs/my_batch
+
+Plot selection (--plots):
+    carbon   All valid carbon plots (default)
+    all      Every plot in the stand file
+    99,100   Comma-separated list of plot IDs (subset of carbon plots)
+
+Monitor with:
+    htop
+    # or
+    watch -n 0.5 'ps aux | grep FVSiec | grep -v grep | wc -l'
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import fvs_tools as fvs
+from fvs_tools.monte_carlo import (
+    MonteCarloConfig,
+    UniformParameterSpec,
+    run_monte_carlo_batch,
+    summarize_mc,
+)
+
+DEFAULT_VARY = ["thin_q_factor=1.5:2.5"]
+
+
+def parse_vary(spec: str) -> UniformParameterSpec:
+    """
+    Parse a ``NAME=LO:HI`` string into a uniform parameter spec.
+
+    Args:
+        spec: Parameter range, e.g. "thin_residual_ba=60:80"
+
+    Returns:
+        UniformParameterSpec over [LO, HI]
+
+    Raises:
+        argparse.ArgumentTypeError: If the string is malformed
+    """
+    try:
+        name, bounds = spec.split("=", 1)
+        low, high = bounds.split(":", 1)
+        return UniformParameterSpec(name.strip(), float(low), float(high))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"Expected NAME=LO:HI, got {spec!r} ({e})"
+        ) from e
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for the driver."""
+    parser = argparse.ArgumentParser(
+        description="Run a Monte Carlo batch around the Assignment 5 harv1 baseline."
+    )
+    parser.add_argument("--samples", type=int, default=50, help="Parameter samples")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel workers")
+    parser.add_argument("--years", type=int, default=100, help="Projection length")
+    parser.add_argument("--cycle", type=int, default=10, help="Cycle length (years)")
+    parser.add_argument(
+        "--plots",
+        default="carbon",
+        help="'carbon', 'all', or comma-separated plot IDs (default: carbon)",
+    )
+    parser.add_argument(
+        "--vary",
+        action="append",
+        type=parse_vary,
+        metavar="NAME=LO:HI",
+        help="Uniformly vary a parameter (repeatable; default thin_q_factor=1.5:2.5)",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=Path("outputs/mc"), help="Output directory"
+    )
+    parser.add_argument("--name", default="harv1_mc", help="Base config name")
+    parser.add_argument("--seed", type=int, default=42, help="Batch seed")
+    parser.add_argument(
+        "--treelist", action="store_true", help="Write FVS tree lists"
+    )
+    parser.add_argument(
+        "--confirm", action="store_true", help="Wait for Enter before starting"
+    )
+    return parser
+
+
+def build_base_config(args: argparse.Namespace) -> fvs.FVSSimulationConfig:
+    """
+    Build the harv1 base config that every Monte Carlo sample starts from.
+
+    Only the tree list follows --treelist; carbon and canopy cover output keep
+    the FVSSimulationConfig defaults (on) so the carbon and canopy metrics are
+    always populated.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        FVSSimulationConfig with the harv1 baseline
+    """
+    return fvs.build_default_harv1_config(
+        name=args.name,
+        num_years=args.years,
+        cycle_length=args.cycle,
+        output_treelist=args.treelist,
+    )
+
+
+def main(argv: list[str] | None = None) -> Path:
+    """
+    Run a Monte Carlo batch configured from command-line arguments.
+
+    Args:
+        argv: Argument vector (defaults to sys.argv[1:])
+
+    Returns:
+        Path to the results database
+    """
+    args = build_parser().parse_args(argv)
+    specs = args.vary or [parse_vary(s) for s in DEFAULT_VARY]
+
+    if args.plots in ("carbon", "all"):
+        plot_ids = None
+    else:
+        plot_ids = [int(p) for p in args.plots.split(",")]
+
+    # Each phase's status block is emitted with a single write
+    print(
+        "\n".join(
+            [
+                "=" * 70,
+                f"MONTE CARLO BATCH: {args.name}",
+                "=" * 70,
+                f"  Samples:     {args.samples}",
+                f"  Workers:     {args.workers}",
+                f"  Years:       {args.years}",
+                f"  Cycles:      {args.years // args.cycle}",
+                f"  Plots:       {args.plots}",
+                "  Varying:     "
+                + ", ".join(f"{s.name} [{s.min_value}, {s.max_value}]" for s in specs),
+                f"  Output:      {args.output}",
+                "=" * 70,
+                "\nLoading and validating data...",
+            ]
+        )
+    )
+
+    # Load and validate (stands without trees are excluded)
+    data = fvs.load_and_validate(plot_ids=plot_ids, carbon_only=args.plots != "all")
+    stands, trees = data.stands, data.trees
+    if data.report["excluded_stands"]:
+        fvs.print_validation_report(data.report)
+
+    n_stands = len(stands)
+    print(
+        "\n".join(
+            [
+                f"Valid stands: {n_stands}",
+                f"Total trees: {len(trees)}",
+                f"\nTotal FVS stand simulations: {args.samples} × {n_stands} = "
+                f"{args.samples * n_stands}",
+            ]
+        )
+    )
+
+    if args.confirm:
+        input("Press Enter to start the batch run...")
+
+    base_config = build_base_config(args)
+
+    # Data is already filtered, so only pass explicit plot lists through
+    mc_config = MonteCarloConfig(
+        batch_seed=args.seed,
+        n_samples=args.samples,
+        n_workers=args.workers,
+        plot_ids=plot_ids,
+        parameter_specs=specs,
+        base_config=base_config,
+    )
+
+    output_dir = args.output
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(
+        "\n".join(
+            [
+                f"\nBatch ID: {mc_config.batch_id}",
+                f"Start time: {time.strftime('%Y-%m-%d %H:%M:%S')}",
+                "=" * 70 + "\n",
+            ]
+        )
+    )
+
+    start_time = time.time()
+    results_db = run_monte_carlo_batch(mc_config, stands, trees, output_dir)
+    elapsed = time.time() - start_time
+
+    stats = summarize_mc(results_db)
+    n_runs = stats["n_runs"]
+
+    lines = [
+        "\n" + "=" * 70,
+        "RESULTS SUMMARY",
+        "=" * 70,
+        f"  Total wall time:    {elapsed:.1f} seconds ({elapsed/60:.1f} minutes)",
+        f"  Runs completed:     {n_runs}/{args.samples}",
+        f"  Time per stand:     {elapsed / max(n_stands, 1):.2f} seconds",
+    ]
+
+    if n_runs > 0:
+        harvest = stats["cumulative_harvest_bdft"]
+        carbon = stats["final_total_carbon"]
+        lines += [
+            f"\nOutput Metrics (across {n_runs} runs):",
+            "  Cumulative Harvest:",
+            f"    Mean:   {harvest['mean']:.1f} bdft/ac",
+            f"    Std:    {harvest['std']:.1f} bdft/ac",
+            f"    Range:  {harvest['min']:.1f} - {harvest['max']:.1f}",
+            "  Final Total Carbon:",
+            f"    Mean:   {carbon['mean']:.1f} tons/ac",
+            f"    Std:    {carbon['std']:.1f} tons/ac",
+            f"    Range:  {carbon['min']:.1f} - {carbon['max']:.1f}",
+        ]
+
+    lines += [
+        f"\nResults database: {results_db}",
+        f"Run directories:  {output_dir}/run_*/",
+        "=" * 70,
+    ]
+    print("\n".join(lines))
+
+    return results_db
+
+
+if __name__ == "__main__":
+    main()
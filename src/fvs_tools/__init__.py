@@ -10,37 +10,52 @@ This package provides utilities for:
 - Experiment management for parameter sweeps
 """
 
-from .config import FVSSimulationConfig
+from .config import FVSSimulationConfig, build_default_harv1_config
 from .data_loader import (
     load_stands,
     load_trees,
     filter_by_plot_ids,
+    build_stand_index,
     get_stand_trees,
     prepare_fvs_database,
     get_carbon_plot_ids,
     validate_stands,
     print_validation_report,
+    load_and_validate,
+    LoadResult,
 )
 from .keyword_builder import build_keyword_file
 from .tree_file import write_tree_file
 from .runner import run_fvs
 from .output_parser import parse_fvs_db
-from .batch import run_batch_simulation, aggregate_by_period, collect_batch_errors
+from .batch import (
+    run_batch_simulation,
+    aggregate_by_period,
+    collect_batch_errors,
+    decode_registry_errors,
+)
 from .db_input import create_fvs_input_db, verify_fvs_input_db
+from .sqlite_utils import bulk_load_mode, open_sqlite
 from .experiment import ExperimentBatch, load_batch_registry, load_batch_results
 
 __all__ = [
     "FVSSimulationConfig",
+    "build_default_harv1_config",
     "load_stands",
     "load_trees",
     "filter_by_plot_ids",
+    "build_stand_index",
     "get_stand_trees",
     "prepare_fvs_database",
     "get_carbon_plot_ids",
     "validate_stands",
     "print_validation_report",
+    "load_and_validate",
+    "LoadResult",
     "create_fvs_input_db",
     "verify_fvs_input_db",
+    "open_sqlite",
+    "bulk_load_mode",
     "build_keyword_file",
     "write_tree_file",
     "run_fvs",
@@ -48,6 +63,7 @@ __all__ = [
     "run_batch_simulation",
     "aggregate_by_period",
     "collect_batch_errors",
+    "decode_registry_errors",
     "ExperimentBatch",
     "load_batch_registry",
     "load_batch_results",
@@ -4,14 +4,19 @@ Batch simulation orchestration.
 Run FVS on multiple stands and aggregate results.
 """
 
-import sqlite3
+import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 
 import pandas as pd
+from tqdm import tqdm
 
 from .config import FVSSimulationConfig
-from .data_loader import get_stand_trees
 from .keyword_builder import build_keyword_file
 from .output_parser import (
     extract_calibration_stats,
@@ -22,13 +27,60 @@ from .output_parser import (
     summarize_by_year,
 )
 from .runner import check_fvs_errors, run_fvs
+from .sqlite_utils import open_sqlite
 from .tree_file import write_tree_file
 
+# SQL Schema Definitions
+SCHEMA_RUN_REGISTRY = """
+CREATE TABLE IF NOT EXISTS run_registry (
+    batch_id          TEXT NOT NULL,
+    run_index         INTEGER NOT NULL,
+    stand_id          TEXT,
+    config_name       TEXT,
+    num_years         INTEGER,
+    cycle_length      INTEGER,
+    thin_q_factor     REAL,
+    thin_residual_ba  REAL,
+    thin_trigger_ba   REAL,
+    thin_min_dbh      REAL,
+    thin_max_dbh      REAL,
+    min_harvest_volume REAL,
+    output_dir        TEXT,
+    success           INTEGER,
+    error_message     TEXT,
+    created_at        TEXT,
+    PRIMARY KEY (batch_id, run_index)
+)
+"""
+
+
+class RegistryRow(NamedTuple):
+    """One run_registry row, with fields in table column order."""
+
+    batch_id: str
+    run_index: int
+    stand_id: str
+    config_name: str
+    num_years: int
+    cycle_length: int
+    thin_q_factor: float | None
+    thin_residual_ba: float | None
+    thin_trigger_ba: float | None
+    thin_min_dbh: float | None
+    thin_max_dbh: float | None
+    min_harvest_volume: float | None
+    output_dir: str
+    success: int
+    # JSON-encoded list of error strings; rows from older versions hold the
+    # errors joined with "; ". Read with decode_registry_errors().
+    error_message: str | None
+    created_at: str
+
 
 def _write_batch_registry(
     output_base: Path,
     batch_id: str,
-    run_records: list[dict],
+    run_records: list["RegistryRow"],
 ) -> Path:
     """
     Write batch run registry to SQLite database.
@@ -39,44 +91,26 @@ def _write_batch_registry(
     Args:
         output_base: Base output directory
         batch_id: Unique batch identifier
-        run_records: List of dicts with run metadata
+        run_records: Registry rows in run_registry column order
 
     Returns:
         Path to the registry database
     """
     db_path = output_base / "batch_registry.db"
 
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-
-    # Create registry table
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS run_registry (
-            batch_id          TEXT NOT NULL,
-            run_index         INTEGER NOT NULL,
-            stand_id          TEXT,
-            config_name       TEXT,
-            num_years         INTEGER,
-            cycle_length      INTEGER,
-            thin_q_factor     REAL,
-            thin_residual_ba  REAL,
-            thin_trigger_ba   REAL,
-            thin_min_dbh      REAL,
-            thin_max_dbh      REAL,
-            min_harvest_volume REAL,
-            output_dir        TEXT,
-            success           INTEGER,
-            error_message     TEXT,
-            created_at        TEXT,
-            PRIMARY KEY (batch_id, run_index)
-        )
-    """
-    )
+    # Registry is rebuilt by rerunning the batch, so skip durability
+    conn = open_sqlite(db_path, scratch=True)
 
-    # Insert records
-    for record in run_records:
-        cursor.execute(
+    # Create the registry table only when the file is new
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='run_registry'"
+    ).fetchone()
+    if not has_table:
+        conn.execute(SCHEMA_RUN_REGISTRY)
+
+    # Insert all records in a single transaction
+    with conn:
+        conn.executemany(
             """
             INSERT OR REPLACE INTO run_registry (
                 batch_id, run_index, stand_id, config_name,
@@ -86,27 +120,9 @@ def _write_batch_registry(
                 output_dir, success, error_message, created_at
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                record["batch_id"],
-                record["run_index"],
-                record["stand_id"],
-                record["config_name"],
-                record["num_years"],
-                record["cycle_length"],
-                record.get("thin_q_factor"),
-                record.get("thin_residual_ba"),
-                record.get("thin_trigger_ba"),
-                record.get("thin_min_dbh"),
-                record.get("thin_max_dbh"),
-                record.get("min_harvest_volume"),
-                record["output_dir"],
-                1 if record["success"] else 0,
-                record.get("error_message"),
-                record["created_at"],
-            ),
+            run_records,
         )
 
-    conn.commit()
     conn.close()
 
     return db_path
@@ -119,10 +135,18 @@ def run_single_stand(
     output_dir: Path,
     use_database: bool = False,
     input_database: Path | None = None,
+    batch_id: str | None = None,
+    run_index: int | None = None,
+    *,
+    stand_id: str | None = None,
 ) -> dict:
     """
     Run FVS simulation for a single stand.
 
+    The passed config is never mutated; batch tracking and the stand's start
+    year are applied to a per-call copy, so one config can be shared across
+    concurrent stand runs.
+
     Args:
         stand: Series with stand attributes
         trees: DataFrame with trees for this stand
@@ -130,6 +154,10 @@ def run_single_stand(
         output_dir: Directory for outputs
         use_database: If True, use database input instead of tree files
         input_database: Path to FVS input database (required if use_database=True)
+        batch_id: Batch identifier (defaults to config.batch_id)
+        run_index: 0-based index of this stand within the batch
+        stand_id: Stand identifier, if already known (defaults to
+                  str(stand["STAND_ID"]))
 
     Returns:
         Dictionary with:
@@ -141,13 +169,19 @@ def run_single_stand(
             - calibration: Calibration statistics dict
             - errors: List of error messages
     """
-    stand_id = str(stand["STAND_ID"])
+    if stand_id is None:
+        stand_id = str(stand["STAND_ID"])
     stand_dir = output_dir / stand_id
     stand_dir.mkdir(parents=True, exist_ok=True)
 
     # Set start year from stand's inventory year for target_end_year calculation
     inv_year = int(stand.get("INV_YEAR", 2023))
-    config._start_year = inv_year
+    config = replace(
+        config,
+        batch_id=batch_id if batch_id is not None else config.batch_id,
+        run_index=run_index,
+        _start_year=inv_year,
+    )
 
     # Create input files
     key_file = stand_dir / "run.key"
@@ -195,11 +229,20 @@ def run_single_stand(
         db_path = stand_dir / "FVSOut.db"
         max_year = config.target_end_year
 
-        summary = get_summary_table(db_path, max_year=max_year)
-        carbon = get_carbon_table(db_path, max_year=max_year)
-        harvest_carbon = get_harvest_carbon_table(db_path, max_year=max_year)
-        compute = get_compute_table(db_path, max_year=max_year)
-        calibration = extract_calibration_stats(db_path)
+        if db_path.exists():
+            # One immutable read-only connection (FVS has exited) shared by
+            # all table reads
+            conn = open_sqlite(db_path, read_only=True, immutable=True)
+            try:
+                summary = get_summary_table(conn, max_year=max_year)
+                carbon = get_carbon_table(conn, max_year=max_year)
+                harvest_carbon = get_harvest_carbon_table(conn, max_year=max_year)
+                compute = get_compute_table(conn, max_year=max_year)
+                calibration = extract_calibration_stats(conn)
+            finally:
+                conn.close()
+        else:
+            summary = carbon = harvest_carbon = compute = calibration = None
         errors = check_fvs_errors(stand_dir)
 
         return {
@@ -221,6 +264,165 @@ def run_single_stand(
         }
 
 
+def _registry_config_fields(config: FVSSimulationConfig) -> tuple:
+    """
+    Snapshot the config columns of a run_registry row.
+
+    Returns the config_name ... min_harvest_volume fields in table column
+    order, with default DBH limits stored as NULL.
+    """
+    return (
+        config.name,
+        config.num_years,
+        config.cycle_length,
+        config.thin_q_factor,
+        config.thin_residual_ba,
+        config.thin_trigger_ba,
+        *config.thin_dbh_limits,
+        config.min_harvest_volume,
+    )
+
+
+def _registry_record(
+    config_fields: tuple,
+    batch_id: str,
+    run_index: int,
+    stand_id: str,
+    output_base: Path,
+    success: bool,
+    errors: list[str] | None,
+    created_at: str,
+) -> RegistryRow:
+    """Build one batch registry row; errors are stored as a JSON list."""
+    return RegistryRow(
+        batch_id,
+        run_index,
+        stand_id,
+        *config_fields,
+        str(output_base / stand_id),
+        1 if success else 0,
+        json.dumps(errors) if errors is not None else None,
+        created_at,
+    )
+
+
+def decode_registry_errors(error_message: str | None) -> list[str]:
+    """
+    Decode the error_message column of a run_registry row.
+
+    New rows store a JSON-encoded list. Registries that predate it may hold,
+    in the same table, rows with the errors joined by "; " (or a single
+    exception message); those are split back into a list.
+
+    Args:
+        error_message: Value of the error_message column
+
+    Returns:
+        List of error strings (empty for successful runs)
+
+    Example:
+        >>> decode_registry_errors('["FVS error 123", "No output"]')
+        ['FVS error 123', 'No output']
+        >>> decode_registry_errors("FVS error 123; No output")
+        ['FVS error 123', 'No output']
+    """
+    if not error_message:
+        return []
+    try:
+        errors = json.loads(error_message)
+    except json.JSONDecodeError:
+        errors = None
+    if isinstance(errors, list):
+        return errors
+    # Legacy "; "-joined text
+    return error_message.split("; ")
+
+
+def _concat_aligned(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate per-stand frames whose column sets may differ.
+
+    Frames are reindexed to the union of columns (first-seen order, the same
+    order pd.concat would produce) before a single concat, so pandas can
+    stack identically-shaped blocks instead of realigning each frame.
+
+    Args:
+        frames: Non-empty list of DataFrames
+
+    Returns:
+        Concatenated DataFrame with a fresh RangeIndex
+    """
+    columns = list(dict.fromkeys(col for df in frames for col in df.columns))
+    aligned = [
+        df if list(df.columns) == columns else df.reindex(columns=columns)
+        for df in frames
+    ]
+    return pd.concat(aligned, ignore_index=True)
+
+
+def _iter_stand_results(
+    jobs: list[tuple],
+    config: FVSSimulationConfig,
+    batch_id: str,
+    output_base: Path,
+    use_database: bool,
+    input_database: Path | None,
+    max_workers: int | None,
+) -> Iterator[tuple[int, dict]]:
+    """
+    Run prepared stand jobs, yielding (run_index, result) as each completes.
+
+    Stand runs are independent (separate directories and FVSOut.db files), so
+    they are dispatched to a process pool. With max_workers=1 or a single job
+    they run inline in this process.
+
+    Args:
+        jobs: List of (run_index, stand_id, stand, stand_trees) tuples
+        config: Simulation configuration shared by all stands
+        batch_id: Batch identifier
+        output_base: Base directory for all outputs
+        use_database: If True, use database input instead of tree files
+        input_database: Path to FVS input database
+        max_workers: Worker processes (None = os.cpu_count())
+
+    Yields:
+        (run_index, result) tuples in completion order
+    """
+    if max_workers == 1 or len(jobs) <= 1:
+        for run_index, stand_id, stand, stand_trees in jobs:
+            yield run_index, run_single_stand(
+                stand,
+                stand_trees,
+                config,
+                output_base,
+                use_database,
+                input_database,
+                batch_id,
+                run_index,
+                stand_id=stand_id,
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(
+                run_single_stand,
+                stand,
+                stand_trees,
+                config,
+                output_base,
+                use_database,
+                input_database,
+                batch_id,
+                run_index,
+                stand_id=stand_id,
+            ): run_index
+            for run_index, stand_id, stand, stand_trees in jobs
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 def run_batch_simulation(
     stands: pd.DataFrame,
     trees: pd.DataFrame,
@@ -259,8 +461,13 @@ def run_batch_simulation(
     else:
         batch_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    results = []
-    run_records = []  # For batch registry
+    # One timestamp and config snapshot for every registry record in this
+    # batch (created_at is the batch start)
+    created_at = datetime.now().isoformat()
+    config_fields = _registry_config_fields(config)
+
+    statuses = {}  # run_index -> run status row
+    records = {}  # run_index -> batch registry record
     all_summaries = []
     all_carbon = []
     all_harvest_carbon = []
@@ -273,61 +480,74 @@ def run_batch_simulation(
     print(f"Output directory: {output_base}")
     print()
 
-    for idx, (_, stand) in enumerate(stands.iterrows()):
-        stand_id = str(stand["STAND_ID"])
-        run_index = idx  # 0-based index within batch
-
-        # Set batch tracking on config
-        config.batch_id = batch_id
-        config.run_index = run_index
-
-        # Get trees for this stand
-        try:
-            stand_trees = get_stand_trees(stand_id, trees)
-        except ValueError as e:
-            print(f"[{run_index + 1}/{len(stands)}] {stand_id}: ERROR - {e}")
-            results.append(
-                {
-                    "stand_id": stand_id,
-                    "success": False,
-                    "error": str(e),
-                }
-            )
+    n_stands = len(stands)
+
+    # Split trees by stand once (instead of masking the full table per
+    # stand), then run FVS. Stand rows are only materialized as Series for
+    # stands that get run.
+    trees_by_stand = dict(tuple(trees.groupby("STAND_ID", sort=False)))
+    jobs = []
+    stand_ids = [str(sid) for sid in stands["STAND_ID"].tolist()]
+    for run_index, stand_id in enumerate(stand_ids):
+        stand_trees = trees_by_stand.get(stand_id)
+        if stand_trees is None:
+            error = f"No trees found for stand: {stand_id}"
+            print(f"[{run_index + 1}/{n_stands}] {stand_id}: ERROR - {error}")
+            statuses[run_index] = {
+                "stand_id": stand_id,
+                "success": False,
+                "error": error,
+            }
             # Add to registry even on failure
-            run_records.append(
-                {
-                    "batch_id": batch_id,
-                    "run_index": run_index,
-                    "stand_id": stand_id,
-                    "config_name": config.name,
-                    "num_years": config.num_years,
-                    "cycle_length": config.cycle_length,
-                    "thin_q_factor": config.thin_q_factor,
-                    "thin_residual_ba": config.thin_residual_ba,
-                    "thin_trigger_ba": config.thin_trigger_ba,
-                    "thin_min_dbh": (
-                        config.thin_min_dbh if config.thin_min_dbh != 0.0 else None
-                    ),
-                    "thin_max_dbh": (
-                        config.thin_max_dbh if config.thin_max_dbh != 999.0 else None
-                    ),
-                    "min_harvest_volume": config.min_harvest_volume,
-                    "output_dir": str(output_base / stand_id),
-                    "success": False,
-                    "error_message": str(e),
-                    "created_at": datetime.now().isoformat(),
-                }
+            records[run_index] = _registry_record(
+                config_fields,
+                batch_id,
+                run_index,
+                stand_id,
+                output_base,
+                False,
+                [error],
+                created_at,
             )
             continue
 
-        # Run simulation
-        result = run_single_stand(
-            stand, stand_trees, config, output_base, use_database, input_database
-        )
+        jobs.append((run_index, stand_id, stands.iloc[run_index], stand_trees))
+
+    # tqdm batches terminal updates; only failures get their own line
+    stand_results = {}
+    progress = tqdm(
+        _iter_stand_results(
+            jobs,
+            config,
+            batch_id,
+            output_base,
+            use_database,
+            input_database,
+            config.max_workers,
+        ),
+        total=len(jobs),
+        desc=f"Batch {batch_id}",
+        unit="stand",
+    )
+    for run_index, result in progress:
+        if not result["success"]:
+            tqdm.write(
+                f"[{run_index + 1}/{n_stands}] {stand_ids[run_index]}: ✗ - "
+                f"{result.get('errors', ['Unknown error'])}"
+            )
+        stand_results[run_index] = result
 
-        if result["success"]:
-            print(f"[{run_index + 1}/{len(stands)}] {stand_id}: ✓", flush=True)
+    # The per-stand tree copies are no longer needed; release them before
+    # the output frames are concatenated to keep peak memory down
+    del jobs, trees_by_stand
 
+    # Collect in stand order so outputs are deterministic, dropping each
+    # result dict once its frames have been handed off
+    for run_index in sorted(stand_results):
+        result = stand_results.pop(run_index)
+        stand_id = stand_ids[run_index]
+
+        if result["success"]:
             # Collect outputs
             if result.get("summary") is not None:
                 all_summaries.append(result["summary"])
@@ -343,66 +563,42 @@ def run_batch_simulation(
 
             if result.get("calibration") is not None:
                 calibration_by_stand[stand_id] = result["calibration"]
-        else:
-            print(
-                f"[{run_index + 1}/{len(stands)}] {stand_id}: ✗ - {result.get('errors', ['Unknown error'])}",
-                flush=True,
-            )
 
-        results.append(
-            {
-                "stand_id": stand_id,
-                "success": result["success"],
-                "errors": result.get("errors", []),
-            }
-        )
+        statuses[run_index] = {
+            "stand_id": stand_id,
+            "success": result["success"],
+            "errors": result.get("errors", []),
+        }
 
         # Add to registry
-        run_records.append(
-            {
-                "batch_id": batch_id,
-                "run_index": run_index,
-                "stand_id": stand_id,
-                "config_name": config.name,
-                "num_years": config.num_years,
-                "cycle_length": config.cycle_length,
-                "thin_q_factor": config.thin_q_factor,
-                "thin_residual_ba": config.thin_residual_ba,
-                "thin_trigger_ba": config.thin_trigger_ba,
-                "thin_min_dbh": (
-                    config.thin_min_dbh if config.thin_min_dbh != 0.0 else None
-                ),
-                "thin_max_dbh": (
-                    config.thin_max_dbh if config.thin_max_dbh != 999.0 else None
-                ),
-                "min_harvest_volume": config.min_harvest_volume,
-                "output_dir": str(output_base / stand_id),
-                "success": result["success"],
-                "error_message": (
-                    "; ".join(result.get("errors", []))
-                    if not result["success"]
-                    else None
-                ),
-                "created_at": datetime.now().isoformat(),
-            }
+        records[run_index] = _registry_record(
+            config_fields,
+            batch_id,
+            run_index,
+            stand_id,
+            output_base,
+            result["success"],
+            result.get("errors", []) if not result["success"] else None,
+            created_at,
         )
 
+    results = [statuses[i] for i in sorted(statuses)]
+    run_records = [records[i] for i in sorted(records)]
+
     # Aggregate results
     aggregated = {}
 
     if all_summaries:
-        aggregated["summary_all"] = pd.concat(all_summaries, ignore_index=True)
+        aggregated["summary_all"] = _concat_aligned(all_summaries)
 
     if all_carbon:
-        aggregated["carbon_all"] = pd.concat(all_carbon, ignore_index=True)
+        aggregated["carbon_all"] = _concat_aligned(all_carbon)
 
     if all_compute:
-        aggregated["compute_all"] = pd.concat(all_compute, ignore_index=True)
+        aggregated["compute_all"] = _concat_aligned(all_compute)
 
     if all_harvest_carbon:
-        aggregated["harvest_carbon_all"] = pd.concat(
-            all_harvest_carbon, ignore_index=True
-        )
+        aggregated["harvest_carbon_all"] = _concat_aligned(all_harvest_carbon)
 
     if calibration_by_stand:
         # Calibration data is now DataFrames, so concatenate them
@@ -411,7 +607,7 @@ def run_batch_simulation(
             if calib_df is not None and isinstance(calib_df, pd.DataFrame):
                 all_calib.append(calib_df)
         if all_calib:
-            aggregated["calibration_stats"] = pd.concat(all_calib, ignore_index=True)
+            aggregated["calibration_stats"] = _concat_aligned(all_calib)
 
     # Run status
     aggregated["run_status"] = pd.DataFrame(results)
@@ -520,6 +716,52 @@ def aggregate_by_period(
     return result
 
 
+def _read_stand_errors(stand_dir: Path) -> pd.DataFrame | None:
+    """
+    Read the FVS_Error table from one stand's FVSOut.db.
+
+    Args:
+        stand_dir: Stand output directory
+
+    Returns:
+        DataFrame of error rows tagged with StandID, or None if the database
+        is missing, has no FVS_Error table, or could not be read
+    """
+    db_path = stand_dir / "FVSOut.db"
+    if not db_path.exists():
+        return None
+
+    stand_id = stand_dir.name
+
+    try:
+        # FVS has finished with this file, so open it immutable: no
+        # locking or WAL recovery on each of the many small databases
+        conn = open_sqlite(db_path, read_only=True, immutable=True)
+        try:
+            # Check if FVS_Error table exists
+            has_errors = conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type='table' AND name='FVS_Error' LIMIT 1"
+            ).fetchone()
+            if not has_errors:
+                return None
+
+            errors_df = pd.read_sql_query("SELECT * FROM FVS_Error", conn)
+        finally:
+            conn.close()
+
+    except Exception as e:
+        # Log but don't fail - we want to collect all errors we can
+        print(f"Warning: Could not read errors from {stand_id}: {e}", flush=True)
+        return None
+
+    if len(errors_df) == 0:
+        return None
+
+    errors_df["StandID"] = stand_id
+    return errors_df
+
+
 def collect_batch_errors(
     output_base: Path,
     stand_ids: list[str] | None = None,
@@ -555,42 +797,25 @@ def collect_batch_errors(
     if stand_ids is not None:
         dirs_to_check = [output_base / sid for sid in stand_ids]
     else:
-        # Scan for directories containing FVSOut.db
-        dirs_to_check = [
-            d
-            for d in output_base.iterdir()
-            if d.is_dir() and (d / "FVSOut.db").exists()
-        ]
-
-    for stand_dir in dirs_to_check:
-        db_path = stand_dir / "FVSOut.db"
-        if not db_path.exists():
-            continue
-
-        stand_id = stand_dir.name
-
-        try:
-            conn = sqlite3.connect(str(db_path))
-
-            # Check if FVS_Error table exists
-            tables = pd.read_sql_query(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='FVS_Error'",
-                conn,
-            )
-
-            if len(tables) > 0:
-                # Table exists - read errors
-                errors_df = pd.read_sql_query("SELECT * FROM FVS_Error", conn)
-                if len(errors_df) > 0:
-                    errors_df["StandID"] = stand_id
+        # Scan for directories containing FVSOut.db (scandir entries cache
+        # their file type, so is_dir() costs no extra stat)
+        with os.scandir(output_base) as entries:
+            dirs_to_check = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "FVSOut.db"))
+            ]
+
+    # Each file read is dominated by open/page-read latency, so fan out
+    # across threads (each worker opens its own connection)
+    if dirs_to_check:
+        max_workers = min(32, len(dirs_to_check))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for errors_df in executor.map(_read_stand_errors, dirs_to_check):
+                if errors_df is not None:
                     all_errors.append(errors_df)
 
-            conn.close()
-
-        except Exception as e:
-            # Log but don't fail - we want to collect all errors we can
-            print(f"Warning: Could not read errors from {stand_id}: {e}", flush=True)
-
     if all_errors:
         result = pd.concat(all_errors, ignore_index=True)
         # Reorder columns to put StandID first
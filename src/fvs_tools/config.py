@@ -28,7 +28,28 @@ DEFAULT_TREE_DATA = Path(
 )
 
 
-@dataclass
+# FVS binary paths already confirmed to exist. Only hits are remembered, so a
+# binary installed mid-session is still picked up.
+_EXISTING_FVS_BINARIES: set[str] = set()
+
+
+def _fvs_binary_exists(path: Path | str) -> bool:
+    """Check that an FVS binary exists, skipping the stat for known paths."""
+    key = str(path)
+    if key in _EXISTING_FVS_BINARIES:
+        return True
+    if Path(key).exists():
+        _EXISTING_FVS_BINARIES.add(key)
+        return True
+    return False
+
+
+# Thinning DBH bounds that mean "no limit"
+DEFAULT_THIN_MIN_DBH = 0.0
+DEFAULT_THIN_MAX_DBH = 999.0
+
+
+@dataclass(slots=True)
 class FVSSimulationConfig:
     """
     Configuration for an FVS simulation run.
@@ -52,6 +73,9 @@ class FVSSimulationConfig:
         thin_max_dbh: Maximum DBH for thinning
         thin_year: Year to apply thinning (None = all years if trigger set)
 
+        # Parallelism
+        max_workers: Stand-level worker processes (None = os.cpu_count())
+
         # Paths
         fvs_binary: Path to FVS executable
     """
@@ -79,8 +103,8 @@ class FVSSimulationConfig:
     thin_q_factor: float | None = None  # THINQ Q-factor
     thin_residual_ba: float | None = None  # THINQ Residual BA
     thin_trigger_ba: float | None = None  # BA threshold to trigger thinning
-    thin_min_dbh: float = 0.0  # Min DBH for thinning
-    thin_max_dbh: float = 999.0  # Max DBH for thinning
+    thin_min_dbh: float = DEFAULT_THIN_MIN_DBH  # Min DBH for thinning
+    thin_max_dbh: float = DEFAULT_THIN_MAX_DBH  # Max DBH for thinning
     thin_year: int | None = None  # Year to apply thinning
 
     # Monte Carlo parameters (Phase 3)
@@ -88,6 +112,10 @@ class FVSSimulationConfig:
     enable_calibration: bool = True  # NoCaLib: when False, disables calibration
     fvs_random_seed: int | None = None  # RanNSeed: FVS internal random seed
 
+    # Parallelism: stand-level worker processes in run_batch_simulation
+    # (None = os.cpu_count(), 1 = run stands sequentially in-process)
+    max_workers: int | None = None
+
     # Paths
     fvs_binary: Path = field(default_factory=lambda: DEFAULT_FVS_BIN)
 
@@ -111,13 +139,21 @@ class FVSSimulationConfig:
             return None
         return self._start_year + self.num_years
 
+    @property
+    def thin_dbh_limits(self) -> tuple[float | None, float | None]:
+        """Thinning (min, max) DBH, with each left at its default reported as None."""
+        return (
+            self.thin_min_dbh if self.thin_min_dbh != DEFAULT_THIN_MIN_DBH else None,
+            self.thin_max_dbh if self.thin_max_dbh != DEFAULT_THIN_MAX_DBH else None,
+        )
+
     def __post_init__(self):
         """Validate configuration."""
         if self.num_years <= 0:
             raise ValueError("num_years must be positive")
         if self.cycle_length <= 0:
             raise ValueError("cycle_length must be positive")
-        if not Path(self.fvs_binary).exists():
+        if not _fvs_binary_exists(self.fvs_binary):
             raise FileNotFoundError(f"FVS binary not found: {self.fvs_binary}")
 
         # Validate Monte Carlo parameters
@@ -134,3 +170,38 @@ class FVSSimulationConfig:
             raise ValueError(
                 f"fvs_random_seed must be in range [1, 99999], got {self.fvs_random_seed}"
             )
+
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+
+
+# Assignment 5 "harv1" treatment: Q-factor thinning baseline shared by the
+# Monte Carlo runner scripts (individual values are varied by MC sampling)
+HARV1_DEFAULTS = {
+    "thin_q_factor": 2.0,
+    "thin_residual_ba": 65.0,
+    "thin_trigger_ba": 100.0,
+    "thin_min_dbh": 2.0,
+    "thin_max_dbh": 24.0,
+    "min_harvest_volume": 4500.0,
+}
+
+
+def build_default_harv1_config(name: str = "harv1", **overrides) -> FVSSimulationConfig:
+    """
+    Build an FVSSimulationConfig with the Assignment 5 harv1 management baseline.
+
+    Args:
+        name: Simulation name
+        **overrides: Any FVSSimulationConfig fields to set or override
+                     (e.g. num_years, output_treelist, thin_q_factor)
+
+    Returns:
+        FVSSimulationConfig with harv1 thinning settings applied
+
+    Example:
+        >>> config = build_default_harv1_config("timing_test", num_years=50)
+        >>> config.thin_q_factor
+        2.0
+    """
+    return FVSSimulationConfig(name=name, **{**HARV1_DEFAULTS, **overrides})
@@ -2,23 +2,218 @@
 Data loading utilities for FVS-ready CSV files.
 """
 
+import contextlib
+import json
+import os
+import pickle
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from pandas.core.groupby import DataFrameGroupBy
 
 from .config import DEFAULT_STAND_DATA, DEFAULT_TREE_DATA
-from .db_input import create_fvs_input_db
+from .db_input import STAND_COLUMN_MAP, TREE_COLUMN_MAP, create_fvs_input_db
 
+# pyarrow is optional. When installed, CSVs are parsed with pandas' pyarrow
+# engine (multi-threaded tokenizer) and cached as Parquet; otherwise the
+# default C parser and a pickle cache are used.
+try:
+    import pyarrow.parquet
 
-def load_stands(filepath: Path | str | None = None) -> pd.DataFrame:
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+# Parquet schema metadata key holding the sidecar's cache key
+CACHE_KEY_METADATA = b"fvs_tools.csv_cache"
+
+# CSV columns the package reads (selection, validation, keyword and FVS input
+# database generation); everything else in the inventory files is skipped
+STAND_USECOLS = frozenset(
+    {"STAND_ID", "VARIANT", "INV_YEAR", "PlotID"}
+    | {col for col, _ in STAND_COLUMN_MAP.values() if col is not None}
+)
+TREE_USECOLS = frozenset(
+    {"STAND_ID", "PLOT_ID", "TREE_ID", "SPECIES", "DIAMETER"}
+    | {col for col, _ in TREE_COLUMN_MAP.values() if col is not None}
+)
+
+
+def _parse_csv(filepath: Path, usecols: frozenset[str]) -> pd.DataFrame:
+    """
+    Parse the used columns of a CSV file with the fastest available engine.
+
+    Columns outside `usecols` are never converted. The C engine memory-maps
+    the file so the parser reads straight from the page cache instead of
+    copying it into its own read buffers first (the pyarrow engine does its
+    own I/O and does not accept memory_map).
+
+    Args:
+        filepath: Path to CSV file
+        usecols: Names of the columns to keep (absent ones are ignored)
+
+    Returns:
+        Parsed DataFrame with NumPy-backed columns, in file column order
+    """
+    header = pd.read_csv(filepath, nrows=0).columns
+    columns = [col for col in header if col in usecols]
+    if CSV_ENGINE == "c":
+        return pd.read_csv(filepath, usecols=columns, memory_map=True)
+    return pd.read_csv(filepath, usecols=columns, engine=CSV_ENGINE)
+
+
+def _csv_cache_key(filepath: Path, usecols: frozenset[str]) -> bytes:
+    """
+    Identify the exact CSV contents and column set a sidecar was parsed from.
+
+    Size and nanosecond mtime must both match: a ">= mtime" test would accept
+    a replacement CSV copied with its older mtime preserved (cp -p, rsync -a,
+    extracted archives). The column set is included so that adding a column
+    to STAND_COLUMN_MAP/TREE_COLUMN_MAP invalidates sidecars that lack it.
+
+    Args:
+        filepath: Path to CSV file
+        usecols: Names of the columns the sidecar holds
+
+    Returns:
+        JSON-encoded key stored with the sidecar
+    """
+    stat = filepath.stat()
+    key = {
+        "csv_size": stat.st_size,
+        "csv_mtime_ns": stat.st_mtime_ns,
+        "usecols": sorted(usecols),
+    }
+    return json.dumps(key).encode()
+
+
+def _load_sidecar(cache_path: Path, key: bytes) -> pd.DataFrame | None:
+    """
+    Load a sidecar if it holds the DataFrame for the given cache key.
+
+    A sidecar that cannot be read (e.g. truncated by an interrupted write) is
+    treated like a stale one, so the CSV is re-parsed and the sidecar
+    rewritten rather than every later load failing.
+
+    Args:
+        cache_path: Path to the Parquet or pickle sidecar
+        key: Cache key from _csv_cache_key()
+
+    Returns:
+        Cached DataFrame, or None if the sidecar is stale or unreadable
+    """
+    try:
+        if HAS_PYARROW:
+            # ArrowInvalid (corrupt Parquet) is a ValueError subclass
+            metadata = pyarrow.parquet.read_schema(cache_path).metadata or {}
+            if metadata.get(CACHE_KEY_METADATA) == key:
+                return pd.read_parquet(cache_path)
+        else:
+            # Sidecars from older versions hold a bare DataFrame: re-parse
+            cached = pd.read_pickle(cache_path)
+            if isinstance(cached, tuple) and cached[0] == key:
+                return cached[1]
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass
+    return None
+
+
+def _read_csv_cached(
+    filepath: Path, usecols: frozenset[str], use_cache: bool = True
+) -> pd.DataFrame:
+    """
+    Read a CSV file, caching the parsed DataFrame in a sidecar file.
+
+    The sidecar is Parquet when pyarrow is available (e.g.
+    FVS_TreeInit.csv.parquet) and a pickle otherwise
+    (FVS_TreeInit.csv.pkl). It records the CSV's size and mtime and the
+    column set, and is reused only while all three still match, so repeat
+    loads skip CSV parsing entirely. If the sidecar cannot be written (e.g. read-only data
+    directory) the CSV is simply re-parsed next time.
+
+    Args:
+        filepath: Path to CSV file
+        usecols: Names of the columns to keep (absent ones are ignored)
+        use_cache: If False, always parse the CSV and never touch the sidecar
+
+    Returns:
+        Parsed DataFrame
+    """
+    if not use_cache:
+        return _parse_csv(filepath, usecols)
+
+    suffix = ".parquet" if HAS_PYARROW else ".pkl"
+    cache_path = filepath.with_name(filepath.name + suffix)
+    key = _csv_cache_key(filepath, usecols)
+    if cache_path.exists():
+        cached = _load_sidecar(cache_path, key)
+        if cached is not None:
+            return cached
+
+    df = _parse_csv(filepath, usecols)
+
+    # Write to a per-process temp file and rename it into place, so an
+    # interrupted write or a concurrent loader never leaves a partial sidecar
+    tmp_path = cache_path.with_suffix(f"{cache_path.suffix}.{os.getpid()}.tmp")
+    try:
+        if HAS_PYARROW:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**table.schema.metadata, CACHE_KEY_METADATA: key}
+            )
+            pyarrow.parquet.write_table(table, tmp_path, compression="zstd")
+        else:
+            pd.to_pickle((key, df), tmp_path)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Unwritable directory, or a mixed-type column Parquet cannot store;
+        # the CSV is simply re-parsed next time
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+    return df
+
+
+def _downcast_int_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store each integer column in the smallest integer dtype that fits it.
+
+    Codes such as SPECIES, CRRATIO, DAMAGE*/SEVERITY* and PLOT_ID fit in
+    int8/int16, so the tree table's transform passes move a fraction of the
+    memory. Only columns that are already integer (i.e. have no blanks) are
+    touched: values are unchanged, and float columns keep their precision and
+    NaN semantics.
+
+    Args:
+        df: Parsed CSV data
+
+    Returns:
+        DataFrame with downcast integer columns
+    """
+    int_cols = df.select_dtypes(include="integer").columns
+    if len(int_cols) == 0:
+        return df
+    return df.assign(
+        **{col: pd.to_numeric(df[col], downcast="integer") for col in int_cols}
+    )
+
+
+def load_stands(
+    filepath: Path | str | None = None, use_cache: bool = True
+) -> pd.DataFrame:
     """
     Load FVS stand initialization data from CSV.
 
     Args:
         filepath: Path to FVS_StandInit CSV file (defaults to Lubrecht 2023 data)
+        use_cache: Reuse the parsed sidecar of the CSV (Parquet with pyarrow,
+                   else pickle) when it is current
 
     Returns:
-        DataFrame with stand-level attributes
+        DataFrame with the stand-level attributes in STAND_USECOLS
     """
     if filepath is None:
         filepath = DEFAULT_STAND_DATA
@@ -27,7 +222,7 @@ def load_stands(filepath: Path | str | None = None) -> pd.DataFrame:
     if not filepath.exists():
         raise FileNotFoundError(f"Stand data file not found: {filepath}")
 
-    df = pd.read_csv(filepath)
+    df = _read_csv_cached(filepath, STAND_USECOLS, use_cache)
 
     # Ensure key columns exist
     required_cols = ["STAND_ID", "VARIANT", "INV_YEAR", "PlotID"]
@@ -38,15 +233,20 @@ def load_stands(filepath: Path | str | None = None) -> pd.DataFrame:
     return df
 
 
-def load_trees(filepath: Path | str | None = None) -> pd.DataFrame:
+def load_trees(
+    filepath: Path | str | None = None, use_cache: bool = True
+) -> pd.DataFrame:
     """
     Load FVS tree initialization data from CSV.
 
     Args:
         filepath: Path to FVS_TreeInit CSV file (defaults to Lubrecht 2023 data)
+        use_cache: Reuse the parsed sidecar of the CSV (Parquet with pyarrow,
+                   else pickle) when it is current
 
     Returns:
-        DataFrame with individual tree records
+        DataFrame with individual tree records (columns in TREE_USECOLS),
+        integer columns downcast to the smallest dtype that fits
     """
     if filepath is None:
         filepath = DEFAULT_TREE_DATA
@@ -55,7 +255,7 @@ def load_trees(filepath: Path | str | None = None) -> pd.DataFrame:
     if not filepath.exists():
         raise FileNotFoundError(f"Tree data file not found: {filepath}")
 
-    df = pd.read_csv(filepath)
+    df = _read_csv_cached(filepath, TREE_USECOLS, use_cache)
 
     # Ensure key columns exist
     required_cols = ["STAND_ID", "PLOT_ID", "TREE_ID", "SPECIES", "DIAMETER"]
@@ -63,7 +263,7 @@ def load_trees(filepath: Path | str | None = None) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Tree data missing required columns: {missing}")
 
-    return df
+    return _downcast_int_columns(df)
 
 
 def filter_by_plot_ids(
@@ -80,36 +280,70 @@ def filter_by_plot_ids(
     Returns:
         Tuple of (filtered_stands, filtered_trees)
     """
-    # Filter stands
-    filtered_stands = stands[stands["PlotID"].isin(plot_ids)].copy()
+    # Filter stands (isin builds one hash table from plot_ids and probes it
+    # in C; no per-row Python comparisons)
+    filtered_stands = stands.loc[stands["PlotID"].isin(plot_ids)].copy()
 
     if len(filtered_stands) == 0:
         raise ValueError(f"No stands found for plot IDs: {plot_ids}")
 
-    # Get corresponding stand IDs
-    stand_ids = filtered_stands["STAND_ID"].tolist()
+    # Get corresponding stand IDs (kept as an array - no Python list round-trip)
+    stand_ids = filtered_stands["STAND_ID"].unique()
 
     # Filter trees to matching stands
-    filtered_trees = trees[trees["STAND_ID"].isin(stand_ids)].copy()
+    filtered_trees = trees.loc[trees["STAND_ID"].isin(stand_ids)].copy()
 
     if len(filtered_trees) == 0:
-        raise ValueError(f"No trees found for stands: {stand_ids}")
+        raise ValueError(f"No trees found for stands: {stand_ids.tolist()}")
 
     return filtered_stands, filtered_trees
 
 
-def get_stand_trees(stand_id: str, trees: pd.DataFrame) -> pd.DataFrame:
+def build_stand_index(trees: pd.DataFrame) -> DataFrameGroupBy:
+    """
+    Group trees by stand once for repeated per-stand lookups.
+
+    Args:
+        trees: Full tree DataFrame
+
+    Returns:
+        Tree groupby keyed on STAND_ID, for passing to get_stand_trees
+
+    Example:
+        >>> stand_index = build_stand_index(trees)
+        >>> for stand_id in stands["STAND_ID"]:
+        ...     stand_trees = get_stand_trees(stand_id, stand_index)
+    """
+    return trees.groupby("STAND_ID", sort=False)
+
+
+def get_stand_trees(
+    stand_id: str, trees: pd.DataFrame | DataFrameGroupBy
+) -> pd.DataFrame:
     """
     Get all trees for a specific stand.
 
+    Passing the groupby from build_stand_index instead of the full tree
+    DataFrame turns each call into a hash lookup rather than a scan of every
+    tree, which matters when looping over many stands.
+
     Args:
         stand_id: Stand identifier (e.g., "CARB_99")
-        trees: Full tree DataFrame
+        trees: Full tree DataFrame, or its build_stand_index() groupby
 
     Returns:
         DataFrame containing only trees from the specified stand
+
+    Raises:
+        ValueError: If the stand has no trees
     """
-    stand_trees = trees[trees["STAND_ID"] == stand_id].copy()
+    if isinstance(trees, DataFrameGroupBy):
+        try:
+            stand_trees = trees.get_group(stand_id).copy()
+        except KeyError:
+            stand_trees = pd.DataFrame()
+    else:
+        stand_trees = trees[trees["STAND_ID"] == stand_id].copy()
 
     if len(stand_trees) == 0:
         raise ValueError(f"No trees found for stand: {stand_id}")
@@ -121,7 +355,7 @@ def prepare_fvs_database(
     stands: pd.DataFrame,
     trees: pd.DataFrame,
     output_db: Path | str,
-) -> None:
+) -> dict:
     """
     Create FVS input database from loaded stand and tree data.
 
@@ -131,8 +365,11 @@ def prepare_fvs_database(
         stands: Stand DataFrame from load_stands()
         trees: Tree DataFrame from load_trees()
         output_db: Path to output database file (e.g., "FVS_Data.db")
+
+    Returns:
+        Stand/tree counts as returned by create_fvs_input_db
     """
-    create_fvs_input_db(stands, trees, output_db)
+    return create_fvs_input_db(stands, trees, output_db)
 
 
 def get_carbon_plot_ids(stands: pd.DataFrame) -> list[int]:
@@ -154,8 +391,12 @@ def get_carbon_plot_ids(stands: pd.DataFrame) -> list[int]:
         >>> print(carbon_plots[:5])
         [2, 3, 4, 5, 7]
     """
-    carbon_stands = stands[stands["STAND_ID"].str.startswith("CARB_")]
-    plot_ids = sorted(carbon_stands["PlotID"].unique().tolist())
+    # np.unique sorts and dedupes in one vectorized call. Under pandas 3
+    # STAND_ID is read as the str dtype, so startswith runs on the native
+    # string kernel (Arrow-backed when pyarrow is installed); na=False keeps
+    # the mask boolean if an ID is blank.
+    is_carbon = stands["STAND_ID"].str.startswith("CARB_", na=False)
+    plot_ids = np.unique(stands.loc[is_carbon, "PlotID"].to_numpy()).tolist()
     return plot_ids
 
 
@@ -193,32 +434,34 @@ def validate_stands(
         >>> for exc in report['excluded_stands'][:3]:
         ...     print(f"  {exc['stand_id']}: {exc['reason']}")
     """
-    # Count trees per stand
-    tree_counts = trees.groupby("STAND_ID").size().to_dict()
-
-    # Check each stand
-    excluded = []
-    valid_stand_ids = []
-
-    for _, stand in stands.iterrows():
-        stand_id = stand["STAND_ID"]
-        plot_id = stand["PlotID"]
-        count = tree_counts.get(stand_id, 0)
-
-        if count < min_trees:
-            excluded.append(
-                {
-                    "stand_id": stand_id,
-                    "plot_id": plot_id,
-                    "tree_count": count,
-                    "reason": f"insufficient trees ({count} < {min_trees})",
-                }
-            )
-        else:
-            valid_stand_ids.append(stand_id)
+    # Count trees per stand (kept as a Series; the dict is only for the report)
+    stand_sizes = trees["STAND_ID"].value_counts(sort=False)
+    tree_counts = stand_sizes.to_dict()
+
+    # Align counts to the stand rows in one reindex, then a single mask
+    counts = stand_sizes.reindex(stands["STAND_ID"].to_numpy(), fill_value=0)
+    counts = counts.to_numpy()
+    is_valid = counts >= min_trees
+
+    invalid = stands.loc[~is_valid]
+    excluded = [
+        {
+            "stand_id": stand_id,
+            "plot_id": plot_id,
+            "tree_count": count,
+            "reason": f"insufficient trees ({count} < {min_trees})",
+        }
+        for stand_id, plot_id, count in zip(
+            invalid["STAND_ID"].tolist(),
+            invalid["PlotID"].tolist(),
+            counts[~is_valid].tolist(),
+            strict=True,
+        )
+    ]
 
     # Filter to valid stands
-    valid_stands = stands[stands["STAND_ID"].isin(valid_stand_ids)].copy()
+    valid_stands = stands.loc[is_valid].copy()
+    valid_stand_ids = valid_stands["STAND_ID"].unique()
     valid_trees = trees[trees["STAND_ID"].isin(valid_stand_ids)].copy()
 
     # Build report
@@ -243,12 +486,131 @@ def print_validation_report(report: dict) -> None:
     valid = report["valid_stands"]
     excluded = report["excluded_stands"]
 
-    print("\nStand Validation Report:")
-    print(f"  Total stands:    {total}")
-    print(f"  Valid stands:    {valid}")
-    print(f"  Excluded stands: {len(excluded)}")
+    lines = [
+        "\nStand Validation Report:",
+        f"  Total stands:    {total}",
+        f"  Valid stands:    {valid}",
+        f"  Excluded stands: {len(excluded)}",
+    ]
 
     if excluded:
-        print("\n  Excluded stands:")
-        for exc in excluded:
-            print(f"    {exc['stand_id']} (plot {exc['plot_id']}): {exc['reason']}")
+        lines.append("\n  Excluded stands:")
+        lines += [
+            f"    {exc['stand_id']} (plot {exc['plot_id']}): {exc['reason']}"
+            for exc in excluded
+        ]
+
+    # One write for the whole report rather than one print per stand
+    print("\n".join(lines))
+
+
+@dataclass
+class LoadResult:
+    """
+    Stand/tree data ready for simulation, as returned by load_and_validate.
+
+    Attributes:
+        stands: Valid stands (filtered by plot and tree count)
+        trees: Trees belonging to the valid stands
+        carbon_plot_ids: Sorted plot IDs of all CARB_* stands in the file
+        report: Validation report (same keys as validate_stands)
+    """
+
+    stands: pd.DataFrame
+    trees: pd.DataFrame
+    carbon_plot_ids: list[int]
+    report: dict
+
+
+def load_and_validate(
+    stand_file: Path | str | None = None,
+    tree_file: Path | str | None = None,
+    plot_ids: list[int] | None = None,
+    carbon_only: bool = True,
+    min_trees: int = 1,
+) -> LoadResult:
+    """
+    Load stand/tree data, select plots, and exclude stands without trees.
+
+    Equivalent to load_stands -> get_carbon_plot_ids -> filter_by_plot_ids
+    -> validate_stands, but builds the plot and tree-count masks once over
+    the stand table instead of making a separate pass per step.
+
+    Args:
+        stand_file: Path to FVS_StandInit CSV (defaults to Lubrecht 2023 data)
+        tree_file: Path to FVS_TreeInit CSV (defaults to Lubrecht 2023 data)
+        plot_ids: Plot IDs to keep. Defaults to all carbon plots, or all
+                  plots if carbon_only is False.
+        carbon_only: When plot_ids is None, keep only carbon (CARB_*) plots
+        min_trees: Minimum number of trees required per stand (default 1)
+
+    Returns:
+        LoadResult with valid stands/trees, carbon plot IDs and report
+
+    Raises:
+        ValueError: If no stands match the requested plots
+
+    Example:
+        >>> data = load_and_validate()
+        >>> print(f"Valid: {data.report['valid_stands']}/{data.report['total_stands']}")
+        Valid: 268/270
+    """
+    stands = load_stands(stand_file)
+    trees = load_trees(tree_file)
+
+    carbon_plot_ids = get_carbon_plot_ids(stands)
+
+    # Plot selection mask
+    if plot_ids is None and carbon_only:
+        plot_ids = carbon_plot_ids
+    if plot_ids is not None:
+        keep = stands["PlotID"].isin(plot_ids)
+    else:
+        keep = pd.Series(True, index=stands.index)
+
+    if not keep.any():
+        raise ValueError(f"No stands found for plot IDs: {plot_ids}")
+
+    # Tree-count mask
+    counts = stands["STAND_ID"].map(trees["STAND_ID"].value_counts())
+    counts = counts.fillna(0).astype(int)
+    valid = keep & (counts >= min_trees)
+
+    # Exclusion report
+    excluded_rows = stands.loc[keep & ~valid]
+    excluded = [
+        {
+            "stand_id": stand_id,
+            "plot_id": plot_id,
+            "tree_count": count,
+            "reason": f"insufficient trees ({count} < {min_trees})",
+        }
+        for stand_id, plot_id, count in zip(
+            excluded_rows["STAND_ID"].tolist(),
+            excluded_rows["PlotID"].tolist(),
+            counts[keep & ~valid].tolist(),
+            strict=True,
+        )
+    ]
+    has_trees = keep & (counts > 0)
+    tree_counts = dict(
+        zip(
+            stands.loc[has_trees, "STAND_ID"].tolist(),
+            counts[has_trees].tolist(),
+            strict=True,
+        )
+    )
+
+    valid_stands = stands.loc[valid].copy()
+    valid_trees = trees.loc[
+        trees["STAND_ID"].isin(valid_stands["STAND_ID"].unique())
+    ].copy()
+
+    report = {
+        "total_stands": int(keep.sum()),
+        "valid_stands": len(valid_stands),
+        "excluded_stands": excluded,
+        "tree_counts": tree_counts,
+    }
+
+    return LoadResult(valid_stands, valid_trees, carbon_plot_ids, report)
@@ -5,16 +5,312 @@ Converts from TREELIST format to DSNin database format for FVS simulation.
 """
 
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from .sqlite_utils import open_sqlite
+
+# Rows converted to Python objects per block when streaming inserts
+INSERT_CHUNK_ROWS = 10_000
+
+# CSV column -> FVS_StandInit column, with the value conversion applied:
+# "int"/"float"/"str" cast non-null values, "int_str" stores an integer code
+# as text, and a None source column is always NULL (not in the CSV).
+# Stand_CN, Stand_ID and Variant are derived separately.
+STAND_COLUMN_MAP = {
+    "Inv_Year": ("INV_YEAR", "int"),
+    "Groups": ("GROUPS", "str"),
+    "AddFiles": ("ADDFILES", "str"),
+    "FVSKeywords": ("FVSKEYWORDS", "str"),
+    "Latitude": ("LATITUDE", "float"),
+    "Longitude": ("LONGITUDE", "float"),
+    "Region": ("REGION", "int"),
+    "Forest": ("FOREST", "int"),
+    "District": ("DISTRICT", "int"),
+    "Compartment": ("COMPARTMENT", "int"),
+    "Location": ("LOCATION", "int"),
+    "Ecoregion": ("ECOREGION", "str"),
+    "PV_Code": ("PV_CODE", "int_str"),
+    "PV_Ref_Code": ("PV_REF_CODE", "str"),
+    "Age": ("AGE", "int"),
+    "Aspect": ("ASPECT", "float"),
+    "Slope": ("SLOPE", "float"),
+    "Elevation": ("ELEVATION", "float"),
+    "ElevFt": ("ELEVFT", "float"),
+    "Basal_Area_Factor": ("BASAL_AREA_FACTOR", "float"),
+    "Inv_Plot_Size": ("INV_PLOT_SIZE", "float"),
+    "Brk_DBH": ("BRK_DBH", "float"),
+    "Num_Plots": ("NUM_PLOTS", "int"),
+    "NonStk_Plots": ("NONSTK_PLOTS", "int"),
+    "Sam_Wt": ("SAM_WT", "float"),
+    "Stk_Pcnt": ("STK_PCNT", "float"),
+    "DG_Trans": ("DG_TRANS", "int"),
+    "DG_Measure": ("DG_MEASURE", "int"),
+    "HTG_Trans": ("HTG_TRANS", "int"),
+    "HTG_Measure": ("HTG_MEASURE", "int"),
+    "Mort_Trans": (None, None),
+    "Mort_Measure": ("MORT_MEASURE", "int"),
+    "BA_Max": ("MAX_BA", "float"),
+    "SDI_Max": ("MAX_SDI", "float"),
+    "Site_Species": ("SITE_SPECIES", "int_str"),
+    "Site_Index": ("SITE_INDEX", "float"),
+    "Model_Type": ("MODEL_TYPE", "int"),
+    "Physio_Region": ("PHYSIO_REGION", "int"),
+    "Forest_Type": ("FOREST_TYPE", "int"),
+    "State": ("STATE", "int"),
+    "County": ("COUNTY", "int"),
+    "Fuel_Model": ("FUEL_MODEL", "str"),
+    "Fuel_0_25_H": ("FUEL_0_25", "float"),
+    "Fuel_25_1_H": ("FUEL_25_1", "float"),
+    "Fuel_1_3_H": ("FUEL_1_3", "float"),
+    "Fuel_3_6_H": ("FUEL_3_6_H", "float"),
+    "Fuel_6_12_H": ("FUEL_6_12_H", "float"),
+    "Fuel_12_20_H": ("FUEL_12_20_H", "float"),
+    "Fuel_20_35_H": ("FUEL_20_35_H", "float"),
+    "Fuel_35_50_H": ("FUEL_35_50_H", "float"),
+    "Fuel_gt_50_H": ("FUEL_GT_50_H", "float"),
+    "Fuel_0_25_S": (None, None),
+    "Fuel_25_1_S": (None, None),
+    "Fuel_1_3_S": (None, None),
+    "Fuel_3_6_S": ("FUEL_3_6_S", "float"),
+    "Fuel_6_12_S": ("FUEL_6_12_S", "float"),
+    "Fuel_12_20_S": ("FUEL_12_20_S", "float"),
+    "Fuel_20_35_S": ("FUEL_20_35_S", "float"),
+    "Fuel_35_50_S": ("FUEL_35_50_S", "float"),
+    "Fuel_gt_50_S": ("FUEL_GT_50_S", "float"),
+    "Fuel_Litter": ("FUEL_LITTER", "float"),
+    "Fuel_Duff": ("FUEL_DUFF", "float"),
+    "Photo_Ref": ("PHOTO_REF", "int"),
+    "Photo_Code": ("PHOTO_CODE", "str"),
+}
+
+# CSV column -> FVS_TreeInit column (same conventions as STAND_COLUMN_MAP).
+# Stand_CN, StandPlot_CN and Tree_CN are derived, Species is required, and
+# Tree_ID / Tree_Count / History / Plot_ID get defaults when null.
+TREE_COLUMN_MAP = {
+    "Tree_ID": ("TREE_ID", "int"),
+    "Tree_Count": ("TREE_COUNT", "float"),
+    "History": ("HISTORY", "int"),
+    "Species": (None, None),
+    "DBH": ("DIAMETER", "float"),
+    "DG": ("DG", "float"),
+    "Ht": ("HT", "float"),
+    "HtTopK": ("HTTOPK", "float"),
+    "HtG": ("HTG", "float"),
+    "CrRatio": ("CRRATIO", "int"),
+    "Damage1": ("DAMAGE1", "int"),
+    "Severity1": ("SEVERITY1", "int"),
+    "Damage2": ("DAMAGE2", "int"),
+    "Severity2": ("SEVERITY2", "int"),
+    "Damage3": ("DAMAGE3", "int"),
+    "Severity3": ("SEVERITY3", "int"),
+    "TreeValue": ("TREEVALUE", "int"),
+    "Prescription": ("PRESCRIPTION", "int"),
+    "Age": ("AGE", "int"),
+    "Plot_ID": ("PLOT_ID", "int"),
+    "Tree_Status": (None, None),
+    "TopoCode": ("TOPOCODE", "int"),
+    "SitePrep": ("SITEPREP", "int"),
+}
+
+
+def _truncate_to_int(values: pd.Series, dtype: str) -> pd.Series:
+    """
+    Cast a column to integers, truncating toward zero like int().
+
+    Columns that already hold integers are cast directly; anything else
+    goes through to_numeric and np.trunc first.
+
+    Args:
+        values: Column to convert
+        dtype: Target dtype ("Int64" keeps nulls, "int64" rejects them)
+
+    Returns:
+        Integer Series
+    """
+    if pd.api.types.is_integer_dtype(values):
+        return values.astype(dtype)
+    return np.trunc(pd.to_numeric(values)).astype(dtype)
+
+
+def _map_columns(df: pd.DataFrame, column_map: dict) -> pd.DataFrame:
+    """
+    Convert CSV columns to FVS input columns in bulk.
+
+    Integer columns are truncated toward zero (like int()) into nullable
+    Int64, floats become nullable Float64, and text columns are str() of the
+    original value; nulls and missing source columns map to NULL.
+
+    Args:
+        df: Stand or tree DataFrame from the CSV loaders
+        column_map: FVS column -> (CSV column, conversion) mapping
+
+    Returns:
+        DataFrame with one column per column_map entry, in map order
+    """
+    all_null = pd.Series(None, index=df.index, dtype=object)
+    out = {}
+    for fvs_col, (csv_col, kind) in column_map.items():
+        if csv_col is None or csv_col not in df.columns:
+            out[fvs_col] = all_null
+            continue
+
+        values = df[csv_col]
+        present = values.notna()
+        if not present.any():
+            # Optional columns are often entirely blank in the CSVs
+            out[fvs_col] = all_null
+            continue
+        if kind == "str":
+            # Only stringify the non-null cells; the rest stay NULL
+            out[fvs_col] = values[present].map(str).reindex(df.index)
+            continue
+
+        if kind == "float":
+            out[fvs_col] = pd.to_numeric(values).astype("Float64")
+            continue
+
+        ints = _truncate_to_int(values, "Int64")
+        if kind == "int":
+            out[fvs_col] = ints
+        else:  # int_str: codes repeat, so format each distinct value once
+            labels = pd.Series(_str_labels(ints), index=df.index, dtype=object)
+            out[fvs_col] = labels.where(present, None)
+
+    return pd.DataFrame(out, index=df.index)
+
+
+def _str_labels(values: pd.Series) -> np.ndarray:
+    """
+    Convert a key column to str() labels, formatting each distinct value once.
+
+    Stand and plot IDs repeat across thousands of tree rows, so only the
+    unique values go through Python's str(); rows are filled by integer
+    take. The fixed-width result feeds np.char.add for building IDs.
+
+    Args:
+        values: Column of stand or plot identifiers (may contain nulls)
+
+    Returns:
+        NumPy unicode array with str(value) for every row
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.array([str(value) for value in uniques], dtype=str)[codes]
+
+
+def _build_stand_frame(stands: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert stand CSV rows to FVS_StandInit rows.
+
+    Args:
+        stands: DataFrame with stand-level attributes from FVS_StandInit CSV
+
+    Returns:
+        DataFrame with the FVS_StandInit columns in schema order
+    """
+    # Whole-column mapping, no per-row loop
+    stand_ids = stands["STAND_ID"].map(str)
+    stand_out = _map_columns(stands, STAND_COLUMN_MAP)
+    stand_out.insert(0, "Stand_CN", stand_ids)  # Use Stand_ID as Stand_CN
+    stand_out.insert(1, "Stand_ID", stand_ids)
+    stand_out.insert(
+        2,
+        "Variant",
+        stands["VARIANT"].map(str) if "VARIANT" in stands.columns else "IE",
+    )
+    return stand_out
+
+
+def _build_tree_frame(trees: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert tree CSV rows to FVS_TreeInit rows.
+
+    Args:
+        trees: DataFrame with tree records from FVS_TreeInit CSV
+
+    Returns:
+        DataFrame with the FVS_TreeInit columns in schema order
+    """
+    n_trees = len(trees)
+    tree_idx = pd.Series(np.arange(1, n_trees + 1), index=trees.index)
+    tree_stand_ids = _str_labels(trees["STAND_ID"])
+    has_plots = "PLOT_ID" in trees.columns
+    plot_labels = _str_labels(trees["PLOT_ID"]) if has_plots else "1"
+
+    tree_out = _map_columns(trees, TREE_COLUMN_MAP)
+    tree_out.insert(0, "Stand_CN", tree_stand_ids)  # Foreign key to FVS_StandInit
+    tree_out.insert(
+        1, "StandPlot_CN", np.char.add(np.char.add(tree_stand_ids, "_P"), plot_labels)
+    )
+    # Create unique tree identifiers
+    tree_out.insert(
+        2,
+        "Tree_CN",
+        np.char.add(np.char.add(tree_stand_ids, "_T"), tree_idx.to_numpy().astype(str)),
+    )
+    tree_out["Tree_ID"] = tree_out["Tree_ID"].fillna(tree_idx)
+    tree_out["Tree_Count"] = tree_out["Tree_Count"].fillna(1.0)
+    tree_out["History"] = tree_out["History"].fillna(1)
+    tree_out["Plot_ID"] = tree_out["Plot_ID"].fillna(1)
+    # Species is required: 3-digit code stored as text
+    tree_out["Species"] = _str_labels(_truncate_to_int(trees["SPECIES"], "int64"))
+    return tree_out
+
+
+def _iter_rows(df: pd.DataFrame, chunk_rows: int = INSERT_CHUNK_ROWS) -> Iterator:
+    """
+    Yield DataFrame rows as tuples of Python values, one block at a time.
+
+    Each block's columns are converted to Python objects once and the rows
+    are zipped from those arrays, which is cheaper than converting the frame
+    row by row. Only one block of converted values is alive at a time.
+
+    Args:
+        df: Rows to convert
+        chunk_rows: Rows converted per block
+
+    Yields:
+        One tuple per row, with missing values as None
+    """
+    for start in range(0, len(df), chunk_rows):
+        block = df.iloc[start : start + chunk_rows]
+        values = [
+            block[col].to_numpy(dtype=object, na_value=None) for col in block.columns
+        ]
+        yield from zip(*values, strict=True)
+
+
+def _insert_frame(cursor: sqlite3.Cursor, table: str, df: pd.DataFrame) -> None:
+    """
+    Insert every row of a DataFrame with a single executemany call.
+
+    Columns are bound by name in DataFrame order; missing values become NULL.
+    Rows are streamed from _iter_rows, so no full row list is materialized.
+    executemany prepares the statement once, and because every value is an
+    exact int/float/str/None the sqlite3 module binds it through its typed
+    fast path without consulting the adapter registry.
+
+    Args:
+        cursor: Cursor on the target database
+        table: Destination table name
+        df: Rows to insert, columns named as in the table
+    """
+    columns = ", ".join(df.columns)
+    placeholders = ", ".join("?" * len(df.columns))
+    cursor.executemany(
+        f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+        _iter_rows(df),
+    )
+
 
 def create_fvs_input_db(
     stands: pd.DataFrame,
     trees: pd.DataFrame,
     output_db: Path | str,
-) -> None:
+) -> dict:
     """
     Create FVS_Data.db with FVS_StandInit and FVS_TreeInit tables.
 
@@ -23,6 +319,15 @@ def create_fvs_input_db(
         trees: DataFrame with tree records from FVS_TreeInit CSV
         output_db: Path to output database file
 
+    Returns:
+        Summary of what was written, in the same shape as
+        verify_fvs_input_db() (computed from the inserted frames, so no
+        read-back of the database is needed):
+            - stand_count: Number of stands
+            - tree_count: Number of trees
+            - stand_ids: List of stand IDs
+            - trees_by_stand: Dictionary of tree counts by stand
+
     Note:
         Stand_CN is used as the primary key and foreign key, matching Stand_ID.
         This allows FVS to reference stands using the StandCN keyword.
@@ -33,7 +338,11 @@ def create_fvs_input_db(
     if output_db.exists():
         output_db.unlink()
 
-    conn = sqlite3.connect(output_db)
+    stand_out = _build_stand_frame(stands)
+    tree_out = _build_tree_frame(trees)
+
+    # Scratch PRAGMAs: no fsync or on-disk journal while loading
+    conn = open_sqlite(output_db, scratch=True)
     cursor = conn.cursor()
 
     # Create FVS_StandInit table with exact FVS schema
@@ -144,336 +453,41 @@ def create_fvs_input_db(
     """
     cursor.execute(tree_schema)
 
-    # Transform and insert stand data
-    stand_records = []
-    for _, stand in stands.iterrows():
-        stand_id = str(stand["STAND_ID"])
-
-        # Map CSV columns to FVS_StandInit schema
-        record = {
-            "Stand_CN": stand_id,  # Use Stand_ID as Stand_CN
-            "Stand_ID": stand_id,
-            "Variant": str(stand.get("VARIANT", "IE")),
-            "Inv_Year": (
-                int(stand["INV_YEAR"]) if pd.notna(stand.get("INV_YEAR")) else None
-            ),
-            "Groups": (
-                str(stand.get("GROUPS", "")) if pd.notna(stand.get("GROUPS")) else None
-            ),
-            "AddFiles": (
-                str(stand.get("ADDFILES", ""))
-                if pd.notna(stand.get("ADDFILES"))
-                else None
-            ),
-            "FVSKeywords": (
-                str(stand.get("FVSKEYWORDS", ""))
-                if pd.notna(stand.get("FVSKEYWORDS"))
-                else None
-            ),
-            "Latitude": (
-                float(stand["LATITUDE"]) if pd.notna(stand.get("LATITUDE")) else None
-            ),
-            "Longitude": (
-                float(stand["LONGITUDE"]) if pd.notna(stand.get("LONGITUDE")) else None
-            ),
-            "Region": int(stand["REGION"]) if pd.notna(stand.get("REGION")) else None,
-            "Forest": int(stand["FOREST"]) if pd.notna(stand.get("FOREST")) else None,
-            "District": (
-                int(stand["DISTRICT"]) if pd.notna(stand.get("DISTRICT")) else None
-            ),
-            "Compartment": (
-                int(stand["COMPARTMENT"])
-                if pd.notna(stand.get("COMPARTMENT"))
-                else None
-            ),
-            "Location": (
-                int(stand["LOCATION"]) if pd.notna(stand.get("LOCATION")) else None
-            ),
-            "Ecoregion": (
-                str(stand.get("ECOREGION", ""))
-                if pd.notna(stand.get("ECOREGION"))
-                else None
-            ),
-            "PV_Code": (
-                str(int(stand["PV_CODE"])) if pd.notna(stand.get("PV_CODE")) else None
-            ),
-            "PV_Ref_Code": (
-                str(stand.get("PV_REF_CODE", ""))
-                if pd.notna(stand.get("PV_REF_CODE"))
-                else None
-            ),
-            "Age": int(stand["AGE"]) if pd.notna(stand.get("AGE")) else None,
-            "Aspect": float(stand["ASPECT"]) if pd.notna(stand.get("ASPECT")) else None,
-            "Slope": float(stand["SLOPE"]) if pd.notna(stand.get("SLOPE")) else None,
-            "Elevation": (
-                float(stand["ELEVATION"]) if pd.notna(stand.get("ELEVATION")) else None
-            ),
-            "ElevFt": float(stand["ELEVFT"]) if pd.notna(stand.get("ELEVFT")) else None,
-            "Basal_Area_Factor": (
-                float(stand["BASAL_AREA_FACTOR"])
-                if pd.notna(stand.get("BASAL_AREA_FACTOR"))
-                else None
-            ),
-            "Inv_Plot_Size": (
-                float(stand["INV_PLOT_SIZE"])
-                if pd.notna(stand.get("INV_PLOT_SIZE"))
-                else None
-            ),
-            "Brk_DBH": (
-                float(stand["BRK_DBH"]) if pd.notna(stand.get("BRK_DBH")) else None
-            ),
-            "Num_Plots": (
-                int(stand["NUM_PLOTS"]) if pd.notna(stand.get("NUM_PLOTS")) else None
-            ),
-            "NonStk_Plots": (
-                int(stand["NONSTK_PLOTS"])
-                if pd.notna(stand.get("NONSTK_PLOTS"))
-                else None
-            ),
-            "Sam_Wt": float(stand["SAM_WT"]) if pd.notna(stand.get("SAM_WT")) else None,
-            "Stk_Pcnt": (
-                float(stand["STK_PCNT"]) if pd.notna(stand.get("STK_PCNT")) else None
-            ),
-            "DG_Trans": (
-                int(stand["DG_TRANS"]) if pd.notna(stand.get("DG_TRANS")) else None
-            ),
-            "DG_Measure": (
-                int(stand["DG_MEASURE"]) if pd.notna(stand.get("DG_MEASURE")) else None
-            ),
-            "HTG_Trans": (
-                int(stand["HTG_TRANS"]) if pd.notna(stand.get("HTG_TRANS")) else None
-            ),
-            "HTG_Measure": (
-                int(stand["HTG_MEASURE"])
-                if pd.notna(stand.get("HTG_MEASURE"))
-                else None
-            ),
-            "Mort_Trans": None,  # Not in CSV
-            "Mort_Measure": (
-                int(stand["MORT_MEASURE"])
-                if pd.notna(stand.get("MORT_MEASURE"))
-                else None
-            ),
-            "BA_Max": float(stand["MAX_BA"]) if pd.notna(stand.get("MAX_BA")) else None,
-            "SDI_Max": (
-                float(stand["MAX_SDI"]) if pd.notna(stand.get("MAX_SDI")) else None
-            ),
-            "Site_Species": (
-                str(int(stand["SITE_SPECIES"]))
-                if pd.notna(stand.get("SITE_SPECIES"))
-                else None
-            ),
-            "Site_Index": (
-                float(stand["SITE_INDEX"])
-                if pd.notna(stand.get("SITE_INDEX"))
-                else None
-            ),
-            "Model_Type": (
-                int(stand["MODEL_TYPE"]) if pd.notna(stand.get("MODEL_TYPE")) else None
-            ),
-            "Physio_Region": (
-                int(stand["PHYSIO_REGION"])
-                if pd.notna(stand.get("PHYSIO_REGION"))
-                else None
-            ),
-            "Forest_Type": (
-                int(stand["FOREST_TYPE"])
-                if pd.notna(stand.get("FOREST_TYPE"))
-                else None
-            ),
-            "State": int(stand["STATE"]) if pd.notna(stand.get("STATE")) else None,
-            "County": int(stand["COUNTY"]) if pd.notna(stand.get("COUNTY")) else None,
-            "Fuel_Model": (
-                str(stand.get("FUEL_MODEL", ""))
-                if pd.notna(stand.get("FUEL_MODEL"))
-                else None
-            ),
-            "Fuel_0_25_H": (
-                float(stand["FUEL_0_25"]) if pd.notna(stand.get("FUEL_0_25")) else None
-            ),
-            "Fuel_25_1_H": (
-                float(stand["FUEL_25_1"]) if pd.notna(stand.get("FUEL_25_1")) else None
-            ),
-            "Fuel_1_3_H": (
-                float(stand["FUEL_1_3"]) if pd.notna(stand.get("FUEL_1_3")) else None
-            ),
-            "Fuel_3_6_H": (
-                float(stand["FUEL_3_6_H"])
-                if pd.notna(stand.get("FUEL_3_6_H"))
-                else None
-            ),
-            "Fuel_6_12_H": (
-                float(stand["FUEL_6_12_H"])
-                if pd.notna(stand.get("FUEL_6_12_H"))
-                else None
-            ),
-            "Fuel_12_20_H": (
-                float(stand["FUEL_12_20_H"])
-                if pd.notna(stand.get("FUEL_12_20_H"))
-                else None
-            ),
-            "Fuel_20_35_H": (
-                float(stand["FUEL_20_35_H"])
-                if pd.notna(stand.get("FUEL_20_35_H"))
-                else None
-            ),
-            "Fuel_35_50_H": (
-                float(stand["FUEL_35_50_H"])
-                if pd.notna(stand.get("FUEL_35_50_H"))
-                else None
-            ),
-            "Fuel_gt_50_H": (
-                float(stand["FUEL_GT_50_H"])
-                if pd.notna(stand.get("FUEL_GT_50_H"))
-                else None
-            ),
-            "Fuel_0_25_S": None,  # Not in CSV
-            "Fuel_25_1_S": None,  # Not in CSV
-            "Fuel_1_3_S": None,  # Not in CSV
-            "Fuel_3_6_S": (
-                float(stand["FUEL_3_6_S"])
-                if pd.notna(stand.get("FUEL_3_6_S"))
-                else None
-            ),
-            "Fuel_6_12_S": (
-                float(stand["FUEL_6_12_S"])
-                if pd.notna(stand.get("FUEL_6_12_S"))
-                else None
-            ),
-            "Fuel_12_20_S": (
-                float(stand["FUEL_12_20_S"])
-                if pd.notna(stand.get("FUEL_12_20_S"))
-                else None
-            ),
-            "Fuel_20_35_S": (
-                float(stand["FUEL_20_35_S"])
-                if pd.notna(stand.get("FUEL_20_35_S"))
-                else None
-            ),
-            "Fuel_35_50_S": (
-                float(stand["FUEL_35_50_S"])
-                if pd.notna(stand.get("FUEL_35_50_S"))
-                else None
-            ),
-            "Fuel_gt_50_S": (
-                float(stand["FUEL_GT_50_S"])
-                if pd.notna(stand.get("FUEL_GT_50_S"))
-                else None
-            ),
-            "Fuel_Litter": (
-                float(stand["FUEL_LITTER"])
-                if pd.notna(stand.get("FUEL_LITTER"))
-                else None
-            ),
-            "Fuel_Duff": (
-                float(stand["FUEL_DUFF"]) if pd.notna(stand.get("FUEL_DUFF")) else None
-            ),
-            "Photo_Ref": (
-                int(stand["PHOTO_REF"]) if pd.notna(stand.get("PHOTO_REF")) else None
-            ),
-            "Photo_Code": (
-                str(stand.get("PHOTO_CODE", ""))
-                if pd.notna(stand.get("PHOTO_CODE"))
-                else None
-            ),
-        }
-
-        stand_records.append(record)
-
-    # Insert stand records
-    if stand_records:
-        columns = list(stand_records[0].keys())
-        placeholders = ",".join(["?" for _ in columns])
-        sql = f"INSERT INTO FVS_StandInit ({','.join(columns)}) VALUES ({placeholders})"
-
-        for record in stand_records:
-            cursor.execute(sql, [record[col] for col in columns])
-
-    # Transform and insert tree data
-    tree_records = []
-    for idx, (_, tree) in enumerate(trees.iterrows(), start=1):
-        stand_id = str(tree["STAND_ID"])
-
-        # Create unique tree identifier
-        tree_cn = f"{stand_id}_T{idx}"
-
-        # Map CSV columns to FVS_TreeInit schema
-        record = {
-            "Stand_CN": stand_id,  # Foreign key to FVS_StandInit
-            "StandPlot_CN": f"{stand_id}_P{tree.get('PLOT_ID', 1)}",
-            "Tree_CN": tree_cn,
-            "Tree_ID": (
-                int(tree.get("TREE_ID", idx)) if pd.notna(tree.get("TREE_ID")) else idx
-            ),
-            "Tree_Count": (
-                float(tree["TREE_COUNT"]) if pd.notna(tree.get("TREE_COUNT")) else 1.0
-            ),
-            "History": (
-                int(tree.get("HISTORY", 1)) if pd.notna(tree.get("HISTORY")) else 1
-            ),
-            "Species": str(int(tree["SPECIES"])),  # Convert to string (3-digit code)
-            "DBH": float(tree["DIAMETER"]) if pd.notna(tree.get("DIAMETER")) else None,
-            "DG": float(tree["DG"]) if pd.notna(tree.get("DG")) else None,
-            "Ht": float(tree["HT"]) if pd.notna(tree.get("HT")) else None,
-            "HtTopK": float(tree["HTTOPK"]) if pd.notna(tree.get("HTTOPK")) else None,
-            "HtG": float(tree["HTG"]) if pd.notna(tree.get("HTG")) else None,
-            "CrRatio": int(tree["CRRATIO"]) if pd.notna(tree.get("CRRATIO")) else None,
-            "Damage1": int(tree["DAMAGE1"]) if pd.notna(tree.get("DAMAGE1")) else None,
-            "Severity1": (
-                int(tree["SEVERITY1"]) if pd.notna(tree.get("SEVERITY1")) else None
-            ),
-            "Damage2": int(tree["DAMAGE2"]) if pd.notna(tree.get("DAMAGE2")) else None,
-            "Severity2": (
-                int(tree["SEVERITY2"]) if pd.notna(tree.get("SEVERITY2")) else None
-            ),
-            "Damage3": int(tree["DAMAGE3"]) if pd.notna(tree.get("DAMAGE3")) else None,
-            "Severity3": (
-                int(tree["SEVERITY3"]) if pd.notna(tree.get("SEVERITY3")) else None
-            ),
-            "TreeValue": (
-                int(tree["TREEVALUE"]) if pd.notna(tree.get("TREEVALUE")) else None
-            ),
-            "Prescription": (
-                int(tree["PRESCRIPTION"])
-                if pd.notna(tree.get("PRESCRIPTION"))
-                else None
-            ),
-            "Age": int(tree["AGE"]) if pd.notna(tree.get("AGE")) else None,
-            "Plot_ID": (
-                int(tree.get("PLOT_ID", 1)) if pd.notna(tree.get("PLOT_ID")) else 1
-            ),
-            "Tree_Status": None,  # Not in CSV
-            "TopoCode": (
-                int(tree["TOPOCODE"]) if pd.notna(tree.get("TOPOCODE")) else None
-            ),
-            "SitePrep": (
-                int(tree["SITEPREP"]) if pd.notna(tree.get("SITEPREP")) else None
-            ),
-        }
-
-        tree_records.append(record)
-
-    # Insert tree records
-    if tree_records:
-        columns = list(tree_records[0].keys())
-        placeholders = ",".join(["?" for _ in columns])
-        sql = f"INSERT INTO FVS_TreeInit ({','.join(columns)}) VALUES ({placeholders})"
-
-        for record in tree_records:
-            cursor.execute(sql, [record[col] for col in columns])
-
-    conn.commit()
+    # Insert both tables in one transaction; the file is rebuilt from scratch
+    # on every call, so a failed load is simply removed.
+    try:
+        with conn:
+            _insert_frame(cursor, "FVS_StandInit", stand_out)
+            _insert_frame(cursor, "FVS_TreeInit", tree_out)
+            # FVS reads each stand's trees by Stand_CN; indexing after the
+            # load builds the B-tree in one sorted pass
+            cursor.execute("CREATE INDEX idx_tree_stand_cn ON FVS_TreeInit (Stand_CN)")
+    except sqlite3.Error:
+        conn.close()
+        output_db.unlink()
+        raise
     conn.close()
 
     print(f"Created FVS input database: {output_db}")
-    print(f"  - {len(stand_records)} stands in FVS_StandInit")
-    print(f"  - {len(tree_records)} trees in FVS_TreeInit")
+    print(f"  - {len(stand_out)} stands in FVS_StandInit")
+    print(f"  - {len(tree_out)} trees in FVS_TreeInit")
+
+    trees_by_stand = tree_out["Stand_CN"].value_counts(sort=False).sort_index()
+    return {
+        "stand_count": len(stand_out),
+        "tree_count": len(tree_out),
+        "stand_ids": stand_out["Stand_ID"].tolist(),
+        "trees_by_stand": trees_by_stand.to_dict(),
+    }
 
 
 def verify_fvs_input_db(db_path: Path | str) -> dict:
     """
     Verify FVS input database contents.
 
+    Reads the counts back from the database file. For a database just built
+    by create_fvs_input_db, use its return value instead.
+
     Args:
         db_path: Path to FVS_Data.db
 
@@ -13,6 +13,7 @@ DESIGN, and GROWTH override or interfere with this data-driven calibration.
 See docs/fvs_keyword_discovery.md for detailed analysis.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -20,6 +21,23 @@ import pandas as pd
 from .config import FVSSimulationConfig
 
 
+def _stand_values(stand: pd.Series) -> dict:
+    """
+    Convert a stand row to a dict keyed by upper-cased column name.
+
+    Keys are normalized to handle DB vs CSV input differences. The builders
+    then index a plain dict instead of going through pandas label lookup for
+    every attribute.
+
+    Args:
+        stand: Series containing stand-level attributes
+
+    Returns:
+        Dict of attribute values (missing values stay NaN/None)
+    """
+    return dict(zip(stand.index.str.upper(), stand.tolist(), strict=True))
+
+
 def build_keyword_file(
     stand: pd.Series,
     tree_filename: str,
@@ -44,8 +62,7 @@ def build_keyword_file(
     filepath = Path(filepath)
 
     # Normalize stand keys to uppercase to handle DB vs CSV input differences
-    stand = stand.copy()
-    stand.index = stand.index.str.upper()
+    stand = _stand_values(stand)
 
     # Extract stand attributes
     stand_id = str(stand["STAND_ID"])
@@ -58,104 +75,112 @@ def build_keyword_file(
         # === WEB GUI MINIMAL STYLE (for database input) ===
         # This matches the FVS Web GUI structure which produces correct calibration
 
-        # Stand identification (Web GUI format: 26-char stand ID field)
-        keywords.append("StdIdent")
-        keywords.append(f"{stand_id:26s}{config.name}")
-
-        # StandCN - required for multi-stand runs
-        keywords.append("StandCN")
-        keywords.append(stand_id)
-
-        # Management ID (optional, matches Web GUI)
-        keywords.append("MgmtId")
-        keywords.append("A002")
-
-        # Inventory year
-        keywords.append(f"InvYear       {inv_year}")
-
-        # Time interval and number of cycles
-        # Use internal_num_cycles (+1) to ensure carbon/compute output for final year
-        keywords.append(f"TimeInt                 {config.cycle_length} ")
-        keywords.append(f"NumCycle     {config.internal_num_cycles} ")
-        keywords.append("")
-
-        # Database output block
-        keywords.append("DataBase")
-        keywords.append("DSNOut")
-        keywords.append("FVSOut.db")
-
-        # Summary with append mode (2 = append to existing table)
-        keywords.append("Summary        2")
+        # One extend per keyword block rather than one append per line
+        keywords.extend(
+            [
+                # Stand identification (Web GUI format: 26-char stand ID field)
+                "StdIdent",
+                f"{stand_id:26s}{config.name}",
+                # StandCN - required for multi-stand runs
+                "StandCN",
+                stand_id,
+                # Management ID (optional, matches Web GUI)
+                "MgmtId",
+                "A002",
+                # Inventory year
+                f"InvYear       {inv_year}",
+                # Time interval and number of cycles
+                # Use internal_num_cycles (+1) to ensure carbon/compute output
+                # for final year
+                f"TimeInt                 {config.cycle_length} ",
+                f"NumCycle     {config.internal_num_cycles} ",
+                "",
+                # Database output block
+                "DataBase",
+                "DSNOut",
+                "FVSOut.db",
+                # Summary with append mode (2 = append to existing table)
+                "Summary        2",
+            ]
+        )
 
         # Compute variables output
         if config.compute_canopy_cover:
             keywords.append("Computdb          0         1")
 
-        keywords.append("End")
-        keywords.append("")
-
-        # Tree Lists and Cut Lists output (Web GUI style)
-        keywords.append("Treelist       0                   0")
-        keywords.append("Cutlist        0                   0")
-        keywords.append("Atrtlist       0                   0")
-        keywords.append("Database")
-        keywords.append("TreeLiDB       2")
-        keywords.append("CutLiDB        2")
-        keywords.append("Atrtlidb       2")
-        keywords.append("End")
-        keywords.append("")
+        keywords.extend(
+            [
+                "End",
+                "",
+                # Tree Lists and Cut Lists output (Web GUI style)
+                "Treelist       0                   0",
+                "Cutlist        0                   0",
+                "Atrtlist       0                   0",
+                "Database",
+                "TreeLiDB       2",
+                "CutLiDB        2",
+                "Atrtlidb       2",
+                "End",
+                "",
+            ]
+        )
 
         # Carbon and Fuels output (Web GUI style)
         if config.output_carbon:
-            keywords.append("FMIn")
-            keywords.append("CarbRept        2")
-            keywords.append("CarbCut")
-            keywords.append("CarbCalc")
-            keywords.append("FuelOut         0")
-            keywords.append("FuelRept")
-            keywords.append("End")
-            keywords.append("Database")
-            keywords.append("CarbReDB        2")
-            keywords.append("FuelReDB        2")
-            keywords.append("FuelsOut        2")
-            keywords.append("End")
-            keywords.append("")
-
-        # Calibration Statistics output
-        keywords.append("Database")
-        keywords.append("CalbStDB")
-        keywords.append("End")
-        keywords.append("")
-
-        # Inventory Statistics output
-        keywords.append("Stats")
-        keywords.append("Database")
-        keywords.append("InvStats")
-        keywords.append("End")
-        keywords.append("")
-
-        # Delete old output tables (Web GUI style)
-        keywords.append("DelOTab            1")
-        keywords.append("DelOTab            2")
-        keywords.append("DelOTab            4")
-        keywords.append("")
+            keywords.extend(
+                [
+                    "FMIn",
+                    "CarbRept        2",
+                    "CarbCut",
+                    "CarbCalc",
+                    "FuelOut         0",
+                    "FuelRept",
+                    "End",
+                    "Database",
+                    "CarbReDB        2",
+                    "FuelReDB        2",
+                    "FuelsOut        2",
+                    "End",
+                    "",
+                ]
+            )
 
-        # Database input using DSNin with %StandID% placeholder
-        # FVS replaces %StandID% at runtime with the current stand ID
-        # Note: FVS_StandInit uses Stand_ID, FVS_TreeInit uses Stand_CN
-        keywords.append("Database")
-        keywords.append("DSNIn")
-        keywords.append(tree_filename)  # Database filename (e.g., FVS_Data.db)
-        keywords.append("StandSQL")
-        keywords.append("SELECT * FROM FVS_StandInit")
-        keywords.append("WHERE Stand_ID= '%StandID%'")
-        keywords.append("EndSQL")
-        keywords.append("TreeSQL")
-        keywords.append("SELECT * FROM FVS_TreeInit")
-        keywords.append("WHERE Stand_CN= '%StandID%'")
-        keywords.append("EndSQL")
-        keywords.append("END")
-        keywords.append("")
+        keywords.extend(
+            [
+                # Calibration Statistics output
+                "Database",
+                "CalbStDB",
+                "End",
+                "",
+                # Inventory Statistics output
+                "Stats",
+                "Database",
+                "InvStats",
+                "End",
+                "",
+                # Delete old output tables (Web GUI style)
+                "DelOTab            1",
+                "DelOTab            2",
+                "DelOTab            4",
+                "",
+                # Database input using DSNin with %StandID% placeholder
+                # FVS replaces %StandID% at runtime with the current stand ID
+                # Note: FVS_StandInit uses Stand_ID, FVS_TreeInit uses Stand_CN
+                "Database",
+                "DSNIn",
+                tree_filename,  # Database filename (e.g., FVS_Data.db)
+                "StandSQL",
+                "SELECT * FROM FVS_StandInit",
+                "WHERE Stand_ID= '%StandID%'",
+                "EndSQL",
+                "TreeSQL",
+                "SELECT * FROM FVS_TreeInit",
+                "WHERE Stand_CN= '%StandID%'",
+                "EndSQL",
+                "END",
+                "",
+            ]
+        )
 
         # Monte Carlo Keywords (Phase 3)
         # RanNSeed: Set FVS random seed for reproducibility
@@ -181,12 +206,16 @@ def build_keyword_file(
 
         # Compute canopy cover
         if config.compute_canopy_cover:
-            keywords.append("Compute            0")
-            # SPMCDBH(7, All, pt, minDBH, maxDBH, minHT, maxHT, flag)
-            # Attribute 7 = Percent Canopy Cover
-            keywords.append("Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)")
-            keywords.append("End")
-            keywords.append("")
+            keywords.extend(
+                [
+                    "Compute            0",
+                    # SPMCDBH(7, All, pt, minDBH, maxDBH, minHT, maxHT, flag)
+                    # Attribute 7 = Percent Canopy Cover
+                    "Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)",
+                    "End",
+                    "",
+                ]
+            )
 
         # Conditional Q-factor thinning with MINHARV (Web GUI style)
         if config.thin_q_factor is not None and config.thin_residual_ba is not None:
@@ -204,42 +233,19 @@ def build_keyword_file(
                 )
                 keywords.append("")
 
-            # IF-THEN block for conditional thinning
-            if config.thin_trigger_ba is not None:
-                keywords.append("!Exten:base Title:Specified Basal Area is exceeded")
-                keywords.append(f"If                {cycle}")
-                keywords.append(f"bba gt    {int(config.thin_trigger_ba)}")
-                keywords.append("Then")
-
-            # ThinQFA with Parms() syntax (Web GUI style)
-            # Use cycle 0 inside IF block to apply whenever condition is met
-            thin_cycle = 0
-            min_dbh = int(config.thin_min_dbh)
-            max_dbh = int(config.thin_max_dbh)
-            q_factor = int(config.thin_q_factor)
-            class_width = 2  # 2" DBH classes per assignment
-            residual = int(config.thin_residual_ba)
-
-            keywords.append("!Exten:base Title:Thin to a Q-factor")
-            keywords.append(
-                "* Arguments: SmDBH, LgDBH, Species, Q-Factor, D-class, ResDensity, DensityUnits"
-            )
-            keywords.append(
-                f"ThinQFA           {thin_cycle}     Parms({min_dbh},{max_dbh},All,{q_factor},{class_width},{residual},0)"
-            )
-
-            # ThinDBH to remove trees above max_dbh (Web GUI includes this)
-            keywords.append("* Arguments: SmDBH, LgDBH, CutEff, Species, ResTPA, ResBA")
-            keywords.append(
-                f"ThinDBH           {thin_cycle}     Parms({max_dbh},999,1,All,0,0)"
+            # Conditional thinning block (depends only on the thinning settings)
+            trigger_ba = config.thin_trigger_ba
+            keywords.extend(
+                _thinning_keywords(
+                    cycle,
+                    None if trigger_ba is None else int(trigger_ba),
+                    int(config.thin_min_dbh),
+                    int(config.thin_max_dbh),
+                    int(config.thin_q_factor),
+                    int(config.thin_residual_ba),
+                )
             )
 
-            # Close IF block
-            if config.thin_trigger_ba is not None:
-                keywords.append("EndIf")
-
-            keywords.append("")
-
         # Standalone MINHARV (only if no thinning configured)
         elif config.min_harvest_volume is not None:
             keywords.append(
@@ -250,15 +256,18 @@ def build_keyword_file(
             )
             keywords.append("")
 
-        # Stand/group labels (for reporting)
-        keywords.append("SPLabel")
-        keywords.append("  All_Stands, & ")
-        keywords.append("  Section6")
-
-        # Process and stop
-        keywords.append("Process")
-        keywords.append("STOP")
-        keywords.append("")
+        keywords.extend(
+            [
+                # Stand/group labels (for reporting)
+                "SPLabel",
+                "  All_Stands, & ",
+                "  Section6",
+                # Process and stop
+                "Process",
+                "STOP",
+                "",
+            ]
+        )
 
     else:
         # === LEGACY FILE-BASED INPUT ===
@@ -370,6 +379,69 @@ def build_keyword_file(
     filepath.write_text("\n".join(keywords))
 
 
+@lru_cache(maxsize=256)
+def _thinning_keywords(
+    cycle: int,
+    trigger_ba: int | None,
+    min_dbh: int,
+    max_dbh: int,
+    q_factor: int,
+    residual: int,
+) -> tuple[str, ...]:
+    """
+    Build the conditional Q-factor thinning keywords (Web GUI style).
+
+    The block does not depend on the stand, so it is cached on the thinning
+    settings: a Monte Carlo sample reuses the same lines for every stand.
+
+    Args:
+        cycle: Cycle length, used as the If block's re-evaluation interval
+        trigger_ba: Basal area that triggers thinning (None thins unconditionally)
+        min_dbh: Smallest DBH thinned
+        max_dbh: Largest DBH retained; larger trees are removed by ThinDBH
+        q_factor: Q-factor for the residual diameter distribution
+        residual: Residual basal area target
+
+    Returns:
+        Keyword lines, ending with a blank line
+    """
+    keywords = []
+
+    # IF-THEN block for conditional thinning
+    if trigger_ba is not None:
+        keywords.append("!Exten:base Title:Specified Basal Area is exceeded")
+        keywords.append(f"If                {cycle}")
+        keywords.append(f"bba gt    {trigger_ba}")
+        keywords.append("Then")
+
+    # ThinQFA with Parms() syntax (Web GUI style)
+    # Use cycle 0 inside IF block to apply whenever condition is met
+    thin_cycle = 0
+    class_width = 2  # 2" DBH classes per assignment
+
+    keywords.append("!Exten:base Title:Thin to a Q-factor")
+    keywords.append(
+        "* Arguments: SmDBH, LgDBH, Species, Q-Factor, D-class, ResDensity, DensityUnits"
+    )
+    keywords.append(
+        f"ThinQFA           {thin_cycle}     Parms({min_dbh},{max_dbh},All,{q_factor},{class_width},{residual},0)"
+    )
+
+    # ThinDBH to remove trees above max_dbh (Web GUI includes this)
+    keywords.append("* Arguments: SmDBH, LgDBH, CutEff, Species, ResTPA, ResBA")
+    keywords.append(
+        f"ThinDBH           {thin_cycle}     Parms({max_dbh},999,1,All,0,0)"
+    )
+
+    # Close IF block
+    if trigger_ba is not None:
+        keywords.append("EndIf")
+
+    keywords.append("")
+
+    return tuple(keywords)
+
+
 def build_keyword_file_simple(
     stand: pd.Series,
     tree_filename: str,
@@ -406,8 +478,8 @@ def build_batch_keyword_file(
     """
     Generate a batch FVS keyword file for multiple stands.
 
-    This matches the Web GUI's approach of running all stands in a single
-    FVS invocation with Process keywords between stands.
+    Thin wrapper around build_batch_keyword_file_df for callers that already
+    hold one Series per stand.
 
     Args:
         stands: List of Series containing stand-level attributes
@@ -415,101 +487,148 @@ def build_batch_keyword_file(
         config: Simulation configuration
         filepath: Output path for keyword file
     """
+    stands_df = pd.DataFrame([_stand_values(stand) for stand in stands])
+    build_batch_keyword_file_df(stands_df, db_filename, config, filepath)
+
+
+def build_batch_keyword_file_df(
+    stands_df: pd.DataFrame,
+    db_filename: str,
+    config: FVSSimulationConfig,
+    filepath: Path | str,
+) -> None:
+    """
+    Generate a batch FVS keyword file for every stand in a DataFrame.
+
+    This matches the Web GUI's approach of running all stands in a single
+    FVS invocation with Process keywords between stands. Stand IDs and
+    inventory years are pulled out column-wise, so no per-row Series is built.
+
+    Args:
+        stands_df: Stand attributes, one row per stand (STAND_ID and INV_YEAR
+                   required; column names are matched case-insensitively)
+        db_filename: Name of input database (e.g., FVS_Data.db)
+        config: Simulation configuration
+        filepath: Output path for keyword file
+
+    Example:
+        >>> build_batch_keyword_file_df(
+        ...     stands, "FVS_Data.db", config, run_dir / "batch.key"
+        ... )
+    """
     filepath = Path(filepath)
+    # Everything not tied to a stand is formatted once per file
+    name_line = f"{config.name}\nStandCN\n"
+    stand_block = _batch_stand_block(db_filename, config)
+
+    if len(stands_df) > 0:
+        # Normalize column names without touching the caller's frame
+        stands_df = stands_df.rename(columns=str.upper)
+        stand_ids = [str(v) for v in stands_df["STAND_ID"].tolist()]
+        inv_years = [int(v) for v in stands_df["INV_YEAR"].tolist()]
+    else:
+        stand_ids, inv_years = [], []
+
+    # Stream straight to the file so no whole-batch string is built in memory
+    with filepath.open("w", buffering=1 << 16) as fh:
+        fh.write(f"!!title: {config.name}\n!!built: batch-run\n\n")
+        for stand_id, inv_year in zip(stand_ids, inv_years, strict=True):
+            # Stand identification, then the block shared by every stand
+            fh.write(
+                f"StdIdent\n{stand_id:26s}{name_line}{stand_id}\n"
+                f"MgmtId\nA002\nInvYear       {inv_year}\n{stand_block}"
+            )
+
+        # Final stop
+        fh.write("Stop")
 
+
+def _batch_stand_block(db_filename: str, config: FVSSimulationConfig) -> str:
+    """
+    Build the per-stand keywords of a batch file that follow InvYear.
+
+    Everything after the stand identification depends only on the config and
+    input database, so it is assembled once per batch file and reused for
+    every stand.
+
+    Args:
+        db_filename: Name of input database (e.g., FVS_Data.db)
+        config: Simulation configuration
+
+    Returns:
+        Newline-terminated keyword block, ending with Process
+    """
     all_keywords = []
-    all_keywords.append(f"!!title: {config.name}")
-    all_keywords.append(f"!!built: batch-run")
+
+    # Use internal_num_cycles (+1) to ensure carbon/compute output for final year
+    all_keywords.append(f"TimeInt                 {config.cycle_length} ")
+    all_keywords.append(f"NumCycle     {config.internal_num_cycles} ")
     all_keywords.append("")
 
-    for stand in stands:
-        # Normalize stand keys
-        stand = stand.copy()
-        stand.index = stand.index.str.upper()
+    # Database output
+    all_keywords.append("DataBase")
+    all_keywords.append("DSNOut")
+    all_keywords.append("FVSOut.db")
+    all_keywords.append("Summary        2")
+    if config.compute_canopy_cover:
+        all_keywords.append("Computdb          0         1")
+    if config.output_carbon:
+        all_keywords.append("CarbReDB        2")
+    all_keywords.append("End")
+    all_keywords.append("")
 
-        stand_id = str(stand["STAND_ID"])
-        inv_year = int(stand["INV_YEAR"])
+    # Database input
+    all_keywords.append("Database")
+    all_keywords.append("DSNIn")
+    all_keywords.append(db_filename)
+    all_keywords.append("StandSQL")
+    all_keywords.append("SELECT * FROM FVS_StandInit")
+    all_keywords.append("WHERE Stand_ID= '%StandID%'")
+    all_keywords.append("EndSQL")
+    all_keywords.append("TreeSQL")
+    all_keywords.append("SELECT * FROM FVS_TreeInit")
+    all_keywords.append("WHERE Stand_CN= '%StandID%'")
+    all_keywords.append("EndSQL")
+    all_keywords.append("END")
+    all_keywords.append("")
 
-        # Stand identification
-        all_keywords.append("StdIdent")
-        all_keywords.append(f"{stand_id:26s}{config.name}")
-        all_keywords.append("StandCN")
-        all_keywords.append(stand_id)
-        all_keywords.append("MgmtId")
-        all_keywords.append("A002")
-        all_keywords.append(f"InvYear       {inv_year}")
-        # Use internal_num_cycles (+1) to ensure carbon/compute output for final year
-        all_keywords.append(f"TimeInt                 {config.cycle_length} ")
-        all_keywords.append(f"NumCycle     {config.internal_num_cycles} ")
+    # Fire and Fuels Extension
+    if config.output_carbon:
+        all_keywords.append("FMIn")
+        all_keywords.append("CarbRept        2")
+        all_keywords.append("CarbCut")
+        all_keywords.append("CarbCalc")
+        all_keywords.append("End")
         all_keywords.append("")
 
-        # Database output
-        all_keywords.append("DataBase")
-        all_keywords.append("DSNOut")
-        all_keywords.append("FVSOut.db")
-        all_keywords.append("Summary        2")
-        if config.compute_canopy_cover:
-            all_keywords.append("Computdb          0         1")
-        if config.output_carbon:
-            all_keywords.append("CarbReDB        2")
+    # Compute canopy cover
+    if config.compute_canopy_cover:
+        all_keywords.append("Compute            0")
+        all_keywords.append("Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)")
         all_keywords.append("End")
         all_keywords.append("")
 
-        # Database input
-        all_keywords.append("Database")
-        all_keywords.append("DSNIn")
-        all_keywords.append(db_filename)
-        all_keywords.append("StandSQL")
-        all_keywords.append("SELECT * FROM FVS_StandInit")
-        all_keywords.append("WHERE Stand_ID= '%StandID%'")
-        all_keywords.append("EndSQL")
-        all_keywords.append("TreeSQL")
-        all_keywords.append("SELECT * FROM FVS_TreeInit")
-        all_keywords.append("WHERE Stand_CN= '%StandID%'")
-        all_keywords.append("EndSQL")
-        all_keywords.append("END")
+    # Management keywords
+    if config.min_harvest_volume is not None:
+        all_keywords.append(
+            f"MINHARV           0       0.0       0.0       0.0       0.0{config.min_harvest_volume:10.1f}"
+        )
         all_keywords.append("")
 
-        # Fire and Fuels Extension
-        if config.output_carbon:
-            all_keywords.append("FMIn")
-            all_keywords.append("CarbRept        2")
-            all_keywords.append("CarbCut")
-            all_keywords.append("CarbCalc")
-            all_keywords.append("End")
-            all_keywords.append("")
-
-        # Compute canopy cover
-        if config.compute_canopy_cover:
-            all_keywords.append("Compute            0")
-            all_keywords.append("Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)")
-            all_keywords.append("End")
-            all_keywords.append("")
-
-        # Management keywords
-        if config.min_harvest_volume is not None:
-            all_keywords.append(
-                f"MINHARV           0       0.0       0.0       0.0       0.0{config.min_harvest_volume:10.1f}"
-            )
-            all_keywords.append("")
-
-        if config.thin_q_factor is not None and config.thin_residual_ba is not None:
-            year = config.thin_year if config.thin_year is not None else 0
-            all_keywords.append(
-                f"THINQFA   {year:10d}{config.thin_min_dbh:10.1f}{config.thin_max_dbh:10.1f}{0:10d}"
-                f"{config.thin_q_factor:10.1f}{2.0:10.1f}{config.thin_residual_ba:10.1f}"
-            )
-            all_keywords.append("         0")
-            all_keywords.append("")
-
-        # Labels and process
-        all_keywords.append("SPLabel")
-        all_keywords.append("  All_Stands, & ")
-        all_keywords.append("  Section6")
-        all_keywords.append("Process")
+    if config.thin_q_factor is not None and config.thin_residual_ba is not None:
+        year = config.thin_year if config.thin_year is not None else 0
+        all_keywords.append(
+            f"THINQFA   {year:10d}{config.thin_min_dbh:10.1f}{config.thin_max_dbh:10.1f}{0:10d}"
+            f"{config.thin_q_factor:10.1f}{2.0:10.1f}{config.thin_residual_ba:10.1f}"
+        )
+        all_keywords.append("         0")
         all_keywords.append("")
 
-    # Final stop
-    all_keywords.append("Stop")
+    # Labels and process
+    all_keywords.append("SPLabel")
+    all_keywords.append("  All_Stands, & ")
+    all_keywords.append("  Section6")
+    all_keywords.append("Process")
+    all_keywords.append("")
 
-    filepath.write_text("\n".join(all_keywords))
+    return "\n".join(all_keywords) + "\n"
@@ -23,7 +23,11 @@ from .config import (
 )
 from .database import (
     create_mc_database,
+    flush_run,
     load_mc_results,
+    merge_mc_databases,
+    optimize_mc_database,
+    summarize_mc,
     update_batch_status,
     update_run_status,
     write_batch_error,
@@ -31,9 +35,10 @@ from .database import (
     write_run_registry,
     write_run_summary,
     write_time_series,
+    write_time_series_arrays,
 )
 from .executor import run_monte_carlo_batch
-from .outputs import extract_run_summary, extract_time_series
+from .outputs import combine_results, extract_run_summary, extract_time_series
 from .sampler import generate_parameter_samples
 
 __all__ = [
@@ -49,6 +54,7 @@ __all__ = [
     # Batch execution
     "run_monte_carlo_batch",
     # Output extraction
+    "combine_results",
     "extract_run_summary",
     "extract_time_series",
     # Database functions
@@ -58,7 +64,12 @@ __all__ = [
     "update_run_status",
     "write_run_summary",
     "write_time_series",
+    "write_time_series_arrays",
     "write_batch_error",
+    "flush_run",
     "update_batch_status",
+    "merge_mc_databases",
+    "optimize_mc_database",
     "load_mc_results",
+    "summarize_mc",
 ]
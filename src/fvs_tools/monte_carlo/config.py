@@ -17,22 +17,27 @@ if TYPE_CHECKING:
 
 # Valid parameter names that can be sampled
 # These match FVSSimulationConfig attributes or new MC-specific parameters
-VALID_PARAMETER_NAMES = {
-    # Existing FVSSimulationConfig parameters
-    "thin_q_factor",
-    "thin_residual_ba",
-    "thin_trigger_ba",
-    "thin_min_dbh",
-    "thin_max_dbh",
-    "min_harvest_volume",
-    # New parameters to be added in Phase 3
-    "mortality_multiplier",
-    "enable_calibration",
-    "fvs_random_seed",
-}
-
-
-@dataclass
+VALID_PARAMETER_NAMES = frozenset(
+    {
+        # Existing FVSSimulationConfig parameters
+        "thin_q_factor",
+        "thin_residual_ba",
+        "thin_trigger_ba",
+        "thin_min_dbh",
+        "thin_max_dbh",
+        "min_harvest_volume",
+        # New parameters to be added in Phase 3
+        "mortality_multiplier",
+        "enable_calibration",
+        "fvs_random_seed",
+    }
+)
+
+# Listed in error messages; sorted once rather than on every failed validation
+_VALID_NAMES_SORTED = sorted(VALID_PARAMETER_NAMES)
+
+
+@dataclass(frozen=True, slots=True)
 class UniformParameterSpec:
     """
     Specification for a continuous uniform distribution parameter.
@@ -52,7 +57,7 @@ class UniformParameterSpec:
         if self.name not in VALID_PARAMETER_NAMES:
             raise ValueError(
                 f"Invalid parameter name '{self.name}'. "
-                f"Valid names: {sorted(VALID_PARAMETER_NAMES)}"
+                f"Valid names: {_VALID_NAMES_SORTED}"
             )
         if self.min_value >= self.max_value:
             raise ValueError(
@@ -60,7 +65,7 @@ class UniformParameterSpec:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BooleanParameterSpec:
     """
     Specification for a boolean parameter.
@@ -78,7 +83,7 @@ class BooleanParameterSpec:
         if self.name not in VALID_PARAMETER_NAMES:
             raise ValueError(
                 f"Invalid parameter name '{self.name}'. "
-                f"Valid names: {sorted(VALID_PARAMETER_NAMES)}"
+                f"Valid names: {_VALID_NAMES_SORTED}"
             )
         if not 0.0 <= self.probability_true <= 1.0:
             raise ValueError(
@@ -86,7 +91,7 @@ class BooleanParameterSpec:
             )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiscreteUniformSpec:
     """
     Specification for a discrete uniform distribution parameter (integers).
@@ -106,7 +111,7 @@ class DiscreteUniformSpec:
         if self.name not in VALID_PARAMETER_NAMES:
             raise ValueError(
                 f"Invalid parameter name '{self.name}'. "
-                f"Valid names: {sorted(VALID_PARAMETER_NAMES)}"
+                f"Valid names: {_VALID_NAMES_SORTED}"
             )
         if self.min_value > self.max_value:
             raise ValueError(
@@ -118,7 +123,7 @@ class DiscreteUniformSpec:
 ParameterSpec = UniformParameterSpec | BooleanParameterSpec | DiscreteUniformSpec
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MonteCarloConfig:
     """
     Configuration for a Monte Carlo batch simulation.
@@ -133,6 +138,9 @@ class MonteCarloConfig:
         stand_ids: Optional list of stand IDs to filter to
         plot_ids: Optional list of plot IDs to filter to
         output_base: Base directory for outputs (auto-generated if None)
+        packed_time_series: Store each run's time series as one row of float32
+                            arrays in MC_TimeSeriesArr instead of one row per
+                            year in MC_TimeSeries (default False)
     """
 
     batch_seed: int
@@ -144,6 +152,7 @@ class MonteCarloConfig:
     stand_ids: list[str] | None = None
     plot_ids: list[int] | None = None
     output_base: Path | None = None
+    packed_time_series: bool = False
 
     def __post_init__(self):
         """Validate configuration and set defaults."""
@@ -164,15 +173,18 @@ class MonteCarloConfig:
                 f"base_config must be FVSSimulationConfig, got {type(self.base_config)}"
             )
 
-        # Auto-generate batch_id if not provided
+        # Auto-generate batch_id if not provided (the dataclass is frozen,
+        # so defaults are filled in via object.__setattr__)
         if self.batch_id is None:
-            self.batch_id = f"mc_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            batch_id = f"mc_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            object.__setattr__(self, "batch_id", batch_id)
 
         # Auto-generate output_base if not provided
         if self.output_base is None:
-            self.output_base = Path(f"outputs/mc_batch_{self.batch_id}")
+            output_base = Path(f"outputs/mc_batch_{self.batch_id}")
         else:
-            self.output_base = Path(self.output_base)
+            output_base = Path(self.output_base)
+        object.__setattr__(self, "output_base", output_base)
 
         # Validate parameter names are unique
         param_names = [spec.name for spec in self.parameter_specs]
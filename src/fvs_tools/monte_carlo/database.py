@@ -10,13 +10,21 @@ Provides SQLite schema and functions for storing/loading Monte Carlo results:
 """
 
 import json
+import math
 import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import nullcontext
+from dataclasses import asdict
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from ..sqlite_utils import open_sqlite
+
 if TYPE_CHECKING:
     from .config import MonteCarloConfig
 
@@ -99,7 +107,53 @@ CREATE TABLE IF NOT EXISTS MC_TimeSeries (
     cumulative_harvest    REAL,
     PRIMARY KEY (batch_id, run_id, year),
     FOREIGN KEY (batch_id, run_id) REFERENCES MC_RunRegistry(batch_id, run_id)
-);
+) WITHOUT ROWID;  -- Rows are stored in primary-key order, no hidden rowid
+"""
+
+# Compact alternative to MC_TimeSeries: one row per run, each column holding
+# that run's values as a packed little-endian array (year: int32, others:
+# float32; NULL if the run has no such column). See write_time_series_arrays.
+SCHEMA_MC_TIME_SERIES_ARR = """
+CREATE TABLE IF NOT EXISTS MC_TimeSeriesArr (
+    batch_id              TEXT NOT NULL,
+    run_id                INTEGER NOT NULL,
+    n_years               INTEGER NOT NULL,
+    year                  BLOB NOT NULL,
+    aboveground_c_live    BLOB,
+    standing_dead_c       BLOB,
+    merch_carbon_stored   BLOB,
+    total_carbon          BLOB,
+    canopy_cover_pct      BLOB,
+    ba                    BLOB,
+    tpa                   BLOB,
+    harvest_bdft          BLOB,
+    cumulative_harvest    BLOB,
+    PRIMARY KEY (batch_id, run_id),
+    FOREIGN KEY (batch_id, run_id) REFERENCES MC_RunRegistry(batch_id, run_id)
+) WITHOUT ROWID;
+"""
+
+# Packed value dtype: ~7 significant digits, ample for these ~4 significant
+# figure carbon/BA/TPA metrics, at half the bytes of float64
+TIME_SERIES_ARRAY_DTYPE = "<f4"
+
+# Value columns shared by MC_TimeSeries and MC_TimeSeriesArr, in schema order
+TIME_SERIES_VALUE_COLUMNS = (
+    "aboveground_c_live",
+    "standing_dead_c",
+    "merch_carbon_stored",
+    "total_carbon",
+    "canopy_cover_pct",
+    "ba",
+    "tpa",
+    "harvest_bdft",
+    "cumulative_harvest",
+)
+
+# Cross-run queries filter or group by year; (batch_id, run_id) lookups are
+# already served by the primary keys of MC_TimeSeries and MC_RunSummary
+INDEX_MC_TIME_SERIES_YEAR = """
+CREATE INDEX IF NOT EXISTS idx_ts_year ON MC_TimeSeries (year);
 """
 
 SCHEMA_MC_BATCH_ERRORS = """
@@ -122,6 +176,11 @@ def create_mc_database(db_path: Path) -> sqlite3.Connection:
     Creates all required tables for storing Monte Carlo batch results.
     Safe to call on existing database (uses IF NOT EXISTS).
 
+    The connection is opened in WAL mode (see open_sqlite). The batch
+    orchestrator is the only writer - worker processes return results and
+    never open this file - so no cross-process write lock is needed, and
+    readers such as load_mc_results proceed concurrently with the writer.
+
     Args:
         db_path: Path to SQLite database file
 
@@ -135,20 +194,24 @@ def create_mc_database(db_path: Path) -> sqlite3.Connection:
         >>> conn.close()
     """
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    conn = open_sqlite(db_path)
 
     # Create all tables
     conn.execute(SCHEMA_MC_BATCH_META)
     conn.execute(SCHEMA_MC_RUN_REGISTRY)
     conn.execute(SCHEMA_MC_RUN_SUMMARY)
     conn.execute(SCHEMA_MC_TIME_SERIES)
+    conn.execute(SCHEMA_MC_TIME_SERIES_ARR)
     conn.execute(SCHEMA_MC_BATCH_ERRORS)
+    conn.execute(INDEX_MC_TIME_SERIES_YEAR)
 
     conn.commit()
     return conn
 
 
-def write_batch_meta(conn: sqlite3.Connection, config: "MonteCarloConfig") -> None:
+def write_batch_meta(
+    conn: sqlite3.Connection, config: "MonteCarloConfig", commit: bool = True
+) -> None:
     """
     Write batch metadata to database.
 
@@ -157,6 +220,7 @@ def write_batch_meta(conn: sqlite3.Connection, config: "MonteCarloConfig") -> No
     Args:
         conn: Database connection
         config: MonteCarloConfig with batch settings
+        commit: If False, leave the transaction open for the caller to commit
     """
     # Serialize config to JSON (exclude non-serializable objects)
     config_dict = {
@@ -166,18 +230,20 @@ def write_batch_meta(conn: sqlite3.Connection, config: "MonteCarloConfig") -> No
         "n_workers": config.n_workers,
         "stand_ids": config.stand_ids,
         "plot_ids": config.plot_ids,
-        "output_base": str(config.output_base),
+        "output_base": config.output_base,
+        "packed_time_series": config.packed_time_series,
         "base_config_name": config.base_config.name,
         "parameter_specs": [
             {
                 "type": type(spec).__name__,
                 "name": spec.name,
-                **{k: v for k, v in vars(spec).items() if k != "name"},
+                **{k: v for k, v in asdict(spec).items() if k != "name"},
             }
             for spec in config.parameter_specs
         ],
     }
-    config_json = json.dumps(config_dict, indent=2)
+    # Compact separators; default=str covers Path values
+    config_json = json.dumps(config_dict, separators=(",", ":"), default=str)
 
     conn.execute(
         """
@@ -195,7 +261,22 @@ def write_batch_meta(conn: sqlite3.Connection, config: "MonteCarloConfig") -> No
             config_json,
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
+
+
+# Sampled-parameter columns of MC_RunRegistry, in schema order
+REGISTRY_PARAMETER_COLUMNS = (
+    "thin_q_factor",
+    "thin_residual_ba",
+    "thin_trigger_ba",
+    "thin_min_dbh",
+    "thin_max_dbh",
+    "min_harvest_volume",
+    "mortality_multiplier",
+    "enable_calibration",
+    "fvs_random_seed",
+)
 
 
 def write_run_registry(
@@ -212,43 +293,31 @@ def write_run_registry(
         batch_id: Batch identifier
         samples: List of parameter sample dicts from generate_parameter_samples()
     """
-    # Prepare rows for insertion
-    rows = []
-    for sample in samples:
-        row = {
-            "batch_id": batch_id,
-            "run_id": sample["run_id"],
-            "run_seed": sample["run_seed"],
-            "status": "pending",
-            "created_at": datetime.now().isoformat(),
-            "completed_at": None,
-            # Parameter columns (set to None if not in sample)
-            "thin_q_factor": sample.get("thin_q_factor"),
-            "thin_residual_ba": sample.get("thin_residual_ba"),
-            "thin_trigger_ba": sample.get("thin_trigger_ba"),
-            "thin_min_dbh": sample.get("thin_min_dbh"),
-            "thin_max_dbh": sample.get("thin_max_dbh"),
-            "min_harvest_volume": sample.get("min_harvest_volume"),
-            "mortality_multiplier": sample.get("mortality_multiplier"),
-            "enable_calibration": sample.get("enable_calibration"),
-            "fvs_random_seed": sample.get("fvs_random_seed"),
-        }
-        rows.append(row)
+    # One positional tuple per sample, streamed straight into executemany
+    # (parameter columns are None when not sampled in this batch; map() runs
+    # the lookups without a per-column generator frame)
+    created_at = datetime.now().isoformat()
+    rows = (
+        (
+            batch_id,
+            sample["run_id"],
+            sample["run_seed"],
+            "pending",
+            created_at,
+            None,
+            *map(sample.get, REGISTRY_PARAMETER_COLUMNS),
+        )
+        for sample in samples
+    )
 
     # Bulk insert
+    placeholders = ", ".join("?" * (6 + len(REGISTRY_PARAMETER_COLUMNS)))
     conn.executemany(
-        """
+        f"""
         INSERT INTO MC_RunRegistry (
             batch_id, run_id, run_seed, status, created_at, completed_at,
-            thin_q_factor, thin_residual_ba, thin_trigger_ba,
-            thin_min_dbh, thin_max_dbh, min_harvest_volume,
-            mortality_multiplier, enable_calibration, fvs_random_seed
-        ) VALUES (
-            :batch_id, :run_id, :run_seed, :status, :created_at, :completed_at,
-            :thin_q_factor, :thin_residual_ba, :thin_trigger_ba,
-            :thin_min_dbh, :thin_max_dbh, :min_harvest_volume,
-            :mortality_multiplier, :enable_calibration, :fvs_random_seed
-        )
+            {", ".join(REGISTRY_PARAMETER_COLUMNS)}
+        ) VALUES ({placeholders})
         """,
         rows,
     )
@@ -261,6 +330,7 @@ def update_run_status(
     run_id: int,
     status: str,
     completed_at: str | None = None,
+    commit: bool = True,
 ) -> None:
     """
     Update status of a run in the registry.
@@ -271,6 +341,7 @@ def update_run_status(
         run_id: Run identifier (0 to n_samples-1)
         status: New status ('pending', 'running', 'complete', 'failed')
         completed_at: ISO timestamp when run completed (optional)
+        commit: If False, leave the transaction open for the caller to commit
     """
     conn.execute(
         """
@@ -280,11 +351,39 @@ def update_run_status(
         """,
         (status, completed_at, batch_id, run_id),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
+
+
+# Metric columns of MC_RunSummary, in schema order
+SUMMARY_METRIC_COLUMNS = (
+    "final_total_carbon",
+    "avg_carbon_stock",
+    "final_live_carbon",
+    "final_dead_carbon",
+    "final_stored_carbon",
+    "min_canopy_cover",
+    "final_canopy_cover",
+    "cumulative_harvest_bdft",
+    "run_duration_sec",
+    "n_stands",
+)
+
+# Built once from the column list; every run reuses the same statement text,
+# so sqlite3's statement cache keeps it prepared
+INSERT_MC_RUN_SUMMARY = (
+    "INSERT INTO MC_RunSummary (batch_id, run_id, "
+    f"{', '.join(SUMMARY_METRIC_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (2 + len(SUMMARY_METRIC_COLUMNS)))})"
+)
 
 
 def write_run_summary(
-    conn: sqlite3.Connection, batch_id: str, run_id: int, metrics: dict
+    conn: sqlite3.Connection,
+    batch_id: str,
+    run_id: int,
+    metrics: dict,
+    commit: bool = True,
 ) -> None:
     """
     Write aggregated summary metrics for a completed run.
@@ -294,6 +393,7 @@ def write_run_summary(
         batch_id: Batch identifier
         run_id: Run identifier
         metrics: Dictionary with summary metrics (keys match column names)
+        commit: If False, leave the transaction open for the caller to commit
 
     Expected metrics keys:
         - final_total_carbon, avg_carbon_stock
@@ -302,37 +402,21 @@ def write_run_summary(
         - cumulative_harvest_bdft
         - run_duration_sec, n_stands
     """
+    # Missing metrics are stored as NULL
     conn.execute(
-        """
-        INSERT INTO MC_RunSummary (
-            batch_id, run_id,
-            final_total_carbon, avg_carbon_stock,
-            final_live_carbon, final_dead_carbon, final_stored_carbon,
-            min_canopy_cover, final_canopy_cover,
-            cumulative_harvest_bdft,
-            run_duration_sec, n_stands
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            batch_id,
-            run_id,
-            metrics.get("final_total_carbon"),
-            metrics.get("avg_carbon_stock"),
-            metrics.get("final_live_carbon"),
-            metrics.get("final_dead_carbon"),
-            metrics.get("final_stored_carbon"),
-            metrics.get("min_canopy_cover"),
-            metrics.get("final_canopy_cover"),
-            metrics.get("cumulative_harvest_bdft"),
-            metrics.get("run_duration_sec"),
-            metrics.get("n_stands"),
-        ),
+        INSERT_MC_RUN_SUMMARY,
+        (batch_id, run_id, *map(metrics.get, SUMMARY_METRIC_COLUMNS)),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def write_time_series(
-    conn: sqlite3.Connection, batch_id: str, run_id: int, df: pd.DataFrame
+    conn: sqlite3.Connection,
+    batch_id: str,
+    run_id: int,
+    df: pd.DataFrame,
+    commit: bool = True,
 ) -> None:
     """
     Write time series data for a run.
@@ -346,15 +430,118 @@ def write_time_series(
             Optional: aboveground_c_live, standing_dead_c, merch_carbon_stored,
                       total_carbon, canopy_cover_pct, ba, tpa,
                       harvest_bdft, cumulative_harvest
+        commit: If False, leave the transaction open for the caller to commit
     """
-    # Add batch_id and run_id columns
-    df = df.copy()
-    df["batch_id"] = batch_id
-    df["run_id"] = run_id
+    # Bulk insert with executemany (to_sql would commit on its own, which
+    # breaks callers that group several writes into one transaction).
+    # batch_id and run_id are bound per row rather than added as columns, so
+    # the caller's frame is neither copied nor modified. Each column is
+    # converted to Python values on its own (NA -> None) and the rows are
+    # zipped from those, so no 2-D object copy of the frame is built.
+    columns = [c for c in df.columns if c not in ("batch_id", "run_id")]
+    placeholders = ", ".join("?" for _ in columns)
+    values = [df[col].to_numpy(dtype=object, na_value=None) for col in columns]
+    rows = zip(repeat(batch_id), repeat(run_id), *values)
+    conn.executemany(
+        f"INSERT INTO MC_TimeSeries (batch_id, run_id, {', '.join(columns)}) "
+        f"VALUES (?, ?, {placeholders})",
+        rows,
+    )
+    if commit:
+        conn.commit()
 
-    # Write to database (append mode)
-    df.to_sql("MC_TimeSeries", conn, if_exists="append", index=False)
-    conn.commit()
+
+def write_time_series_arrays(
+    conn: sqlite3.Connection,
+    batch_id: str,
+    run_id: int,
+    df: pd.DataFrame,
+    commit: bool = True,
+) -> None:
+    """
+    Write a run's time series as one MC_TimeSeriesArr row of packed arrays.
+
+    Compact alternative to write_time_series: the batch/run key is stored
+    once per run instead of once per year and the insert is a single row, at
+    the cost of not being able to query individual years in SQL. Values are
+    quantized to float32 (TIME_SERIES_ARRAY_DTYPE), halving their size; the
+    row table keeps full precision. Read back with load_timeseries_arrays.
+
+    Args:
+        conn: Database connection
+        batch_id: Batch identifier
+        run_id: Run identifier
+        df: DataFrame with a 'year' column and any of TIME_SERIES_VALUE_COLUMNS
+        commit: If False, leave the transaction open for the caller to commit
+    """
+    values = [
+        (
+            pd.to_numeric(df[col])
+            .to_numpy(dtype=TIME_SERIES_ARRAY_DTYPE, na_value=np.nan)
+            .tobytes()
+            if col in df.columns
+            else None
+        )
+        for col in TIME_SERIES_VALUE_COLUMNS
+    ]
+    year = df["year"].to_numpy(dtype="<i4").tobytes()
+
+    placeholders = ", ".join("?" * (4 + len(TIME_SERIES_VALUE_COLUMNS)))
+    conn.execute(
+        f"INSERT INTO MC_TimeSeriesArr (batch_id, run_id, n_years, year, "
+        f"{', '.join(TIME_SERIES_VALUE_COLUMNS)}) VALUES ({placeholders})",
+        (batch_id, run_id, len(df), year, *values),
+    )
+    if commit:
+        conn.commit()
+
+
+def flush_run(
+    conn: sqlite3.Connection,
+    batch_id: str,
+    run_id: int,
+    metrics: dict,
+    time_series: pd.DataFrame | None = None,
+    completed_at: str | None = None,
+    packed: bool = False,
+    commit: bool = True,
+) -> None:
+    """
+    Persist all results for a completed run in a single transaction.
+
+    Marks the run complete in the registry and writes its summary metrics and
+    time series between one BEGIN IMMEDIATE / COMMIT pair, so a run costs one
+    commit instead of three and is never left half-written.
+
+    Args:
+        conn: Database connection (no transaction may be open if commit=True)
+        batch_id: Batch identifier
+        run_id: Run identifier
+        metrics: Summary metrics dict (see write_run_summary)
+        time_series: Time series DataFrame (see write_time_series); skipped
+                     if None or empty
+        completed_at: ISO timestamp when the run completed (optional)
+        packed: If True, write the time series to MC_TimeSeriesArr (see
+                write_time_series_arrays) instead of MC_TimeSeries
+        commit: If False, write inside the caller's open transaction (e.g. a
+                group of runs committed together) instead of opening one
+    """
+    if commit:
+        conn.execute("BEGIN IMMEDIATE")
+    # The context manager commits on success and rolls back on any error
+    with conn if commit else nullcontext():
+        update_run_status(
+            conn,
+            batch_id,
+            run_id,
+            status="complete",
+            completed_at=completed_at,
+            commit=False,
+        )
+        write_run_summary(conn, batch_id, run_id, metrics, commit=False)
+        if time_series is not None and len(time_series) > 0:
+            write_series = write_time_series_arrays if packed else write_time_series
+            write_series(conn, batch_id, run_id, time_series, commit=False)
 
 
 def write_batch_error(
@@ -364,6 +551,8 @@ def write_batch_error(
     stand_id: str | None,
     error_type: str,
     error_msg: str,
+    timestamp: str | None = None,
+    commit: bool = True,
 ) -> None:
     """
     Log an error for a failed run.
@@ -375,15 +564,25 @@ def write_batch_error(
         stand_id: Stand that failed (None if batch-level failure)
         error_type: Error type/category
         error_msg: Full error message
+        timestamp: ISO timestamp to record (default: now)
+        commit: If False, leave the transaction open for the caller to commit
     """
     conn.execute(
         """
         INSERT INTO MC_BatchErrors (batch_id, run_id, stand_id, error_type, error_msg, timestamp)
         VALUES (?, ?, ?, ?, ?, ?)
         """,
-        (batch_id, run_id, stand_id, error_type, error_msg, datetime.now().isoformat()),
+        (
+            batch_id,
+            run_id,
+            stand_id,
+            error_type,
+            error_msg,
+            timestamp or datetime.now().isoformat(),
+        ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def update_batch_status(conn: sqlite3.Connection, batch_id: str, status: str) -> None:
@@ -409,6 +608,91 @@ def update_batch_status(conn: sqlite3.Connection, batch_id: str, status: str) ->
     conn.commit()
 
 
+def optimize_mc_database(conn: sqlite3.Connection) -> None:
+    """
+    Refresh planner statistics and fold the WAL back into the database.
+
+    Intended to run once after a batch finishes writing: ANALYZE fills
+    sqlite_stat1 so later joins on (batch_id, run_id) pick good plans, and a
+    TRUNCATE checkpoint leaves readers a clean file with an empty -wal.
+
+    Args:
+        conn: Read-write connection with no open transaction
+    """
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA optimize")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+MC_TABLES = (
+    "MC_BatchMeta",
+    "MC_RunRegistry",
+    "MC_RunSummary",
+    "MC_TimeSeries",
+    "MC_TimeSeriesArr",
+    "MC_BatchErrors",
+)
+
+
+def merge_mc_databases(
+    conn: sqlite3.Connection,
+    shard_paths: list[Path],
+    delete_shards: bool = False,
+) -> int:
+    """
+    Merge Monte Carlo shard databases into an open results database.
+
+    Each shard is ATTACHed and copied table by table with INSERT ... SELECT
+    in one transaction per shard, so rows never round-trip through Python.
+    Rows whose primary key already exists in the target are replaced.
+
+    Args:
+        conn: Connection to the target database (from create_mc_database)
+        shard_paths: Paths to shard databases with the Monte Carlo schema
+        delete_shards: If True, delete each shard file after it is merged
+
+    Returns:
+        Number of shards merged
+
+    Raises:
+        FileNotFoundError: If a shard file does not exist
+
+    Example:
+        >>> conn = create_mc_database(Path("mc_results.db"))
+        >>> shards = sorted(Path("outputs").glob("mc_results.w*.db"))
+        >>> merge_mc_databases(conn, shards, delete_shards=True)
+    """
+    merged = 0
+    for shard_path in shard_paths:
+        shard_path = Path(shard_path)
+        if not shard_path.exists():
+            raise FileNotFoundError(f"Shard database not found: {shard_path}")
+
+        # ATTACH is not allowed inside a transaction
+        conn.commit()
+        conn.execute("ATTACH DATABASE ? AS shard", (str(shard_path),))
+        try:
+            with conn:
+                for table in MC_TABLES:
+                    columns = ", ".join(
+                        row[1]
+                        for row in conn.execute(f"PRAGMA main.table_info({table})")
+                    )
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO main.{table} ({columns}) "
+                        f"SELECT {columns} FROM shard.{table}"
+                    )
+        finally:
+            conn.execute("DETACH DATABASE shard")
+
+        if delete_shards:
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{shard_path}{suffix}").unlink(missing_ok=True)
+        merged += 1
+
+    return merged
+
+
 # Read functions
 def load_batch_meta(conn: sqlite3.Connection) -> dict:
     """Load batch metadata."""
@@ -431,9 +715,98 @@ def load_summary(conn: sqlite3.Connection) -> pd.DataFrame:
     return pd.read_sql_query("SELECT * FROM MC_RunSummary", conn)
 
 
-def load_timeseries(conn: sqlite3.Connection) -> pd.DataFrame:
-    """Load time series data for all runs."""
-    return pd.read_sql_query("SELECT * FROM MC_TimeSeries", conn)
+def load_timeseries(
+    conn: sqlite3.Connection,
+    run_ids: Sequence[int] | None = None,
+    chunksize: int | None = None,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
+    """
+    Load time series data, optionally for selected runs or in chunks.
+
+    Args:
+        conn: Database connection
+        run_ids: Only load these runs (default: all runs)
+        chunksize: If set, return an iterator of DataFrames with at most this
+                   many rows each instead of materializing the whole table
+
+    Returns:
+        Time series DataFrame, or an iterator of DataFrames if chunksize is set
+
+    Example:
+        >>> for chunk in load_timeseries(conn, chunksize=50_000):
+        ...     totals.append(chunk.groupby("year")["total_carbon"].sum())
+    """
+    sql = "SELECT * FROM MC_TimeSeries"
+    params: tuple = ()
+    if run_ids is not None:
+        params = tuple(int(run_id) for run_id in run_ids)
+        sql += f" WHERE run_id IN ({', '.join('?' * len(params))})"
+
+    return pd.read_sql_query(sql, conn, params=params, chunksize=chunksize)
+
+
+def load_timeseries_arrays(
+    conn: sqlite3.Connection, run_ids: Sequence[int] | None = None
+) -> pd.DataFrame:
+    """
+    Load MC_TimeSeriesArr back into the long one-row-per-year layout.
+
+    Args:
+        conn: Database connection
+        run_ids: Only load these runs (default: all runs)
+
+    Returns:
+        DataFrame with the same columns as MC_TimeSeries; value columns are
+        float32 and values missing for a run are NaN
+    """
+    sql = (
+        f"SELECT batch_id, run_id, n_years, year, "
+        f"{', '.join(TIME_SERIES_VALUE_COLUMNS)} FROM MC_TimeSeriesArr"
+    )
+    params: tuple = ()
+    if run_ids is not None:
+        params = tuple(int(run_id) for run_id in run_ids)
+        sql += f" WHERE run_id IN ({', '.join('?' * len(params))})"
+    rows = conn.execute(sql + " ORDER BY batch_id, run_id", params).fetchall()
+
+    n_years = np.array([row[2] for row in rows], dtype=np.int64)
+    data = {
+        "batch_id": np.repeat(
+            np.array([row[0] for row in rows], dtype=object), n_years
+        ),
+        "run_id": np.repeat(
+            np.array([row[1] for row in rows], dtype=np.int64), n_years
+        ),
+        "year": np.concatenate(
+            [np.frombuffer(row[3], dtype="<i4") for row in rows]
+            or [np.empty(0, dtype="<i4")]
+        ).astype(np.int64),
+    }
+    for i, col in enumerate(TIME_SERIES_VALUE_COLUMNS, start=4):
+        data[col] = np.concatenate(
+            [
+                (
+                    np.frombuffer(row[i], dtype=TIME_SERIES_ARRAY_DTYPE)
+                    if row[i] is not None
+                    else np.full(row[2], np.nan, dtype=TIME_SERIES_ARRAY_DTYPE)
+                )
+                for row in rows
+            ]
+            or [np.empty(0, dtype=TIME_SERIES_ARRAY_DTYPE)]
+        )
+
+    return pd.DataFrame(data)
+
+
+def _load_all_timeseries(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Load time series from both layouts (packed batches use MC_TimeSeriesArr)."""
+    timeseries = load_timeseries(conn)
+    packed = load_timeseries_arrays(conn)
+    if len(packed) == 0:
+        return timeseries
+    if len(timeseries) == 0:
+        return packed
+    return pd.concat([timeseries, packed], ignore_index=True)
 
 
 def load_errors(conn: sqlite3.Connection) -> pd.DataFrame:
@@ -441,12 +814,25 @@ def load_errors(conn: sqlite3.Connection) -> pd.DataFrame:
     return pd.read_sql_query("SELECT * FROM MC_BatchErrors", conn)
 
 
-def load_mc_results(db_path: Path) -> dict:
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert float64 columns to float32 (halves their memory footprint)."""
+    float_cols = df.select_dtypes(include="float64").columns
+    if len(float_cols) == 0:
+        return df
+    return df.astype({col: "float32" for col in float_cols})
+
+
+def load_mc_results(db_path: Path, downcast_floats: bool = False) -> dict:
     """
     Load all Monte Carlo results from a batch database.
 
     Args:
         db_path: Path to mc_results.db file
+        downcast_floats: If True, return float columns as float32 instead of
+            float64. Halves the memory of large summary/time series frames;
+            ample for these ~4 significant figure forestry metrics. (Values
+            are stored as 8-byte REALs either way - SQLite has no 4-byte
+            float - so downcasting before insert would not shrink the file.)
 
     Returns:
         Dictionary with keys:
@@ -465,16 +851,101 @@ def load_mc_results(db_path: Path) -> dict:
         >>> # Join to analyze parameter → outcome relationships
         >>> merged = registry.merge(summary, on=['batch_id', 'run_id'])
     """
-    conn = sqlite3.connect(db_path)
+    # Read-only: never blocks (or is blocked by) a batch that is still writing
+    conn = open_sqlite(db_path, read_only=True)
 
     try:
+        # One read transaction for all five queries: they share a single WAL
+        # snapshot (so the tables agree with each other even while a batch is
+        # still writing) and take the shared lock once rather than per query
+        conn.execute("BEGIN")
         results = {
             "batch_meta": load_batch_meta(conn),
             "registry": load_registry(conn),
             "summary": load_summary(conn),
-            "timeseries": load_timeseries(conn),
+            "timeseries": _load_all_timeseries(conn),
             "errors": load_errors(conn),
         }
-        return results
+        conn.rollback()
     finally:
         conn.close()
+
+    if downcast_floats:
+        for key in ("registry", "summary", "timeseries"):
+            results[key] = _downcast_floats(results[key])
+
+    return results
+
+
+class _SampleStdev:
+    """SQLite aggregate: sample standard deviation (ddof=1, like pandas)."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def step(self, value):
+        if value is None:
+            return
+        # Welford's online update
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def finalize(self):
+        if self.n < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.n - 1))
+
+
+def summarize_mc(
+    db_path: Path,
+    columns: tuple[str, ...] = ("final_total_carbon", "cumulative_harvest_bdft"),
+) -> dict:
+    """
+    Compute summary statistics of run metrics directly in SQLite.
+
+    Avoids loading MC_RunSummary into a DataFrame when only a handful of
+    scalars are needed: all statistics come from a single table scan.
+
+    Args:
+        db_path: Path to mc_results.db file
+        columns: MC_RunSummary metric columns to summarize
+
+    Returns:
+        Dictionary with 'n_runs' (completed runs) and, for each column, a
+        dict with 'mean', 'std' (sample, ddof=1), 'min' and 'max'. Values are
+        None (nan for 'std') when there are no non-null rows.
+
+    Raises:
+        ValueError: If a column is not a MC_RunSummary metric column
+
+    Example:
+        >>> stats = summarize_mc(Path("outputs/mc_batch_abc/mc_results.db"))
+        >>> carbon = stats["final_total_carbon"]
+        >>> print(f"{carbon['mean']:.1f} +/- {carbon['std']:.1f} tons/ac")
+    """
+    invalid = [c for c in columns if c not in SUMMARY_METRIC_COLUMNS]
+    if invalid:
+        raise ValueError(
+            f"Unknown summary columns: {invalid}. "
+            f"Valid columns: {list(SUMMARY_METRIC_COLUMNS)}"
+        )
+
+    conn = open_sqlite(db_path, read_only=True)
+    try:
+        conn.create_aggregate("sample_stdev", 1, _SampleStdev)
+        select = ", ".join(
+            f"AVG({c}), sample_stdev({c}), MIN({c}), MAX({c})" for c in columns
+        )
+        row = conn.execute(f"SELECT COUNT(*), {select} FROM MC_RunSummary").fetchone()
+    finally:
+        conn.close()
+
+    stats = {"n_runs": row[0]}
+    for i, column in enumerate(columns):
+        mean, std, min_, max_ = row[1 + 4 * i : 5 + 4 * i]
+        stats[column] = {"mean": mean, "std": std, "min": min_, "max": max_}
+    return stats
@@ -5,9 +5,15 @@ This module orchestrates parallel FVS runs across multiple worker processes,
 collecting results and writing to the Monte Carlo database.
 """
 
+import multiprocessing
+import queue
+import sqlite3
+import threading
+import time
 from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
@@ -15,18 +21,19 @@ import pandas as pd
 from ..batch import run_batch_simulation
 from ..config import FVSSimulationConfig
 from ..db_input import create_fvs_input_db
+from ..sqlite_utils import bulk_load_mode, open_sqlite
 from .config import MonteCarloConfig
 from .database import (
     create_mc_database,
+    flush_run,
+    optimize_mc_database,
     update_batch_status,
     update_run_status,
     write_batch_error,
     write_batch_meta,
     write_run_registry,
-    write_run_summary,
-    write_time_series,
 )
-from .outputs import extract_run_summary, extract_time_series
+from .outputs import combine_results, extract_run_summary, extract_time_series
 from .sampler import generate_parameter_samples
 
 # Mapping from Monte Carlo parameter names to FVSSimulationConfig attributes
@@ -44,6 +51,15 @@ MC_TO_FVS_PARAM_MAP = {
     "fvs_random_seed": "fvs_random_seed",
 }
 
+# Result writer: completed runs are committed in groups of up to this many,
+# or whatever has arrived within this many seconds of the first one
+WRITER_BATCH_SIZE = 50
+WRITER_MAX_WAIT_SEC = 0.5
+
+# Per-process state shared by every task a worker runs. Set once by
+# _init_worker so the stand/tree DataFrames are not pickled with each task.
+_WORKER_STATE: dict = {}
+
 
 def execute_single_run(
     run_params: dict,
@@ -52,6 +68,7 @@ def execute_single_run(
     base_config: dict,
     output_dir: Path,
     batch_id: str,
+    input_db: Path | None = None,
 ) -> dict:
     """
     Execute a single Monte Carlo run (all stands with one parameter set).
@@ -69,6 +86,8 @@ def execute_single_run(
         base_config: Base FVS config (num_years, cycle_length, etc.)
         output_dir: Directory for this run's outputs
         batch_id: Monte Carlo batch identifier to embed in FVS runs
+        input_db: Prebuilt FVS_Data.db shared by all runs of the batch. If
+                  None, one is built from stands/trees in the run directory.
 
     Returns:
         dict with keys:
@@ -80,7 +99,10 @@ def execute_single_run(
     """
     run_id = run_params["run_id"]
     run_dir = output_dir / f"run_{run_id:04d}"
-    run_dir.mkdir(parents=True, exist_ok=True)
+    # run_monte_carlo_batch pre-creates run directories; this only creates
+    # one for standalone calls
+    if not run_dir.is_dir():
+        run_dir.mkdir(parents=True, exist_ok=True)
 
     try:
         # Build FVS configuration with base settings + sampled parameters
@@ -95,13 +117,18 @@ def execute_single_run(
         fvs_config_dict["name"] = f"{batch_id}_run_{run_id:04d}"
         # Set batch_id to prevent run_batch_simulation from auto-generating
         fvs_config_dict["batch_id"] = batch_id
+        # Runs are already spread across MC workers; run stands sequentially
+        # unless the base config explicitly asks for stand-level workers
+        fvs_config_dict.setdefault("max_workers", 1)
 
         # Create FVS configuration
         fvs_config = FVSSimulationConfig(**fvs_config_dict)
 
-        # Create input database for this run
-        input_db = run_dir / "FVS_Data.db"
-        create_fvs_input_db(stands, trees, input_db)
+        # Input data is the same for every run, so the batch normally builds
+        # the database once; standalone calls build their own
+        if input_db is None:
+            input_db = run_dir / "FVS_Data.db"
+            create_fvs_input_db(stands, trees, input_db)
 
         # Run FVS batch simulation
         results = run_batch_simulation(
@@ -125,11 +152,10 @@ def execute_single_run(
                 "time_series": None,
             }
 
-        # Extract summary metrics
-        summary = extract_run_summary(results)
-
-        # Extract time series
-        time_series = extract_time_series(results)
+        # Extract summary metrics and time series from one combined frame
+        combined = combine_results(results)
+        summary = extract_run_summary(results, combined=combined)
+        time_series = extract_time_series(results, combined=combined)
 
         return {
             "run_id": run_id,
@@ -149,6 +175,148 @@ def execute_single_run(
         }
 
 
+def _init_worker(
+    stands: pd.DataFrame | Path,
+    trees: pd.DataFrame | Path,
+    base_config: dict,
+    output_dir: Path,
+    batch_id: str,
+    input_db: Path | None = None,
+) -> None:
+    """
+    ProcessPoolExecutor initializer: stash shared inputs in the worker.
+
+    With the fork start method the arguments are inherited from the parent
+    (copy-on-write) rather than pickled, so each worker sees the parent's
+    DataFrames without any serialization. Other start methods pass paths to
+    pickles written once by the parent, which each worker loads itself.
+    """
+    if isinstance(stands, Path):
+        stands = pd.read_pickle(stands)
+    if isinstance(trees, Path):
+        trees = pd.read_pickle(trees)
+
+    _WORKER_STATE.update(
+        stands=stands,
+        trees=trees,
+        base_config=base_config,
+        output_dir=output_dir,
+        batch_id=batch_id,
+        input_db=input_db,
+    )
+
+
+def _execute_run_in_worker(run_params: dict) -> dict:
+    """Run execute_single_run using the inputs stashed by _init_worker."""
+    return execute_single_run(
+        run_params,
+        _WORKER_STATE["stands"],
+        _WORKER_STATE["trees"],
+        _WORKER_STATE["base_config"],
+        _WORKER_STATE["output_dir"],
+        _WORKER_STATE["batch_id"],
+        input_db=_WORKER_STATE.get("input_db"),
+    )
+
+
+def _get_mp_context():
+    """Prefer fork (copy-on-write inputs) where the platform supports it."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _write_queued_result(
+    conn: sqlite3.Connection,
+    batch_id: str,
+    kind: str,
+    payload: tuple,
+    now: str,
+    packed_time_series: bool = False,
+) -> None:
+    """Apply one queued run result to the database (no commit)."""
+    if kind == "complete":
+        run_id, metrics, time_series = payload
+        flush_run(
+            conn,
+            batch_id,
+            run_id,
+            metrics,
+            time_series,
+            completed_at=now,
+            packed=packed_time_series,
+            commit=False,
+        )
+    else:
+        run_id, error_type, error_msg = payload
+        update_run_status(
+            conn, batch_id, run_id, status="failed", completed_at=now, commit=False
+        )
+        write_batch_error(
+            conn,
+            batch_id,
+            run_id,
+            stand_id=None,
+            error_type=error_type,
+            error_msg=error_msg,
+            timestamp=now,
+            commit=False,
+        )
+
+
+def _writer_loop(
+    db_path: Path,
+    batch_id: str,
+    results: queue.Queue,
+    errors: list,
+    packed_time_series: bool = False,
+) -> None:
+    """
+    Background thread: commit queued run results in grouped transactions.
+
+    Pulls ("complete" | "failed", payload) items off the queue and writes up
+    to WRITER_BATCH_SIZE of them (or whatever arrives within
+    WRITER_MAX_WAIT_SEC) per transaction, so commits and WAL checkpoints
+    never stall the loop collecting futures. A None item flushes what is
+    pending and stops the thread.
+
+    The thread uses its own connection (sqlite3 connections are bound to the
+    thread that opened them). Any exception is appended to errors for the
+    caller to re-raise after join(). With packed_time_series, time series go
+    to MC_TimeSeriesArr instead of MC_TimeSeries.
+    """
+    conn = open_sqlite(db_path)
+    try:
+        done = False
+        while not done:
+            items = [results.get()]
+            deadline = time.monotonic() + WRITER_MAX_WAIT_SEC
+            while items[-1] is not None and len(items) < WRITER_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(results.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            if items[-1] is None:
+                done = True
+                items.pop()
+
+            # One timestamp per group, shared by every row it writes
+            now = datetime.now().isoformat()
+            with conn:
+                for kind, payload in items:
+                    _write_queued_result(
+                        conn, batch_id, kind, payload, now, packed_time_series
+                    )
+    except Exception as e:
+        errors.append(e)
+    finally:
+        conn.close()
+
+
 def run_monte_carlo_batch(
     mc_config: MonteCarloConfig,
     stands: pd.DataFrame,
@@ -214,15 +382,17 @@ def run_monte_carlo_batch(
     results_db_path = output_dir / "mc_results.db"
     conn = create_mc_database(results_db_path)
 
-    # Write batch metadata
-    write_batch_meta(conn, mc_config)
-
     # Generate parameter samples
     samples = generate_parameter_samples(mc_config)
     print(f"Generated {len(samples)} parameter samples\n")
 
-    # Write run registry (all runs marked as "pending")
-    write_run_registry(conn, mc_config.batch_id, samples)
+    # Initial load into the fresh database: batch metadata plus run registry
+    # (all runs marked as "pending"). No journal needed - on a crash the
+    # whole batch is rerun.
+    with bulk_load_mode(conn):
+        # Committed together with the registry rows
+        write_batch_meta(conn, mc_config, commit=False)
+        write_run_registry(conn, mc_config.batch_id, samples)
 
     # Prepare base FVS config dict (shared settings across all runs)
     # Convert FVSSimulationConfig object to dict, filtering out None/private fields
@@ -239,22 +409,67 @@ def run_monte_carlo_batch(
     completed_count = 0
     success_count = 0
     failure_count = 0
-
-    with ProcessPoolExecutor(max_workers=mc_config.n_workers) as executor:
+    # Print roughly 100 progress lines per batch (failures are always printed)
+    progress_every = max(1, len(samples) // 100)
+
+    # Create every run directory up front in one burst, rather than from
+    # each worker as its run starts
+    for sample in samples:
+        (output_dir / f"run_{sample['run_id']:04d}").mkdir(exist_ok=True)
+
+    # Every run reads the same stands and trees, so build the FVS input
+    # database once (named FVS_Data.db, as the keyword files expect)
+    shared_input_db = output_dir / "FVS_Data.db"
+    create_fvs_input_db(stands, trees, shared_input_db)
+
+    # Shared inputs go to each worker once via the initializer; tasks only
+    # carry their sampled parameters. Without fork, the frames would be
+    # pickled through the pipe once per worker, so they are written to disk
+    # once and workers receive only the paths.
+    mp_context = _get_mp_context()
+    worker_stands, worker_trees = stands, trees
+    if mp_context is None:
+        worker_stands = output_dir / "_mc_stands.pkl"
+        worker_trees = output_dir / "_mc_trees.pkl"
+        stands.to_pickle(worker_stands)
+        trees.to_pickle(worker_trees)
+
+    with ProcessPoolExecutor(
+        max_workers=mc_config.n_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(
+            worker_stands,
+            worker_trees,
+            base_config,
+            output_dir,
+            mc_config.batch_id,
+            shared_input_db,
+        ),
+    ) as executor:
         # Submit all runs
         future_to_run = {
-            executor.submit(
-                execute_single_run,
-                sample,
-                stands,
-                trees,
-                base_config,
-                output_dir,
-                mc_config.batch_id,
-            ): sample
+            executor.submit(_execute_run_in_worker, sample): sample
             for sample in samples
         }
 
+        # Results are written by a background thread; this loop only queues
+        # them. Started after submit() so workers are not forked mid-write.
+        result_queue: queue.Queue = queue.Queue()
+        writer_errors: list = []
+        writer = threading.Thread(
+            target=_writer_loop,
+            args=(
+                results_db_path,
+                mc_config.batch_id,
+                result_queue,
+                writer_errors,
+                mc_config.packed_time_series,
+            ),
+            daemon=True,
+        )
+        writer.start()
+
         # Process results as they complete
         for future in as_completed(future_to_run):
             sample = future_to_run[future]
@@ -267,65 +482,36 @@ def run_monte_carlo_batch(
                 if result["success"]:
                     success_count += 1
 
-                    # Update run status
-                    update_run_status(
-                        conn,
-                        mc_config.batch_id,
-                        run_id,
-                        status="complete",
-                    )
-
-                    # Write summary metrics
-                    write_run_summary(
-                        conn,
-                        mc_config.batch_id,
-                        run_id,
-                        result["summary"],
+                    # Status, summary metrics and time series
+                    result_queue.put(
+                        (
+                            "complete",
+                            (run_id, result["summary"], result["time_series"]),
+                        )
                     )
 
-                    # Write time series
-                    if (
-                        result["time_series"] is not None
-                        and len(result["time_series"]) > 0
+                    # Successes only print every progress_every completions
+                    if completed_count % progress_every == 0 or completed_count == len(
+                        samples
                     ):
-                        write_time_series(
-                            conn,
-                            mc_config.batch_id,
-                            run_id,
-                            result["time_series"],
+                        print(
+                            f"[{completed_count}/{len(samples)}] Run {run_id:04d} "
+                            f"✓ - {success_count} successful, {failure_count} failed"
                         )
 
-                    print(
-                        f"[{completed_count}/{len(samples)}] Run {run_id:04d} "
-                        f"✓ - {success_count} successful, {failure_count} failed"
-                    )
-
                 else:
                     failure_count += 1
 
-                    # Update run status
-                    update_run_status(
-                        conn,
-                        mc_config.batch_id,
-                        run_id,
-                        status="failed",
-                    )
-
-                    # Log error
-                    write_batch_error(
-                        conn,
-                        mc_config.batch_id,
-                        run_id,
-                        stand_id=None,
-                        error_type="execution_error",
-                        error_msg=result["error"],
+                    # Update run status and log error
+                    result_queue.put(
+                        ("failed", (run_id, "execution_error", result["error"]))
                     )
 
                     print(
                         f"[{completed_count}/{len(samples)}] Run {run_id:04d} "
-                        f"✗ - {success_count} successful, {failure_count} failed"
+                        f"✗ - {success_count} successful, {failure_count} failed\n"
+                        f"  Error: {result['error']}"
                     )
-                    print(f"  Error: {result['error']}")
 
                 # Call progress callback if provided
                 if progress_callback:
@@ -336,26 +522,23 @@ def run_monte_carlo_batch(
                 completed_count += 1
 
                 # Update status and log error
-                update_run_status(
-                    conn,
-                    mc_config.batch_id,
-                    run_id,
-                    status="failed",
-                )
-                write_batch_error(
-                    conn,
-                    mc_config.batch_id,
-                    run_id,
-                    stand_id=None,
-                    error_type="worker_exception",
-                    error_msg=str(e),
-                )
+                result_queue.put(("failed", (run_id, "worker_exception", str(e))))
 
                 print(
                     f"[{completed_count}/{len(samples)}] Run {run_id:04d} "
-                    f"✗ - {success_count} successful, {failure_count} failed"
+                    f"✗ - {success_count} successful, {failure_count} failed\n"
+                    f"  Exception: {e}"
                 )
-                print(f"  Exception: {e}")
+
+    # Flush the remaining results and stop the writer
+    result_queue.put(None)
+    writer.join()
+    if mp_context is None:
+        worker_stands.unlink(missing_ok=True)
+        worker_trees.unlink(missing_ok=True)
+    if writer_errors:
+        conn.close()
+        raise writer_errors[0]
 
     # Update batch status
     if success_count == len(samples):
@@ -366,6 +549,7 @@ def run_monte_carlo_batch(
         batch_status = "failed"
 
     update_batch_status(conn, mc_config.batch_id, status=batch_status)
+    optimize_mc_database(conn)
 
     # Close database connection
     conn.close()
@@ -10,11 +10,11 @@ CRITICAL: FVS outputs mix per-period flows and pool balances (cumulative).
 See module constants below for field classification.
 """
 
+from collections.abc import Collection
 from typing import Any
 
 import pandas as pd
 
-
 # ============================================================================
 # Field Semantics Constants
 # ============================================================================
@@ -66,21 +66,22 @@ STORED_CARBON_COLS = ["Merch_Carbon_Stored"]  # Pool balance
 # ============================================================================
 
 
-def _find_column(df: pd.DataFrame, candidates: list[str]) -> str | None:
+def _find_column(
+    df: pd.DataFrame | Collection[str], candidates: list[str]
+) -> str | None:
     """
     Find first matching column name from candidates list.
 
     Args:
-        df: DataFrame to search
+        df: DataFrame to search, or a set of its column names when the same
+            frame is searched several times
         candidates: List of possible column names
 
     Returns:
         First matching column name, or None if no match
     """
-    for col in candidates:
-        if col in df.columns:
-            return col
-    return None
+    columns = df.columns if isinstance(df, pd.DataFrame) else df
+    return next((col for col in candidates if col in columns), None)
 
 
 def _validate_time_series(ts: pd.DataFrame) -> None:
@@ -118,7 +119,42 @@ def _validate_time_series(ts: pd.DataFrame) -> None:
 # ============================================================================
 
 
-def extract_run_summary(results: dict[str, Any]) -> dict[str, float | int | None]:
+def combine_results(results: dict[str, Any]) -> pd.DataFrame:
+    """
+    Merge the summary, carbon and canopy tables of a batch into one frame.
+
+    Both extract_run_summary() and extract_time_series() start from this
+    frame; callers that need both can build it once and pass it to each.
+
+    Args:
+        results: Dict returned by run_batch_simulation()
+
+    Returns:
+        Per-stand, per-year DataFrame from summarize_by_year() (empty if the
+        results have no summary data)
+
+    Example:
+        >>> combined = combine_results(results)
+        >>> summary = extract_run_summary(results, combined=combined)
+        >>> ts = extract_time_series(results, combined=combined)
+    """
+    summary_df = results.get("summary_all")
+    if summary_df is None or len(summary_df) == 0:
+        return pd.DataFrame()
+
+    # Import here to avoid circular dependency
+    from ..batch import summarize_by_year
+
+    return summarize_by_year(
+        summary_df,
+        results.get("carbon_all"),
+        results.get("compute_all"),
+    )
+
+
+def extract_run_summary(
+    results: dict[str, Any], combined: pd.DataFrame | None = None
+) -> dict[str, float | int | None]:
     """
     Extract scalar summary metrics from FVS batch results.
 
@@ -135,6 +171,7 @@ def extract_run_summary(results: dict[str, Any]) -> dict[str, float | int | None
             - compute_all: DataFrame with canopy cover (optional)
             - harvest_carbon_all: DataFrame with stored carbon (optional)
             - run_status: DataFrame with success/failure status
+        combined: Frame from combine_results(results), if already built
 
     Returns:
         Dict with keys matching MC_RunSummary columns:
@@ -181,47 +218,52 @@ def extract_run_summary(results: dict[str, Any]) -> dict[str, float | int | None
     if len(summary_df) == 0:
         return output
 
-    # Import here to avoid circular dependency
-    from ..batch import summarize_by_year
-
     # Combine all data sources
-    combined = summarize_by_year(
-        summary_df,
-        results.get("carbon_all"),
-        results.get("compute_all"),
-    )
+    if combined is None:
+        combined = combine_results(results)
 
     if len(combined) == 0:
         return output
 
-    # Find final year
-    final_year = combined["Year"].max()
+    # Several lookups hit the combined frame, so hash its columns once
+    combined_cols = set(combined.columns)
+    live_col = _find_column(combined_cols, CARBON_LIVE_COLS)
+    dead_col = _find_column(combined_cols, CARBON_DEAD_COLS)
+    canopy_col = _find_column(combined_cols, CANOPY_COLS)
+
+    # Per-year means across stands for every pool field in a single groupby
+    # pass (sorted by year, so the last row is the final year)
+    pool_cols = [c for c in (live_col, dead_col, canopy_col) if c]
+    by_year = combined.groupby("Year")[pool_cols].mean()
+    final_year = by_year.index[-1]
+    final_row = by_year.iloc[-1]
+
+    # Stored carbon (POOL BALANCE from separate table), per-year mean. Only
+    # looked up by year, so the groupby skips sorting its keys
+    stored_by_year = None
+    if "harvest_carbon_all" in results and results["harvest_carbon_all"] is not None:
+        hrv_df = results["harvest_carbon_all"]
+        stored_col = _find_column(hrv_df, STORED_CARBON_COLS)
+        if stored_col and len(hrv_df) > 0:
+            stored_by_year = hrv_df.groupby("Year", sort=False)[stored_col].mean()
 
     # Extract carbon metrics (POOL BALANCES - use final year)
-    live_col = _find_column(combined, CARBON_LIVE_COLS)
     if live_col:
-        # Final year: mean across stands
-        final_live = combined[combined["Year"] == final_year][live_col].mean()
+        final_live = final_row[live_col]
         output["final_live_carbon"] = float(final_live) if pd.notna(final_live) else 0.0
 
         # Average over all time
         output["avg_carbon_stock"] = float(combined[live_col].mean())
 
-    dead_col = _find_column(combined, CARBON_DEAD_COLS)
     if dead_col:
-        final_dead = combined[combined["Year"] == final_year][dead_col].mean()
+        final_dead = final_row[dead_col]
         output["final_dead_carbon"] = float(final_dead) if pd.notna(final_dead) else 0.0
 
-    # Stored carbon (POOL BALANCE from separate table)
-    if "harvest_carbon_all" in results and results["harvest_carbon_all"] is not None:
-        hrv_df = results["harvest_carbon_all"]
-        stored_col = _find_column(hrv_df, STORED_CARBON_COLS)
-        if stored_col and len(hrv_df) > 0:
-            # Final year value, mean across stands
-            final_stored = hrv_df[hrv_df["Year"] == final_year][stored_col].mean()
-            output["final_stored_carbon"] = (
-                float(final_stored) if pd.notna(final_stored) else 0.0
-            )
+    if stored_by_year is not None:
+        final_stored = stored_by_year.get(final_year)
+        output["final_stored_carbon"] = (
+            float(final_stored) if pd.notna(final_stored) else 0.0
+        )
 
     # Total carbon (pool balances)
     live = output["final_live_carbon"] or 0.0
@@ -231,31 +273,20 @@ def extract_run_summary(results: dict[str, Any]) -> dict[str, float | int | None
 
     # Update avg_carbon_stock to include dead + stored if available
     if dead_col and live_col:
-        combined["total_c"] = combined[live_col].fillna(0) + combined[dead_col].fillna(
-            0
-        )
-        if stored and "harvest_carbon_all" in results:
-            # Join stored carbon
-            hrv_df = results["harvest_carbon_all"]
-            stored_col = _find_column(hrv_df, STORED_CARBON_COLS)
-            if stored_col:
-                hrv_mean = hrv_df.groupby("Year")[stored_col].mean()
-                combined = combined.merge(
-                    hrv_mean.rename("stored_c"),
-                    left_on="Year",
-                    right_index=True,
-                    how="left",
-                )
-                combined["total_c"] += combined["stored_c"].fillna(0)
-        output["avg_carbon_stock"] = float(combined["total_c"].mean())
+        total_c = combined[live_col].fillna(0).to_numpy(dtype=float) + combined[
+            dead_col
+        ].fillna(0).to_numpy(dtype=float)
+        if stored and stored_by_year is not None:
+            # Per-row stored carbon = that year's mean across stands
+            total_c += (
+                combined["Year"].map(stored_by_year).fillna(0).to_numpy(dtype=float)
+            )
+        output["avg_carbon_stock"] = float(total_c.mean())
 
-    # Canopy cover (POOL BALANCE - use min and final)
-    canopy_col = _find_column(combined, CANOPY_COLS)
+    # Canopy cover (POOL BALANCE - use min and final of per-year means)
     if canopy_col:
-        # Group by year first, then compute stats
-        canopy_by_year = combined.groupby("Year")[canopy_col].mean()
-        output["min_canopy_cover"] = float(canopy_by_year.min())
-        output["final_canopy_cover"] = float(canopy_by_year.iloc[-1])
+        output["min_canopy_cover"] = float(by_year[canopy_col].min())
+        output["final_canopy_cover"] = float(final_row[canopy_col])
 
     # Harvest (FLOW FIELD - average across stands per year, then sum across years)
     harvest_col = _find_column(summary_df, HARVEST_FLOW_COLS)
@@ -270,7 +301,9 @@ def extract_run_summary(results: dict[str, Any]) -> dict[str, float | int | None
     return output
 
 
-def extract_time_series(results: dict[str, Any]) -> pd.DataFrame:
+def extract_time_series(
+    results: dict[str, Any], combined: pd.DataFrame | None = None
+) -> pd.DataFrame:
     """
     Extract per-year time series from FVS batch results.
 
@@ -282,6 +315,7 @@ def extract_time_series(results: dict[str, Any]) -> pd.DataFrame:
 
     Args:
         results: Dict returned by run_batch_simulation()
+        combined: Frame from combine_results(results), if already built
 
     Returns:
         DataFrame with columns matching MC_TimeSeries schema:
@@ -313,63 +347,56 @@ def extract_time_series(results: dict[str, Any]) -> pd.DataFrame:
     if len(summary_df) == 0:
         return pd.DataFrame()
 
-    # Import here to avoid circular dependency
-    from ..batch import summarize_by_year
-
     # Combine all data sources
-    combined = summarize_by_year(
-        summary_df,
-        results.get("carbon_all"),
-        results.get("compute_all"),
-    )
+    if combined is None:
+        combined = combine_results(results)
 
     if len(combined) == 0:
         return pd.DataFrame()
 
-    # Group by year and compute means (pool balances)
-    # Build agg dict with only present columns
-    agg_dict = {}
-    if "BA" in combined.columns:
-        agg_dict["BA"] = "mean"
-    if "Tpa" in combined.columns:
-        agg_dict["Tpa"] = "mean"
+    # Several lookups hit the combined frame, so hash its columns once
+    combined_cols = set(combined.columns)
+    live_col = _find_column(combined_cols, CARBON_LIVE_COLS)
+    dead_col = _find_column(combined_cols, CARBON_DEAD_COLS)
+    canopy_col = _find_column(combined_cols, CANOPY_COLS)
+
+    # Per-year means across stands (pool balances) for every present column in
+    # a single groupby pass, renamed to the schema names
+    pool_cols = {
+        "BA": "ba",
+        "Tpa": "tpa",
+        live_col: "aboveground_c_live",
+        dead_col: "standing_dead_c",
+        canopy_col: "canopy_cover_pct",
+    }
+    pool_cols = {col: name for col, name in pool_cols.items() if col in combined_cols}
 
-    if agg_dict:
-        ts = combined.groupby("Year").agg(agg_dict).reset_index()
+    if pool_cols:
+        by_year = (
+            combined.groupby("Year", sort=True)
+            .agg(dict.fromkeys(pool_cols, "mean"))
+            .rename(columns=pool_cols)
+        )
     else:
-        # No BA/Tpa, just get years
-        ts = pd.DataFrame({"Year": sorted(combined["Year"].unique())})
-
-    # Rename to match schema
-    rename_map = {"Year": "year"}
-    if "BA" in ts.columns:
-        rename_map["BA"] = "ba"
-    if "Tpa" in ts.columns:
-        rename_map["Tpa"] = "tpa"
-    ts = ts.rename(columns=rename_map)
-
-    # Add carbon (POOL BALANCES)
-    live_col = _find_column(combined, CARBON_LIVE_COLS)
-    if live_col:
-        ts["aboveground_c_live"] = combined.groupby("Year")[live_col].mean().values
+        # No pool columns, just get years
+        by_year = pd.DataFrame(index=pd.Index(sorted(combined["Year"].unique())))
+    by_year.index.name = "year"
 
-    dead_col = _find_column(combined, CARBON_DEAD_COLS)
-    if dead_col:
-        ts["standing_dead_c"] = combined.groupby("Year")[dead_col].mean().values
+    # Canopy cover is appended after total carbon below; by_year.index stays
+    # aligned with ts rows for the per-year series added from other tables
+    ts = by_year.drop(columns="canopy_cover_pct", errors="ignore").reset_index()
 
-    # Add stored carbon (POOL BALANCE from separate table)
+    # Add stored carbon (POOL BALANCE from separate table). The per-year
+    # series here and for harvest are reindexed onto ts, so their groupbys
+    # skip sorting
     if "harvest_carbon_all" in results and results["harvest_carbon_all"] is not None:
         hrv_df = results["harvest_carbon_all"]
         stored_col = _find_column(hrv_df, STORED_CARBON_COLS)
         if stored_col:
-            stored_by_year = hrv_df.groupby("Year")[stored_col].mean()
-            ts = ts.merge(
-                stored_by_year.rename("merch_carbon_stored"),
-                left_on="year",
-                right_index=True,
-                how="left",
+            stored_by_year = hrv_df.groupby("Year", sort=False)[stored_col].mean()
+            ts["merch_carbon_stored"] = (
+                stored_by_year.reindex(by_year.index).fillna(0).to_numpy()
             )
-            ts["merch_carbon_stored"] = ts["merch_carbon_stored"].fillna(0)
 
     # Total carbon (handle missing columns)
     live_c = (
@@ -384,22 +411,15 @@ def extract_time_series(results: dict[str, Any]) -> pd.DataFrame:
     ts["total_carbon"] = live_c + dead_c + stored_c
 
     # Add canopy cover (POOL BALANCE)
-    canopy_col = _find_column(combined, CANOPY_COLS)
-    if canopy_col:
-        ts["canopy_cover_pct"] = combined.groupby("Year")[canopy_col].mean().values
+    if "canopy_cover_pct" in by_year.columns:
+        ts["canopy_cover_pct"] = by_year["canopy_cover_pct"].to_numpy()
 
     # Add harvest (FLOW FIELD - per-period, then cumsum)
     harvest_col = _find_column(summary_df, HARVEST_FLOW_COLS)
     if harvest_col:
         # Mean across stands for each year (per-period flow)
-        harvest_by_year = summary_df.groupby("Year")[harvest_col].mean()
-        ts = ts.merge(
-            harvest_by_year.rename("harvest_bdft"),
-            left_on="year",
-            right_index=True,
-            how="left",
-        )
-        ts["harvest_bdft"] = ts["harvest_bdft"].fillna(0)
+        harvest_by_year = summary_df.groupby("Year", sort=False)[harvest_col].mean()
+        ts["harvest_bdft"] = harvest_by_year.reindex(by_year.index).fillna(0).to_numpy()
 
         # Cumulative is computed AFTER averaging (monotonically increasing)
         ts["cumulative_harvest"] = ts["harvest_bdft"].cumsum()
@@ -2,12 +2,13 @@
 Parameter sampling for Monte Carlo simulations.
 
 Provides deterministic sampling from parameter specifications using
-a seeded random number generator for reproducibility.
+a seeded NumPy random generator for reproducibility.
 """
 
-import random
 from typing import Any
 
+import numpy as np
+
 from .config import (
     BooleanParameterSpec,
     DiscreteUniformSpec,
@@ -17,25 +18,67 @@ from .config import (
 )
 
 
-def _sample_parameter(spec: ParameterSpec, rng: random.Random) -> Any:
+def _sample_columns(
+    specs: list[ParameterSpec], n_samples: int, rng: np.random.Generator
+) -> dict[str, list[Any]]:
+    """
+    Sample every parameter for all runs at once.
+
+    All UniformParameterSpec columns are drawn with a single broadcast
+    rng.uniform call; boolean and discrete specs are drawn one column each.
+
+    Args:
+        specs: Parameter specifications defining the distributions
+        n_samples: Number of values to draw per parameter
+        rng: NumPy random generator (must be seeded for reproducibility)
+
+    Returns:
+        Dictionary mapping parameter name to a list of native Python values
+        (float, bool, or int depending on spec type)
     """
-    Sample a single value from a parameter specification.
+    columns = {}
+
+    uniform_specs = [s for s in specs if isinstance(s, UniformParameterSpec)]
+    if uniform_specs:
+        lo = np.array([s.min_value for s in uniform_specs], dtype=float)
+        hi = np.array([s.max_value for s in uniform_specs], dtype=float)
+        values = rng.uniform(lo, hi, size=(n_samples, len(uniform_specs)))
+        for j, spec in enumerate(uniform_specs):
+            columns[spec.name] = values[:, j].tolist()
+
+    for spec in specs:
+        if isinstance(spec, UniformParameterSpec):
+            continue
+        elif isinstance(spec, BooleanParameterSpec):
+            columns[spec.name] = (
+                rng.random(n_samples) < spec.probability_true
+            ).tolist()
+        elif isinstance(spec, DiscreteUniformSpec):
+            columns[spec.name] = rng.integers(
+                spec.min_value, spec.max_value, size=n_samples, endpoint=True
+            ).tolist()
+        else:
+            raise TypeError(f"Unknown parameter spec type: {type(spec)}")
+
+    return columns
+
+
+def _spawn_run_seeds(batch_seed: int, n_samples: int) -> list[int]:
+    """
+    Derive per-run seeds from child SeedSequences of the batch seed.
+
+    Each run gets SeedSequence(batch_seed).spawn(n_samples)[run_id], whose
+    state is mapped into the 1-99999 range FVS accepts for its random seed.
 
     Args:
-        spec: Parameter specification defining the distribution
-        rng: Random number generator (must be seeded for reproducibility)
+        batch_seed: Master seed for the batch
+        n_samples: Number of runs
 
     Returns:
-        Sampled value (float, bool, or int depending on spec type)
+        List of run seeds (native ints), one per run_id
     """
-    if isinstance(spec, UniformParameterSpec):
-        return rng.uniform(spec.min_value, spec.max_value)
-    elif isinstance(spec, BooleanParameterSpec):
-        return rng.random() < spec.probability_true
-    elif isinstance(spec, DiscreteUniformSpec):
-        return rng.randint(spec.min_value, spec.max_value)
-    else:
-        raise TypeError(f"Unknown parameter spec type: {type(spec)}")
+    children = np.random.SeedSequence(batch_seed).spawn(n_samples)
+    return [int(child.generate_state(1)[0] % 99999) + 1 for child in children]
 
 
 def generate_parameter_samples(config: MonteCarloConfig) -> list[dict]:
@@ -77,24 +120,23 @@ def generate_parameter_samples(config: MonteCarloConfig) -> list[dict]:
         dict_keys(['run_id', 'run_seed', 'thin_q_factor', 'enable_calibration'])
     """
     # Initialize RNG with batch seed for reproducibility
-    rng = random.Random(config.batch_seed)
+    rng = np.random.default_rng(config.batch_seed)
 
-    samples = []
-    for run_id in range(config.n_samples):
-        # Generate a unique seed for this run
-        # Use a large random integer to avoid seed collisions
-        run_seed = rng.randint(1, 99999)
+    # Derive each run's seed from its own child SeedSequence (independent
+    # streams, stable per run_id regardless of n_samples or parameter specs)
+    run_seeds = _spawn_run_seeds(config.batch_seed, config.n_samples)
+
+    # Draw all parameter values column-wise, then assemble per-run dicts
+    columns = _sample_columns(config.parameter_specs, config.n_samples, rng)
 
-        # Build sample dict starting with metadata
+    samples = []
+    for run_id, run_seed in enumerate(run_seeds):
         sample = {
             "run_id": run_id,
             "run_seed": run_seed,
         }
-
-        # Sample each parameter
         for spec in config.parameter_specs:
-            sample[spec.name] = _sample_parameter(spec, rng)
-
+            sample[spec.name] = columns[spec.name][run_id]
         samples.append(sample)
 
     return samples
@@ -5,11 +5,39 @@ Extracts data from FVS SQLite output databases.
 """
 
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import pandas as pd
 
 
+@contextmanager
+def _open_db(
+    db: Path | str | sqlite3.Connection,
+) -> Iterator[sqlite3.Connection | None]:
+    """
+    Yield a connection for a database path or an already-open connection.
+
+    Connections passed in are reused and left open for the caller; paths are
+    opened here and closed on exit. Yields None if the path doesn't exist.
+    """
+    if isinstance(db, sqlite3.Connection):
+        yield db
+        return
+
+    db_path = Path(db)
+    if not db_path.exists():
+        yield None
+        return
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
 def parse_fvs_db(db_path: Path | str) -> dict[str, pd.DataFrame]:
     """
     Parse FVS output database and extract all tables.
@@ -62,7 +90,7 @@ def parse_fvs_db(db_path: Path | str) -> dict[str, pd.DataFrame]:
 
 
 def get_summary_table(
-    db_path: Path | str, max_year: int | None = None
+    db_path: Path | str | sqlite3.Connection, max_year: int | None = None
 ) -> pd.DataFrame | None:
     """
     Extract FVS summary table from database.
@@ -71,79 +99,68 @@ def get_summary_table(
     Falls back to FVS_Summary if FVS_Summary2 doesn't exist.
 
     Args:
-        db_path: Path to FVSOut.db
+        db_path: Path to FVSOut.db, or an open connection to it
         max_year: If provided, filter to Year <= max_year
 
     Returns:
         DataFrame with summary statistics, or None if table doesn't exist
     """
-    db_path = Path(db_path)
-
-    if not db_path.exists():
-        return None
-
-    conn = sqlite3.connect(str(db_path))
-
-    try:
-        # Prefer FVS_Summary2 which has correct growth projections
-        # FVS_Summary shows "after treatment" values which can be misleading
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='FVS_Summary2'"
-        )
-        if cursor.fetchone():
-            df = pd.read_sql_query("SELECT * FROM FVS_Summary2", conn)
-        else:
-            df = pd.read_sql_query("SELECT * FROM FVS_Summary", conn)
-
-        # Remove duplicate rows (can occur from multiple runs or append mode)
-        if df is not None and len(df) > 0:
-            df = df.drop_duplicates()
-            # Filter to max_year if specified (for extra-cycle trimming)
-            if max_year is not None and "Year" in df.columns:
-                df = df[df["Year"] <= max_year]
-
-        return df
-    except Exception:
-        return None
-    finally:
-        conn.close()
+    with _open_db(db_path) as conn:
+        if conn is None:
+            return None
+        try:
+            # Prefer FVS_Summary2 which has correct growth projections
+            # FVS_Summary shows "after treatment" values which can be misleading
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name='FVS_Summary2'"
+            )
+            if cursor.fetchone():
+                df = pd.read_sql_query("SELECT * FROM FVS_Summary2", conn)
+            else:
+                df = pd.read_sql_query("SELECT * FROM FVS_Summary", conn)
+
+            # Remove duplicate rows (can occur from multiple runs or append mode)
+            if df is not None and len(df) > 0:
+                df = df.drop_duplicates()
+                # Filter to max_year if specified (for extra-cycle trimming)
+                if max_year is not None and "Year" in df.columns:
+                    df = df[df["Year"] <= max_year]
+
+            return df
+        except Exception:
+            return None
 
 
 def get_carbon_table(
-    db_path: Path | str, max_year: int | None = None
+    db_path: Path | str | sqlite3.Connection, max_year: int | None = None
 ) -> pd.DataFrame | None:
     """
     Extract FVS_Carbon table from database.
 
     Args:
-        db_path: Path to FVSOut.db
+        db_path: Path to FVSOut.db, or an open connection to it
         max_year: If provided, filter to Year <= max_year
 
     Returns:
         DataFrame with carbon pools, or None if table doesn't exist
     """
-    db_path = Path(db_path)
-
-    if not db_path.exists():
-        return None
-
-    conn = sqlite3.connect(str(db_path))
-
-    try:
-        df = pd.read_sql_query("SELECT * FROM FVS_Carbon", conn)
-        # Filter to max_year if specified (for extra-cycle trimming)
-        if df is not None and max_year is not None and "Year" in df.columns:
-            df = df[df["Year"] <= max_year]
-        return df
-    except Exception:
-        return None
-    finally:
-        conn.close()
+    with _open_db(db_path) as conn:
+        if conn is None:
+            return None
+        try:
+            df = pd.read_sql_query("SELECT * FROM FVS_Carbon", conn)
+            # Filter to max_year if specified (for extra-cycle trimming)
+            if df is not None and max_year is not None and "Year" in df.columns:
+                df = df[df["Year"] <= max_year]
+            return df
+        except Exception:
+            return None
 
 
 def get_harvest_carbon_table(
-    db_path: Path | str, max_year: int | None = None
+    db_path: Path | str | sqlite3.Connection, max_year: int | None = None
 ) -> pd.DataFrame | None:
     """
     Extract FVS_Hrv_Carbon table from database.
@@ -152,7 +169,7 @@ def get_harvest_carbon_table(
     which represents long-term off-site carbon storage.
 
     Args:
-        db_path: Path to FVSOut.db
+        db_path: Path to FVSOut.db, or an open connection to it
         max_year: If provided, filter to Year <= max_year
 
     Returns:
@@ -161,102 +178,109 @@ def get_harvest_carbon_table(
         - Merch_Carbon_Stored: Carbon in merchantable wood products (tons/ac)
         - Merch_Carbon_Removed: Total carbon removed in harvest
     """
-    db_path = Path(db_path)
-
-    if not db_path.exists():
-        return None
-
-    conn = sqlite3.connect(str(db_path))
-
-    try:
-        df = pd.read_sql_query("SELECT * FROM FVS_Hrv_Carbon", conn)
-        # Filter to max_year if specified
-        if df is not None and max_year is not None and "Year" in df.columns:
-            df = df[df["Year"] <= max_year]
-        return df
-    except Exception:
-        return None
-    finally:
-        conn.close()
+    with _open_db(db_path) as conn:
+        if conn is None:
+            return None
+        try:
+            df = pd.read_sql_query("SELECT * FROM FVS_Hrv_Carbon", conn)
+            # Filter to max_year if specified
+            if df is not None and max_year is not None and "Year" in df.columns:
+                df = df[df["Year"] <= max_year]
+            return df
+        except Exception:
+            return None
 
 
 def get_compute_table(
-    db_path: Path | str, max_year: int | None = None
+    db_path: Path | str | sqlite3.Connection, max_year: int | None = None
 ) -> pd.DataFrame | None:
     """
     Extract FVS_Compute table from database.
 
     Args:
-        db_path: Path to FVSOut.db
+        db_path: Path to FVSOut.db, or an open connection to it
         max_year: If provided, filter to Year <= max_year
 
     Returns:
         DataFrame with computed variables, or None if table doesn't exist
     """
-    db_path = Path(db_path)
-
-    if not db_path.exists():
-        return None
-
-    conn = sqlite3.connect(str(db_path))
-
-    try:
-        df = pd.read_sql_query("SELECT * FROM FVS_Compute", conn)
-        # Filter to max_year if specified (for extra-cycle trimming)
-        if df is not None and max_year is not None and "Year" in df.columns:
-            df = df[df["Year"] <= max_year]
-        return df
-    except Exception:
-        return None
-    finally:
-        conn.close()
+    with _open_db(db_path) as conn:
+        if conn is None:
+            return None
+        try:
+            df = pd.read_sql_query("SELECT * FROM FVS_Compute", conn)
+            # Filter to max_year if specified (for extra-cycle trimming)
+            if df is not None and max_year is not None and "Year" in df.columns:
+                df = df[df["Year"] <= max_year]
+            return df
+        except Exception:
+            return None
 
 
-def extract_calibration_stats(db_path: Path | str) -> pd.DataFrame | None:
+def extract_calibration_stats(
+    db_path: Path | str | sqlite3.Connection,
+) -> pd.DataFrame | None:
     """
     Extract calibration statistics from FVS output.
 
     Calibration stats are in the FVS_CalibStats table.
 
     Args:
-        db_path: Path to FVSOut.db (or working directory)
+        db_path: Path to FVSOut.db (or working directory), or an open
+                 connection to it
 
     Returns:
         DataFrame with calibration statistics, or None if not available
     """
-    db_path = Path(db_path)
-
-    # If db_path is a directory, look for database in it
-    if db_path.is_dir():
-        db_path = db_path / "FVSOut.db"
+    if not isinstance(db_path, sqlite3.Connection):
+        db_path = Path(db_path)
 
-    if not db_path.exists():
-        return None
-
-    conn = sqlite3.connect(str(db_path))
+        # If db_path is a directory, look for database in it
+        if db_path.is_dir():
+            db_path = db_path / "FVSOut.db"
 
-    try:
-        # Try to get calibration stats table
-        # Note: Table name is usually FVS_CalibStats
+    with _open_db(db_path) as conn:
+        if conn is None:
+            return None
         try:
-            df = pd.read_sql_query("SELECT * FROM FVS_CalibStats", conn)
-        except Exception:
-            # Fallback or try other names
+            # Try to get calibration stats table
+            # Note: Table name is usually FVS_CalibStats
             try:
-                df = pd.read_sql_query("SELECT * FROM FVS_CalibrationStats", conn)
+                df = pd.read_sql_query("SELECT * FROM FVS_CalibStats", conn)
             except Exception:
+                # Fallback or try other names
+                try:
+                    df = pd.read_sql_query("SELECT * FROM FVS_CalibrationStats", conn)
+                except Exception:
+                    return None
+
+            if df.empty:
                 return None
 
-        if df.empty:
+            return df
+
+        except Exception:
             return None
 
-        return df
 
-    except Exception:
-        return None
+def find_calibration_tables(conn: sqlite3.Connection) -> list[str]:
+    """
+    List calibration tables in an open FVS output database.
 
-    finally:
-        conn.close()
+    Matching is done by SQLite (case-insensitive LIKE on the table name), so
+    FVS_CalibStats, FVS_CalibrationStats, etc. are all found.
+
+    Args:
+        conn: Connection to FVSOut.db
+
+    Returns:
+        Names of tables whose name contains "calib" (any case)
+    """
+    cursor = conn.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'table' AND name LIKE '%calib%' ORDER BY name"
+    )
+    return [name for (name,) in cursor]
 
 
 def summarize_by_year(
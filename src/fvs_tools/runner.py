@@ -4,6 +4,7 @@ FVS execution wrapper.
 Handles running the FVS binary and capturing outputs.
 """
 
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -26,7 +27,8 @@ def run_fvs(
         working_dir: Directory to run FVS in (outputs will be written here)
         fvs_binary: Path to FVS executable
         timeout: Maximum execution time in seconds
-        input_database: Path to FVS input database (FVS_Data.db) to copy to working_dir
+        input_database: Path to FVS input database (FVS_Data.db) to link (or
+                        copy) into working_dir
 
     Returns:
         Dictionary with:
@@ -53,14 +55,14 @@ def run_fvs(
     if not working_dir.exists():
         working_dir.mkdir(parents=True, exist_ok=True)
 
-    # Copy input database if provided
+    # Place input database in the working directory if provided
     if input_database is not None:
         input_database = Path(input_database)
         if not input_database.exists():
             raise FileNotFoundError(f"Input database not found: {input_database}")
 
         target_db = working_dir / input_database.name
-        shutil.copy2(input_database, target_db)
+        _link_or_copy(input_database, target_db)
 
     # FVS expects the keyword filename (not full path) on stdin
     keyword_filename = keyword_file.name
@@ -76,37 +78,60 @@ def run_fvs(
     # if db_file.exists():
     #     db_file.unlink()
 
-    # Run FVS
-    result = subprocess.run(
-        [str(fvs_binary)],
-        input=keyword_filename,
-        capture_output=True,
-        text=True,
-        cwd=working_dir,
-        timeout=timeout,
-    )
-
-    # Save stdout and stderr to files in working directory
-    (working_dir / "fvs.out").write_text(result.stdout)
-    (working_dir / "fvs.err").write_text(result.stderr)
+    # Run FVS, streaming stdout/stderr straight into files in the working
+    # directory instead of piping them through Python and writing them back.
+    # close_fds=False skips the child's fd-closing sweep; Python's own fds are
+    # already non-inheritable (PEP 446) so nothing leaks into FVS.
+    stdout_path = working_dir / "fvs.out"
+    stderr_path = working_dir / "fvs.err"
+    with open(stdout_path, "wb") as stdout_f, open(stderr_path, "wb") as stderr_f:
+        result = subprocess.run(
+            [str(fvs_binary.resolve())],
+            input=keyword_filename.encode(),
+            stdout=stdout_f,
+            stderr=stderr_f,
+            cwd=working_dir,
+            timeout=timeout,
+            close_fds=False,
+        )
+
+    stdout = stdout_path.read_text()
+    stderr = stderr_path.read_text()
 
     # FVS returns exit code 20 for successful completion and writes "STOP 20" to stderr
     # STOP 10 means completed with warnings (benign SDI adjustments, etc.) - also success
     # Check for these patterns rather than relying on exit code == 0
-    fvs_success = (
-        "STOP 20" in result.stderr
-        or "STOP 10" in result.stderr
-        or result.returncode == 0
-    )
+    fvs_success = "STOP 20" in stderr or "STOP 10" in stderr or result.returncode == 0
 
     return {
         "exit_code": result.returncode,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
+        "stdout": stdout,
+        "stderr": stderr,
         "success": fvs_success,
     }
 
 
+def _link_or_copy(source: Path, target: Path) -> None:
+    """
+    Hard-link source to target, copying instead if linking is not possible.
+
+    FVS only reads its DSNIn database, so every stand of a batch can use the
+    same file: a hard link costs no bytes or I/O, and concurrent FVS
+    processes then share one set of cached pages instead of each reading its
+    own copy. Falls back to a copy across filesystems (or where hard links
+    are unsupported).
+    """
+    # Already linked (e.g. a rerun in the same directory)
+    if target.exists() and target.samefile(source):
+        return
+    target.unlink(missing_ok=True)
+
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
 def check_fvs_errors(working_dir: Path | str) -> list[str]:
     """
     Check FVS error file for warnings/errors.
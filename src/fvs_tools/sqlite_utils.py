@@ -0,0 +1,140 @@
+"""
+SQLite connection helpers.
+
+Centralizes the PRAGMA settings used when opening FVS input/output databases
+and Monte Carlo result databases so every caller gets the same tuning.
+"""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import quote
+
+# Applied to read-write connections: WAL lets readers proceed while a single
+# writer commits, and synchronous=NORMAL drops the per-commit fsync that
+# rollback-journal mode requires. Checkpointing every 1000 pages (SQLite's
+# default, made explicit) keeps the -wal file from growing into a slow commit.
+WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+# Applied to read-only connections (journal/sync settings require write access)
+READ_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+# Applied to scratch databases that are rewritten every batch and simply
+# regenerated after a crash (e.g. batch_registry.db): no fsync, rollback
+# journal kept in memory, and the file lock held for the connection lifetime.
+SCRATCH_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
+)
+
+
+def open_sqlite(
+    path: Path | str,
+    *,
+    read_only: bool = False,
+    immutable: bool = False,
+    scratch: bool = False,
+) -> sqlite3.Connection:
+    """
+    Open a SQLite database with the project's standard PRAGMA settings.
+
+    Args:
+        path: Path to SQLite database file (":memory:" for an in-memory one)
+        read_only: If True, open via URI with mode=ro (no write locks taken)
+        immutable: If True (read-only only), also set immutable=1 so SQLite
+                   skips locking and journal recovery entirely. Only safe for
+                   files that no other process is writing.
+        scratch: If True (read-write only), use SCRATCH_PRAGMAS instead of
+                 WAL. Only for files that can be regenerated if the process
+                 dies mid-write; other connections are locked out until close.
+
+    Returns:
+        Open connection to the database
+
+    Example:
+        >>> conn = open_sqlite("outputs/run/CARB_99/FVSOut.db", read_only=True)
+        >>> tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        >>> conn.close()
+    """
+    path = Path(path)
+
+    if read_only:
+        uri = f"file:{quote(path.resolve().as_posix())}?mode=ro"
+        if immutable:
+            uri += "&immutable=1"
+        conn = sqlite3.connect(uri, uri=True)
+        pragmas = READ_PRAGMAS
+    else:
+        conn = sqlite3.connect(path)
+        pragmas = SCRATCH_PRAGMAS if scratch else WRITE_PRAGMAS
+
+    for pragma in pragmas:
+        conn.execute(pragma)
+
+    # WAL needs shared memory, which some filesystems refuse; SQLite then
+    # silently keeps the rollback journal, so fall back to an in-memory one
+    if pragmas is WRITE_PRAGMAS:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if journal_mode not in ("wal", "memory"):
+            conn.execute("PRAGMA journal_mode=MEMORY")
+
+    return conn
+
+
+@contextmanager
+def bulk_load_mode(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Temporarily disable journaling and fsync for a bulk insert.
+
+    Intended for freshly created databases that would simply be rebuilt if
+    the process died mid-load: inside the block the connection runs with
+    journal_mode=OFF, synchronous=OFF and foreign_keys=OFF. The previous
+    settings (e.g. WAL / NORMAL) are restored on exit.
+
+    Writes inside the block cannot be rolled back reliably, so callers should
+    use plain INSERTs of rows that are unique by construction.
+
+    Args:
+        conn: Read-write connection with no open transaction
+
+    Yields:
+        The same connection
+
+    Example:
+        >>> conn = open_sqlite("mc_results.db")
+        >>> with bulk_load_mode(conn):
+        ...     conn.executemany("INSERT INTO t VALUES (?)", rows)
+        ...     conn.commit()
+    """
+    conn.commit()
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA foreign_keys=OFF")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+        conn.execute(f"PRAGMA foreign_keys={foreign_keys}")
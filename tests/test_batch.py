@@ -0,0 +1,73 @@
+"""
+Unit tests for the batch run registry.
+"""
+
+import json
+import sqlite3
+
+from fvs_tools.batch import (
+    _registry_record,
+    _write_batch_registry,
+    decode_registry_errors,
+)
+
+CONFIG_FIELDS = ("harv1", 100, 10, 2.0, 70.0, 100.0, None, None, 500.0)
+
+
+def _read_error_messages(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT error_message FROM run_registry ORDER BY batch_id, run_index"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestBatchRegistry:
+    def test_failed_run_errors_stored_as_json(self, tmp_path):
+        """A failed run's error list round-trips through the registry as JSON."""
+        errors = ["FVS error 123; see FVSOut.out", 'Missing "Stop" keyword']
+        records = [
+            _registry_record(
+                CONFIG_FIELDS, "b1", 0, "CARB_99", tmp_path, False, errors, "t0"
+            ),
+            _registry_record(
+                CONFIG_FIELDS, "b1", 1, "CARB_100", tmp_path, True, None, "t0"
+            ),
+        ]
+
+        db_path = _write_batch_registry(tmp_path, "b1", records)
+
+        (failed,), (succeeded,) = _read_error_messages(db_path)
+        assert json.loads(failed) == errors
+        assert succeeded is None
+        assert decode_registry_errors(failed) == errors
+
+    def test_legacy_rows_in_same_table(self, tmp_path):
+        """Rows appended to a registry with "; "-joined errors still decode."""
+        records = [
+            _registry_record(
+                CONFIG_FIELDS, "b2", 0, "CARB_99", tmp_path, False, ["e1"], "t1"
+            )
+        ]
+        db_path = _write_batch_registry(tmp_path, "b2", records)
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute(
+                "INSERT INTO run_registry (batch_id, run_index, error_message) "
+                "VALUES ('b1', 0, 'FVS error 123; No output')"
+            )
+        conn.close()
+
+        decoded = [
+            decode_registry_errors(row[0]) for row in _read_error_messages(db_path)
+        ]
+
+        assert decoded == [["FVS error 123", "No output"], ["e1"]]
+
+    def test_decode_empty_and_plain_messages(self):
+        """Successful runs decode to no errors; plain messages to one."""
+        assert decode_registry_errors(None) == []
+        assert decode_registry_errors("") == []
+        assert decode_registry_errors("Timed out") == ["Timed out"]
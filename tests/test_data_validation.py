@@ -2,10 +2,22 @@
 Tests for stand/tree data validation functions.
 """
 
+import os
+
 import pandas as pd
+import pytest
 
+from fvs_tools import data_loader
 from fvs_tools.data_loader import (
+    CACHE_KEY_METADATA,
+    HAS_PYARROW,
+    build_stand_index,
+    filter_by_plot_ids,
     get_carbon_plot_ids,
+    get_stand_trees,
+    load_and_validate,
+    load_stands,
+    load_trees,
     print_validation_report,
     validate_stands,
 )
@@ -233,6 +245,219 @@ class TestPrintValidationReport:
         assert "no trees" not in captured.out
 
 
+class TestGetStandTrees:
+    """Tests for get_stand_trees with and without a stand index."""
+
+    def test_index_matches_scan(self):
+        """Lookups through build_stand_index match the DataFrame scan."""
+        trees = pd.DataFrame(
+            {"STAND_ID": ["A", "B", "A", "C"], "DIAMETER": [1.0, 2.0, 3.0, 4.0]}
+        )
+
+        stand_index = build_stand_index(trees)
+
+        for stand_id in ["A", "B", "C"]:
+            pd.testing.assert_frame_equal(
+                get_stand_trees(stand_id, stand_index),
+                get_stand_trees(stand_id, trees),
+            )
+
+    def test_index_missing_stand_raises(self):
+        """Unknown stands raise ValueError for the indexed lookup too."""
+        trees = pd.DataFrame({"STAND_ID": ["A"], "DIAMETER": [1.0]})
+
+        with pytest.raises(ValueError, match="No trees found for stand: Z"):
+            get_stand_trees("Z", build_stand_index(trees))
+
+
+class TestCsvCache:
+    """Tests for the sidecar cache used by load_stands/load_trees."""
+
+    def _sidecar(self, csv_path):
+        return csv_path.with_name(
+            csv_path.name + (".parquet" if HAS_PYARROW else ".pkl")
+        )
+
+    def _write_trees(self, path, diameters):
+        pd.DataFrame(
+            {
+                "STAND_ID": ["CARB_1"] * len(diameters),
+                "PLOT_ID": [1] * len(diameters),
+                "TREE_ID": list(range(1, len(diameters) + 1)),
+                "SPECIES": [202] * len(diameters),
+                "DIAMETER": diameters,
+            }
+        ).to_csv(path, index=False)
+
+    def test_cache_written_and_reused(self, tmp_path):
+        """First load writes the sidecar; second load returns equal data."""
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0, 7.5])
+
+        first = load_trees(csv_path)
+        assert self._sidecar(csv_path).exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+        second = load_trees(csv_path)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_stale_cache_ignored(self, tmp_path):
+        """A CSV newer than its sidecar is re-parsed."""
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0])
+        load_trees(csv_path)
+
+        self._write_trees(csv_path, [5.0, 9.0, 12.0])
+        cache_mtime = self._sidecar(csv_path).stat().st_mtime
+        os.utime(csv_path, (cache_mtime + 10, cache_mtime + 10))
+
+        assert len(load_trees(csv_path)) == 3
+
+    def test_replaced_csv_with_older_mtime_reparsed(self, tmp_path):
+        """A CSV swapped in with a preserved, older mtime is re-parsed."""
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0])
+        old_mtime = csv_path.stat().st_mtime
+        load_trees(csv_path)
+
+        # As left behind by cp -p / rsync -a: new contents, older mtime
+        self._write_trees(csv_path, [5.0, 9.0, 12.0])
+        os.utime(csv_path, (old_mtime - 100, old_mtime - 100))
+
+        assert len(load_trees(csv_path)) == 3
+
+    def test_corrupt_sidecar_reparsed(self, tmp_path):
+        """A truncated sidecar is treated as a cache miss and rewritten."""
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0, 7.5])
+        expected = load_trees(csv_path)
+        cache_path = self._sidecar(csv_path)
+        cache_path.write_bytes(cache_path.read_bytes()[:20])
+
+        pd.testing.assert_frame_equal(load_trees(csv_path), expected)
+        pd.testing.assert_frame_equal(load_trees(csv_path), expected)
+
+    def test_failed_sidecar_write_leaves_no_files(self, tmp_path, monkeypatch):
+        """If the sidecar cannot be moved into place, no partial file remains."""
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0, 7.5])
+
+        def fail_replace(src, dst):
+            raise OSError("simulated interrupted write")
+
+        monkeypatch.setattr(data_loader.os, "replace", fail_replace)
+        df = load_trees(csv_path)
+
+        assert len(df) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["trees.csv"]
+
+    def test_column_set_change_reparsed(self, tmp_path):
+        """A sidecar parsed for a different column set is not reused."""
+        from fvs_tools.data_loader import _read_csv_cached
+
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0, 7.5])
+        _read_csv_cached(csv_path, frozenset({"STAND_ID", "DIAMETER"}))
+
+        df = _read_csv_cached(csv_path, frozenset({"STAND_ID", "DIAMETER", "SPECIES"}))
+
+        assert list(df.columns) == ["STAND_ID", "SPECIES", "DIAMETER"]
+
+    def test_cache_disabled(self, tmp_path):
+        """use_cache=False never writes a sidecar."""
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0])
+
+        load_trees(csv_path, use_cache=False)
+
+        assert not self._sidecar(csv_path).exists()
+
+    def test_parquet_round_trip(self, tmp_path):
+        """With pyarrow, the Parquet sidecar carries its key and reloads equal."""
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0, 7.5, 12.0])
+
+        first = load_trees(csv_path)
+        cache_path = tmp_path / "trees.csv.parquet"
+        metadata = pyarrow_parquet.read_schema(cache_path).metadata
+
+        assert CACHE_KEY_METADATA in metadata
+        pd.testing.assert_frame_equal(first, load_trees(csv_path))
+
+    def test_parquet_write_failure_leaves_no_sidecar(self, tmp_path, monkeypatch):
+        """A frame Parquet cannot store is returned without a partial sidecar."""
+        pytest.importorskip("pyarrow.parquet")
+        csv_path = tmp_path / "trees.csv"
+        self._write_trees(csv_path, [5.0])
+        mixed = pd.DataFrame({"STAND_ID": [1, "CARB_1"]})
+        monkeypatch.setattr(data_loader, "_parse_csv", lambda *args: mixed)
+
+        df = data_loader._read_csv_cached(csv_path, frozenset({"STAND_ID"}))
+
+        assert df is mixed
+        assert not (tmp_path / "trees.csv.parquet").exists()
+
+
+class TestLoadAndValidate:
+    """Tests for the fused load_and_validate pipeline."""
+
+    def _write_data(self, tmp_path):
+        stand_file = tmp_path / "stands.csv"
+        tree_file = tmp_path / "trees.csv"
+        pd.DataFrame(
+            {
+                "STAND_ID": ["CARB_1", "CARB_2", "CARB_3", "LEF_4"],
+                "VARIANT": ["IE"] * 4,
+                "INV_YEAR": [2023] * 4,
+                "PlotID": [1, 2, 3, 4],
+            }
+        ).to_csv(stand_file, index=False)
+        pd.DataFrame(
+            {
+                "STAND_ID": ["CARB_1", "CARB_1", "CARB_3", "LEF_4"],
+                "PLOT_ID": [1, 1, 1, 1],
+                "TREE_ID": [1, 2, 1, 1],
+                "SPECIES": [202] * 4,
+                "DIAMETER": [5.0, 6.0, 7.0, 8.0],
+            }
+        ).to_csv(tree_file, index=False)
+        return stand_file, tree_file
+
+    def test_matches_step_by_step_pipeline(self, tmp_path):
+        """Same output as get_carbon_plot_ids -> filter -> validate."""
+        stand_file, tree_file = self._write_data(tmp_path)
+
+        stands = load_stands(stand_file)
+        trees = load_trees(tree_file)
+        carbon_plots = get_carbon_plot_ids(stands)
+        stands, trees = filter_by_plot_ids(stands, trees, carbon_plots)
+        exp_stands, exp_trees, exp_report = validate_stands(stands, trees)
+
+        data = load_and_validate(stand_file, tree_file)
+
+        assert data.carbon_plot_ids == [1, 2, 3]
+        pd.testing.assert_frame_equal(data.stands, exp_stands)
+        pd.testing.assert_frame_equal(data.trees, exp_trees)
+        assert data.report == exp_report
+
+    def test_all_plots(self, tmp_path):
+        """carbon_only=False keeps non-carbon stands."""
+        stand_file, tree_file = self._write_data(tmp_path)
+
+        data = load_and_validate(stand_file, tree_file, carbon_only=False)
+
+        assert data.stands["STAND_ID"].tolist() == ["CARB_1", "CARB_3", "LEF_4"]
+        assert data.report["total_stands"] == 4
+
+    def test_no_matching_plots_raises(self, tmp_path):
+        """Unknown plot IDs raise ValueError."""
+        stand_file, tree_file = self._write_data(tmp_path)
+
+        with pytest.raises(ValueError, match="No stands found"):
+            load_and_validate(stand_file, tree_file, plot_ids=[99])
+
+
 class TestIntegrationWithRealData:
     """Integration tests with actual Lubrecht data."""
 
@@ -0,0 +1,110 @@
+"""
+Unit tests for FVS input database creation.
+"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from fvs_tools.db_input import (
+    _build_tree_frame,
+    _iter_rows,
+    create_fvs_input_db,
+    verify_fvs_input_db,
+)
+
+
+def _read_rows(db_path, query):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(query).fetchall()
+    finally:
+        conn.close()
+
+
+class TestCreateFvsInputDb:
+    def test_stand_columns_mapped(self, tmp_path):
+        """Stand values are cast per column and missing values become NULL."""
+        stands = pd.DataFrame(
+            {
+                "STAND_ID": [99, 100],
+                "VARIANT": ["IE", "IE"],
+                "INV_YEAR": [2020.0, np.nan],
+                "PV_CODE": [260.0, np.nan],
+                "MAX_BA": [200.0, np.nan],
+                "SLOPE": [10, 20],
+            }
+        )
+        trees = pd.DataFrame({"STAND_ID": [99, 100], "SPECIES": [202, 122]})
+        db_path = tmp_path / "input.db"
+
+        create_fvs_input_db(stands, trees, db_path)
+
+        rows = _read_rows(
+            db_path,
+            "SELECT Stand_CN, Stand_ID, Inv_Year, PV_Code, BA_Max, Slope, Age "
+            "FROM FVS_StandInit ORDER BY Stand_ID",
+        )
+        assert rows == [
+            ("100", "100", None, None, None, 20.0, None),
+            ("99", "99", 2020, "260", 200.0, 10.0, None),
+        ]
+
+    def test_tree_defaults_and_identifiers(self, tmp_path):
+        """Tree IDs are derived per row and null counts fall back to defaults."""
+        stands = pd.DataFrame({"STAND_ID": [99]})
+        trees = pd.DataFrame(
+            {
+                "STAND_ID": [99, 99],
+                "PLOT_ID": [1, 2],
+                "TREE_ID": [np.nan, 7.0],
+                "TREE_COUNT": [np.nan, 3.5],
+                "SPECIES": [202.0, 122.0],
+                "DIAMETER": [10.1, np.nan],
+            }
+        )
+        db_path = tmp_path / "input.db"
+
+        create_fvs_input_db(stands, trees, db_path)
+
+        rows = _read_rows(
+            db_path,
+            "SELECT StandPlot_CN, Tree_CN, Tree_ID, Tree_Count, History, "
+            "Species, DBH, Plot_ID FROM FVS_TreeInit ORDER BY Tree_CN",
+        )
+        assert rows == [
+            ("99_P1", "99_T1", 1, 1.0, 1, "202", 10.1, 1),
+            ("99_P2", "99_T2", 7, 3.5, 1, "122", None, 2),
+        ]
+
+    def test_rows_bind_as_builtin_types(self):
+        """Insert rows hold only exact builtin types (no sqlite3 adapters)."""
+        trees = pd.DataFrame(
+            {
+                "STAND_ID": ["A", "B"],
+                "PLOT_ID": [1, 2],
+                "SPECIES": [202, 122],
+                "DIAMETER": [10.5, np.nan],
+                "CRRATIO": [40.0, np.nan],
+            }
+        )
+
+        rows = list(_iter_rows(_build_tree_frame(trees)))
+
+        value_types = {type(value) for row in rows for value in row}
+        assert value_types <= {int, float, str, type(None)}
+
+    def test_returns_verify_summary(self, tmp_path):
+        """The returned summary matches reading the database back."""
+        stands = pd.DataFrame({"STAND_ID": ["B", "A", "C"]})
+        trees = pd.DataFrame(
+            {"STAND_ID": ["B", "A", "B", "C"], "SPECIES": [202, 122, 202, 73]}
+        )
+        db_path = tmp_path / "input.db"
+
+        summary = create_fvs_input_db(stands, trees, db_path)
+
+        verified = verify_fvs_input_db(db_path)
+        assert summary == verified
+        assert summary["trees_by_stand"] == {"A": 1, "B": 2, "C": 1}
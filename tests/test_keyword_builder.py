@@ -0,0 +1,234 @@
+"""
+Unit tests for FVS keyword file generation.
+
+Batch keyword files are compared line-for-line against golden text, so any
+change to keyword formatting shows up as a test failure.
+"""
+
+import pandas as pd
+
+from fvs_tools.config import FVSSimulationConfig
+from fvs_tools.keyword_builder import (
+    build_batch_keyword_file,
+    build_batch_keyword_file_df,
+)
+
+# Two harv1 stands: carbon and canopy output, MINHARV and Q-factor thinning
+HARV1_BATCH_LINES = (
+    "!!title: harv1",
+    "!!built: batch-run",
+    "",
+    "StdIdent",
+    "CARB_99                   harv1",
+    "StandCN",
+    "CARB_99",
+    "MgmtId",
+    "A002",
+    "InvYear       2023",
+    "TimeInt                 10 ",
+    "NumCycle     3 ",
+    "",
+    "DataBase",
+    "DSNOut",
+    "FVSOut.db",
+    "Summary        2",
+    "Computdb          0         1",
+    "CarbReDB        2",
+    "End",
+    "",
+    "Database",
+    "DSNIn",
+    "FVS_Data.db",
+    "StandSQL",
+    "SELECT * FROM FVS_StandInit",
+    "WHERE Stand_ID= '%StandID%'",
+    "EndSQL",
+    "TreeSQL",
+    "SELECT * FROM FVS_TreeInit",
+    "WHERE Stand_CN= '%StandID%'",
+    "EndSQL",
+    "END",
+    "",
+    "FMIn",
+    "CarbRept        2",
+    "CarbCut",
+    "CarbCalc",
+    "End",
+    "",
+    "Compute            0",
+    "Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)",
+    "End",
+    "",
+    "MINHARV           0       0.0       0.0       0.0       0.0     500.0",
+    "",
+    "THINQFA         2033       0.0     999.0         0       2.0       2.0      70.0",
+    "         0",
+    "",
+    "SPLabel",
+    "  All_Stands, & ",
+    "  Section6",
+    "Process",
+    "",
+    "StdIdent",
+    "CARB_100                  harv1",
+    "StandCN",
+    "CARB_100",
+    "MgmtId",
+    "A002",
+    "InvYear       2022",
+    "TimeInt                 10 ",
+    "NumCycle     3 ",
+    "",
+    "DataBase",
+    "DSNOut",
+    "FVSOut.db",
+    "Summary        2",
+    "Computdb          0         1",
+    "CarbReDB        2",
+    "End",
+    "",
+    "Database",
+    "DSNIn",
+    "FVS_Data.db",
+    "StandSQL",
+    "SELECT * FROM FVS_StandInit",
+    "WHERE Stand_ID= '%StandID%'",
+    "EndSQL",
+    "TreeSQL",
+    "SELECT * FROM FVS_TreeInit",
+    "WHERE Stand_CN= '%StandID%'",
+    "EndSQL",
+    "END",
+    "",
+    "FMIn",
+    "CarbRept        2",
+    "CarbCut",
+    "CarbCalc",
+    "End",
+    "",
+    "Compute            0",
+    "Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)",
+    "End",
+    "",
+    "MINHARV           0       0.0       0.0       0.0       0.0     500.0",
+    "",
+    "THINQFA         2033       0.0     999.0         0       2.0       2.0      70.0",
+    "         0",
+    "",
+    "SPLabel",
+    "  All_Stands, & ",
+    "  Section6",
+    "Process",
+    "",
+    "Stop",
+)
+
+# One stand with default options, given with lower-case column names
+BASE_LOWER_LINES = (
+    "!!title: base",
+    "!!built: batch-run",
+    "",
+    "StdIdent",
+    "CARB_7                    base",
+    "StandCN",
+    "CARB_7",
+    "MgmtId",
+    "A002",
+    "InvYear       2021",
+    "TimeInt                 10 ",
+    "NumCycle     2 ",
+    "",
+    "DataBase",
+    "DSNOut",
+    "FVSOut.db",
+    "Summary        2",
+    "Computdb          0         1",
+    "CarbReDB        2",
+    "End",
+    "",
+    "Database",
+    "DSNIn",
+    "FVS_Data.db",
+    "StandSQL",
+    "SELECT * FROM FVS_StandInit",
+    "WHERE Stand_ID= '%StandID%'",
+    "EndSQL",
+    "TreeSQL",
+    "SELECT * FROM FVS_TreeInit",
+    "WHERE Stand_CN= '%StandID%'",
+    "EndSQL",
+    "END",
+    "",
+    "FMIn",
+    "CarbRept        2",
+    "CarbCut",
+    "CarbCalc",
+    "End",
+    "",
+    "Compute            0",
+    "Pc_can_cover=SPMCDBH(7,All,0,1,200,0,500,0,0)",
+    "End",
+    "",
+    "SPLabel",
+    "  All_Stands, & ",
+    "  Section6",
+    "Process",
+    "",
+    "Stop",
+)
+
+
+def _harv1_config():
+    return FVSSimulationConfig(
+        name="harv1",
+        num_years=20,
+        min_harvest_volume=500.0,
+        thin_q_factor=2.0,
+        thin_residual_ba=70.0,
+        thin_year=2033,
+    )
+
+
+class TestBatchKeywordFile:
+    def test_two_stand_batch(self, tmp_path):
+        """Two stands with every management option match the golden text."""
+        stands = pd.DataFrame(
+            {"STAND_ID": ["CARB_99", "CARB_100"], "INV_YEAR": [2023, 2022]}
+        )
+        key_path = tmp_path / "batch.key"
+
+        build_batch_keyword_file_df(stands, "FVS_Data.db", _harv1_config(), key_path)
+
+        assert key_path.read_text().split("\n") == list(HARV1_BATCH_LINES)
+
+    def test_series_wrapper_matches(self, tmp_path):
+        """The list-of-Series entry point writes the same file."""
+        stands = [
+            pd.Series({"STAND_ID": "CARB_99", "INV_YEAR": 2023}),
+            pd.Series({"STAND_ID": "CARB_100", "INV_YEAR": 2022}),
+        ]
+        key_path = tmp_path / "batch.key"
+
+        build_batch_keyword_file(stands, "FVS_Data.db", _harv1_config(), key_path)
+
+        assert key_path.read_text().split("\n") == list(HARV1_BATCH_LINES)
+
+    def test_empty_stands(self, tmp_path):
+        """No stands gives only the title block and Stop."""
+        stands = pd.DataFrame({"STAND_ID": [], "INV_YEAR": []})
+        key_path = tmp_path / "batch.key"
+
+        build_batch_keyword_file_df(stands, "FVS_Data.db", _harv1_config(), key_path)
+
+        assert key_path.read_text() == "!!title: harv1\n!!built: batch-run\n\nStop"
+
+    def test_lower_case_columns(self, tmp_path):
+        """Column names are matched case-insensitively; the input is unchanged."""
+        stands = pd.DataFrame({"stand_id": ["CARB_7"], "inv_year": [2021.0]})
+        config = FVSSimulationConfig(name="base", num_years=10)
+        key_path = tmp_path / "batch.key"
+
+        build_batch_keyword_file_df(stands, "FVS_Data.db", config, key_path)
+
+        assert key_path.read_text().split("\n") == list(BASE_LOWER_LINES)
+        assert list(stands.columns) == ["stand_id", "inv_year"]
@@ -4,11 +4,12 @@ Unit tests for Monte Carlo configuration and sampling.
 Tests validation, reproducibility, and correctness of parameter sampling.
 """
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
 
-from fvs_tools.config import FVSSimulationConfig
+from fvs_tools.config import FVSSimulationConfig, build_default_harv1_config
 from fvs_tools.monte_carlo import (
     BooleanParameterSpec,
     DiscreteUniformSpec,
@@ -29,6 +30,24 @@ def base_config():
     )
 
 
+class TestHarv1Config:
+    def test_defaults_applied(self):
+        """Factory sets the Assignment 5 harv1 thinning baseline."""
+        config = build_default_harv1_config(num_years=50)
+        assert config.name == "harv1"
+        assert config.num_years == 50
+        assert config.thin_q_factor == 2.0
+        assert config.thin_residual_ba == 65.0
+        assert config.min_harvest_volume == 4500.0
+
+    def test_overrides_win(self):
+        """Keyword overrides replace baseline values."""
+        config = build_default_harv1_config("demo", thin_residual_ba=70.0)
+        assert config.name == "demo"
+        assert config.thin_residual_ba == 70.0
+        assert config.thin_trigger_ba == 100.0
+
+
 # ParameterSpec validation tests
 class TestUniformParameterSpec:
     def test_valid_spec(self):
@@ -45,6 +64,12 @@ class TestUniformParameterSpec:
         with pytest.raises(ValueError, match="Invalid parameter name"):
             UniformParameterSpec("invalid_param", 1.0, 2.0)
 
+    def test_spec_is_frozen(self):
+        spec = UniformParameterSpec("thin_q_factor", 1.5, 2.5)
+        with pytest.raises(FrozenInstanceError):
+            spec.min_value = 0.0
+        assert hash(spec) == hash(UniformParameterSpec("thin_q_factor", 1.5, 2.5))
+
 
 class TestBooleanParameterSpec:
     def test_valid_spec_default_prob(self):
@@ -301,5 +326,26 @@ class TestGenerateParameterSamples:
         samples = generate_parameter_samples(config)
 
         run_seeds = [sample["run_seed"] for sample in samples]
-        # Check most are unique (small chance of collision with random.randint)
+        # Check most are unique (small chance of collision between seeds)
         assert len(set(run_seeds)) >= 95  # At least 95% unique
+
+    def test_run_seeds_stable_across_batch_size(self, base_config):
+        """A run's seed depends only on batch_seed and run_id."""
+        small = MonteCarloConfig(
+            batch_seed=42,
+            n_samples=5,
+            parameter_specs=[UniformParameterSpec("thin_q_factor", 1.5, 2.5)],
+            base_config=base_config,
+        )
+        large = MonteCarloConfig(
+            batch_seed=42,
+            n_samples=20,
+            parameter_specs=[BooleanParameterSpec("enable_calibration")],
+            base_config=base_config,
+        )
+
+        small_seeds = [s["run_seed"] for s in generate_parameter_samples(small)]
+        large_seeds = [s["run_seed"] for s in generate_parameter_samples(large)]
+
+        assert small_seeds == large_seeds[:5]
+        assert all(1 <= seed <= 99999 for seed in large_seeds)
@@ -16,8 +16,12 @@ from fvs_tools.monte_carlo import (
     MonteCarloConfig,
     UniformParameterSpec,
     create_mc_database,
+    flush_run,
     generate_parameter_samples,
     load_mc_results,
+    merge_mc_databases,
+    optimize_mc_database,
+    summarize_mc,
     update_batch_status,
     update_run_status,
     write_batch_error,
@@ -25,7 +29,9 @@ from fvs_tools.monte_carlo import (
     write_run_registry,
     write_run_summary,
     write_time_series,
+    write_time_series_arrays,
 )
+from fvs_tools.monte_carlo.database import load_timeseries, load_timeseries_arrays
 
 
 @pytest.fixture
@@ -133,6 +139,23 @@ class TestBatchMeta:
         assert row[0] == "complete"
         assert row[1] is not None  # completed_at should be set
 
+    def test_optimize_collects_stats(self, temp_db, mc_config, samples):
+        """Optimizing a finished batch fills sqlite_stat1 and empties the WAL."""
+        conn = create_mc_database(temp_db)
+        write_batch_meta(conn, mc_config)
+        write_run_registry(conn, mc_config.batch_id, samples)
+
+        optimize_mc_database(conn)
+
+        tables = {
+            row[0] for row in conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+        }
+        conn.close()
+
+        assert "MC_RunRegistry" in tables
+        wal_path = temp_db.with_name(temp_db.name + "-wal")
+        assert not wal_path.exists() or wal_path.stat().st_size == 0
+
 
 class TestRunRegistry:
     def test_write_run_registry(self, temp_db, mc_config, samples):
@@ -276,6 +299,175 @@ class TestTimeSeries:
         assert rows[0] == (2023, 40.0, 55.0)
         assert rows[1] == (2033, 45.0, 65.0)
 
+    def test_time_series_missing_values(self, temp_db, mc_config, samples):
+        """Missing values are stored as NULL and the input frame is untouched."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+
+        ts_data = pd.DataFrame(
+            {
+                "year": [2023, 2033],
+                "aboveground_c_live": [40.0, float("nan")],
+                "tpa": pd.array([120, None], dtype="Int64"),
+            }
+        )
+
+        write_time_series(conn, mc_config.batch_id, 0, ts_data)
+
+        rows = conn.execute(
+            "SELECT year, aboveground_c_live, tpa FROM MC_TimeSeries "
+            "WHERE batch_id = ? AND run_id = 0 ORDER BY year",
+            (mc_config.batch_id,),
+        ).fetchall()
+        conn.close()
+
+        assert rows == [(2023, 40.0, 120.0), (2033, None, None)]
+        assert list(ts_data.columns) == ["year", "aboveground_c_live", "tpa"]
+
+    def test_load_timeseries_filtered_and_chunked(self, temp_db, mc_config, samples):
+        """Time series can be loaded for selected runs or in chunks."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+        for run_id in range(3):
+            ts_data = pd.DataFrame({"year": [2023, 2033], "ba": [100.0, 110.0]})
+            write_time_series(conn, mc_config.batch_id, run_id, ts_data)
+
+        selected = load_timeseries(conn, run_ids=[0, 2])
+        chunks = list(load_timeseries(conn, chunksize=4))
+        conn.close()
+
+        assert sorted(selected["run_id"].unique()) == [0, 2]
+        assert len(selected) == 4
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+
+    def test_array_layout_round_trip(self, temp_db, mc_config, samples):
+        """Packed per-run arrays load back as the long per-year layout."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+        ts_data = pd.DataFrame(
+            {
+                "year": [2023, 2033, 2043],
+                "total_carbon": [45.0, 48.5, float("nan")],
+                "ba": [100.0, 110.0, 120.0],
+            }
+        )
+        write_time_series_arrays(conn, mc_config.batch_id, 0, ts_data)
+        write_time_series_arrays(conn, mc_config.batch_id, 1, ts_data.head(1))
+
+        loaded = load_timeseries_arrays(conn)
+        only_run_1 = load_timeseries_arrays(conn, run_ids=[1])
+        conn.close()
+
+        assert loaded["run_id"].tolist() == [0, 0, 0, 1]
+        assert loaded["year"].tolist() == [2023, 2033, 2043, 2023]
+        assert loaded["ba"].tolist() == [100.0, 110.0, 120.0, 100.0]
+        assert loaded["total_carbon"].isna().tolist() == [False, False, True, False]
+        assert loaded["tpa"].isna().all()
+        assert loaded["ba"].dtype == "float32"
+        assert len(only_run_1) == 1
+
+
+class TestFlushRun:
+    def test_flush_run_writes_all(self, temp_db, mc_config, samples):
+        """flush_run marks run complete and writes summary and time series."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+
+        ts_data = pd.DataFrame({"year": [2023, 2033], "total_carbon": [45.0, 48.0]})
+        flush_run(conn, mc_config.batch_id, 0, {"n_stands": 3}, ts_data)
+
+        status = conn.execute(
+            "SELECT status FROM MC_RunRegistry WHERE batch_id = ? AND run_id = 0",
+            (mc_config.batch_id,),
+        ).fetchone()[0]
+        n_summary = conn.execute("SELECT COUNT(*) FROM MC_RunSummary").fetchone()[0]
+        n_ts = conn.execute("SELECT COUNT(*) FROM MC_TimeSeries").fetchone()[0]
+        conn.close()
+
+        assert status == "complete"
+        assert n_summary == 1
+        assert n_ts == 2
+
+    def test_flush_run_rolls_back_on_error(self, temp_db, mc_config, samples):
+        """A failed write leaves no partial results for the run."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+
+        bad_ts = pd.DataFrame({"year": [2023], "not_a_column": [1.0]})
+        with pytest.raises(sqlite3.OperationalError):
+            flush_run(conn, mc_config.batch_id, 0, {"n_stands": 3}, bad_ts)
+
+        status = conn.execute(
+            "SELECT status FROM MC_RunRegistry WHERE batch_id = ? AND run_id = 0",
+            (mc_config.batch_id,),
+        ).fetchone()[0]
+        n_summary = conn.execute("SELECT COUNT(*) FROM MC_RunSummary").fetchone()[0]
+        conn.close()
+
+        assert status == "pending"
+        assert n_summary == 0
+
+    def test_flush_run_in_caller_transaction(self, temp_db, mc_config, samples):
+        """commit=False writes inside the caller's transaction, with completed_at."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+
+        with conn:
+            for run_id in (0, 1):
+                flush_run(
+                    conn,
+                    mc_config.batch_id,
+                    run_id,
+                    {"n_stands": 3},
+                    completed_at="2024-01-01T00:00:00",
+                    commit=False,
+                )
+            assert conn.in_transaction
+
+        rows = conn.execute(
+            "SELECT status, completed_at FROM MC_RunRegistry "
+            "WHERE batch_id = ? AND run_id IN (0, 1)",
+            (mc_config.batch_id,),
+        ).fetchall()
+        conn.close()
+
+        assert rows == [("complete", "2024-01-01T00:00:00")] * 2
+
+
+class TestMergeShards:
+    def test_merge_shards(self, temp_db, mc_config, samples):
+        """Rows from each shard end up in the target and shards are removed."""
+        shard_paths = []
+        for k, run_id in enumerate([0, 1]):
+            shard_path = temp_db.parent / f"mc_results.w{k}.db"
+            shard = create_mc_database(shard_path)
+            write_run_registry(shard, mc_config.batch_id, samples)
+            ts_data = pd.DataFrame({"year": [2023, 2033], "total_carbon": [1.0, 2.0]})
+            flush_run(shard, mc_config.batch_id, run_id, {"n_stands": 1}, ts_data)
+            shard.close()
+            shard_paths.append(shard_path)
+
+        conn = create_mc_database(temp_db)
+        n_merged = merge_mc_databases(conn, shard_paths, delete_shards=True)
+
+        n_registry = conn.execute("SELECT COUNT(*) FROM MC_RunRegistry").fetchone()[0]
+        n_summary = conn.execute("SELECT COUNT(*) FROM MC_RunSummary").fetchone()[0]
+        n_ts = conn.execute("SELECT COUNT(*) FROM MC_TimeSeries").fetchone()[0]
+        conn.close()
+
+        assert n_merged == 2
+        assert n_registry == len(samples)
+        assert n_summary == 2
+        assert n_ts == 4
+        assert not any(p.exists() for p in shard_paths)
+
+    def test_missing_shard_raises(self, temp_db):
+        """Missing shard file raises FileNotFoundError."""
+        conn = create_mc_database(temp_db)
+        with pytest.raises(FileNotFoundError):
+            merge_mc_databases(conn, [temp_db.parent / "missing.db"])
+        conn.close()
+
 
 class TestErrorLogging:
     def test_write_batch_error(self, temp_db, mc_config, samples):
@@ -356,6 +548,22 @@ class TestLoadResults:
         assert len(results["summary"]) == 1
         assert len(results["timeseries"]) == 2
 
+    def test_load_downcast_floats(self, temp_db, mc_config, samples):
+        """downcast_floats returns float32 metric columns."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+        write_run_summary(
+            conn, mc_config.batch_id, 0, {"final_total_carbon": 45.25, "n_stands": 8}
+        )
+        conn.close()
+
+        results = load_mc_results(temp_db, downcast_floats=True)
+        summary = results["summary"]
+
+        assert summary["final_total_carbon"].dtype == "float32"
+        assert summary["final_total_carbon"].iloc[0] == pytest.approx(45.25)
+        assert results["registry"]["thin_q_factor"].dtype == "float32"
+
     def test_load_results_joins(self, temp_db, mc_config, samples):
         """Loaded dataframes can be joined."""
         conn = create_mc_database(temp_db)
@@ -379,6 +587,43 @@ class TestLoadResults:
         assert pd.isna(merged.loc[1, "final_total_carbon"])  # Not completed
 
 
+class TestSummarizeMC:
+    def test_matches_pandas(self, temp_db, mc_config, samples):
+        """SQL statistics match pandas mean/std/min/max."""
+        conn = create_mc_database(temp_db)
+        write_run_registry(conn, mc_config.batch_id, samples)
+        for run_id, carbon in enumerate([40.0, 45.5, 52.0, 47.25]):
+            write_run_summary(
+                conn, mc_config.batch_id, run_id, {"final_total_carbon": carbon}
+            )
+        conn.close()
+
+        stats = summarize_mc(temp_db, columns=("final_total_carbon",))
+        expected = load_mc_results(temp_db)["summary"]["final_total_carbon"]
+
+        assert stats["n_runs"] == 4
+        carbon = stats["final_total_carbon"]
+        assert carbon["mean"] == pytest.approx(expected.mean())
+        assert carbon["std"] == pytest.approx(expected.std())
+        assert carbon["min"] == expected.min()
+        assert carbon["max"] == expected.max()
+
+    def test_empty_database(self, temp_db):
+        """No completed runs gives n_runs == 0."""
+        conn = create_mc_database(temp_db)
+        conn.close()
+
+        stats = summarize_mc(temp_db)
+
+        assert stats["n_runs"] == 0
+        assert stats["final_total_carbon"]["mean"] is None
+
+    def test_invalid_column_raises(self, temp_db):
+        """Unknown column names are rejected."""
+        with pytest.raises(ValueError, match="Unknown summary columns"):
+            summarize_mc(temp_db, columns=("run_id; DROP TABLE x",))
+
+
 class TestDataIntegrity:
     def test_foreign_key_constraint(self, temp_db, mc_config):
         """Foreign key constraint is enforced (if enabled)."""
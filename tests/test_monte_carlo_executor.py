@@ -4,7 +4,9 @@ Unit tests for Monte Carlo executor.
 Tests the parallel execution engine without running actual FVS.
 """
 
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,8 +18,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from fvs_tools.config import FVSSimulationConfig
 from fvs_tools.monte_carlo import MonteCarloConfig, UniformParameterSpec
+from fvs_tools.monte_carlo.database import (
+    create_mc_database,
+    load_mc_results,
+    write_run_registry,
+)
 from fvs_tools.monte_carlo.executor import (
+    _WORKER_STATE,
     MC_TO_FVS_PARAM_MAP,
+    _execute_run_in_worker,
+    _init_worker,
+    _writer_loop,
     execute_single_run,
     run_monte_carlo_batch,
 )
@@ -135,6 +146,29 @@ class TestExecuteSingleRun:
         run_dir = tmp_path / "run_0000"
         assert run_dir.exists()
 
+        # Stands run sequentially inside an MC worker
+        assert mock_run_batch.call_args.kwargs["config"].max_workers == 1
+
+    @patch("fvs_tools.monte_carlo.executor.run_batch_simulation")
+    @patch("fvs_tools.monte_carlo.executor.create_fvs_input_db")
+    def test_shared_input_db_reused(self, mock_create_db, mock_run_batch, tmp_path):
+        """A prebuilt input database is passed through instead of rebuilt."""
+        mock_run_batch.side_effect = RuntimeError("FVS crashed")
+        shared_db = tmp_path / "FVS_Data.db"
+
+        execute_single_run(
+            {"run_id": 1, "run_seed": 1},
+            pd.DataFrame({"STAND_ID": ["A"]}),
+            pd.DataFrame({"STAND_ID": ["A"], "TREE_ID": [1]}),
+            {"num_years": 20, "cycle_length": 10},
+            tmp_path,
+            "test_batch_123",
+            shared_db,
+        )
+
+        mock_create_db.assert_not_called()
+        assert mock_run_batch.call_args.kwargs["input_database"] == shared_db
+
     @patch("fvs_tools.monte_carlo.executor.run_batch_simulation")
     @patch("fvs_tools.monte_carlo.executor.create_fvs_input_db")
     def test_partial_failure(self, mock_create_db, mock_run_batch, tmp_path):
@@ -209,6 +243,138 @@ class TestExecuteSingleRun:
         assert run_dir.exists()
 
 
+class TestWorkerInitializer:
+    """Test per-worker shared state used by the process pool."""
+
+    @patch("fvs_tools.monte_carlo.executor.execute_single_run")
+    def test_task_uses_initializer_state(self, mock_execute, tmp_path):
+        """Tasks receive the frames stashed by _init_worker."""
+        stands = pd.DataFrame({"STAND_ID": ["A"], "PlotID": [1]})
+        trees = pd.DataFrame({"STAND_ID": ["A"], "TREE_ID": [1]})
+        mock_execute.return_value = {"run_id": 3, "success": True}
+
+        _init_worker(stands, trees, {"num_years": 20}, tmp_path, "batch_x")
+        result = _execute_run_in_worker({"run_id": 3, "run_seed": 1})
+
+        assert result["run_id"] == 3
+        args = mock_execute.call_args.args
+        assert args[0] == {"run_id": 3, "run_seed": 1}
+        assert args[1] is stands
+        assert args[2] is trees
+        assert args[3:] == ({"num_years": 20}, tmp_path, "batch_x")
+
+    def test_initializer_loads_pickled_frames(self, tmp_path):
+        """Paths passed to _init_worker are loaded as DataFrames."""
+        stands = pd.DataFrame({"STAND_ID": ["A"], "PlotID": [1]})
+        trees = pd.DataFrame({"STAND_ID": ["A"], "TREE_ID": [1]})
+        stands.to_pickle(tmp_path / "stands.pkl")
+        trees.to_pickle(tmp_path / "trees.pkl")
+
+        _init_worker(
+            tmp_path / "stands.pkl",
+            tmp_path / "trees.pkl",
+            {"num_years": 20},
+            tmp_path,
+            "batch_x",
+        )
+
+        pd.testing.assert_frame_equal(_WORKER_STATE["stands"], stands)
+        pd.testing.assert_frame_equal(_WORKER_STATE["trees"], trees)
+
+
+class TestResultWriter:
+    """Test the background thread that commits run results."""
+
+    def test_writer_flushes_queue(self, tmp_path):
+        """Queued results are all committed once the stop sentinel arrives."""
+        db_path = tmp_path / "mc_results.db"
+        conn = create_mc_database(db_path)
+        write_run_registry(
+            conn,
+            "batch_x",
+            [{"run_id": 0, "run_seed": 1}, {"run_id": 1, "run_seed": 2}],
+        )
+        conn.close()
+
+        results = queue.Queue()
+        results.put(("complete", (0, {"n_stands": 3}, pd.DataFrame({"year": [2020]}))))
+        results.put(("failed", (1, "execution_error", "FVS crashed")))
+        results.put(None)
+        errors = []
+
+        _writer_loop(db_path, "batch_x", results, errors)
+
+        conn = create_mc_database(db_path)
+        statuses = conn.execute(
+            "SELECT run_id, status FROM MC_RunRegistry ORDER BY run_id"
+        ).fetchall()
+        completed_at = conn.execute(
+            "SELECT DISTINCT completed_at FROM MC_RunRegistry"
+        ).fetchall()
+        n_series = conn.execute("SELECT COUNT(*) FROM MC_TimeSeries").fetchone()[0]
+        error_msgs = conn.execute("SELECT error_msg FROM MC_BatchErrors").fetchall()
+        conn.close()
+
+        assert errors == []
+        assert statuses == [(0, "complete"), (1, "failed")]
+        assert len(completed_at) == 1 and completed_at[0][0] is not None
+        assert n_series == 1
+        assert error_msgs == [("FVS crashed",)]
+
+
+def _thread_pool(max_workers, mp_context=None, initializer=None, initargs=()):
+    """Stand-in for ProcessPoolExecutor so patched functions reach the workers."""
+    return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+
+class TestPackedTimeSeries:
+    """End-to-end batch writing time series in the packed array layout."""
+
+    @patch("fvs_tools.monte_carlo.executor.ProcessPoolExecutor", _thread_pool)
+    @patch("fvs_tools.monte_carlo.executor.create_fvs_input_db")
+    @patch("fvs_tools.monte_carlo.executor.execute_single_run")
+    def test_packed_batch_round_trip(
+        self, mock_execute, mock_create_db, base_fvs_config, tmp_path
+    ):
+        """packed_time_series routes every run's series to MC_TimeSeriesArr."""
+
+        def mock_run(run_params, *args, **kwargs):
+            return {
+                "run_id": run_params["run_id"],
+                "success": True,
+                "summary": {"n_stands": 1},
+                "time_series": pd.DataFrame(
+                    {"year": [2023, 2033], "ba": [120.0, 110.5]}
+                ),
+                "error": None,
+            }
+
+        mock_execute.side_effect = mock_run
+        mc_config = MonteCarloConfig(
+            batch_seed=42,
+            n_samples=3,
+            n_workers=2,
+            parameter_specs=[UniformParameterSpec("thin_q_factor", 1.5, 2.5)],
+            base_config=base_fvs_config,
+            packed_time_series=True,
+        )
+        stands = pd.DataFrame({"STAND_ID": ["A"], "PlotID": [1]})
+        trees = pd.DataFrame({"STAND_ID": ["A"], "TREE_ID": [1]})
+
+        results_db = run_monte_carlo_batch(mc_config, stands, trees, tmp_path)
+
+        conn = create_mc_database(results_db)
+        n_long = conn.execute("SELECT COUNT(*) FROM MC_TimeSeries").fetchone()[0]
+        n_packed = conn.execute("SELECT COUNT(*) FROM MC_TimeSeriesArr").fetchone()[0]
+        conn.close()
+        ts = load_mc_results(results_db)["timeseries"]
+
+        assert n_long == 0
+        assert n_packed == 3
+        assert sorted(ts["run_id"].tolist()) == [0, 0, 1, 1, 2, 2]
+        assert ts["ba"].tolist() == [120.0, 110.5] * 3
+
+
 class TestRunMonteCarloBatch:
     """
     Test run_monte_carlo_batch orchestrator.
@@ -13,7 +13,11 @@ import pytest
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from fvs_tools.monte_carlo import extract_run_summary, extract_time_series
+from fvs_tools.monte_carlo import (
+    combine_results,
+    extract_run_summary,
+    extract_time_series,
+)
 
 
 class TestExtractRunSummary:
@@ -334,6 +338,37 @@ class TestExtractTimeSeries:
         ts = extract_time_series({})
         assert len(ts) == 0
 
+    def test_shared_combined_frame(self):
+        """Passing a prebuilt combined frame gives the same outputs."""
+        results = {
+            "summary_all": pd.DataFrame(
+                {
+                    "StandID": ["A", "A", "B", "B"],
+                    "Year": [2023, 2033, 2023, 2033],
+                    "BA": [120, 110, 125, 115],
+                    "RBdFt": [1000, 0, 800, 200],
+                }
+            ),
+            "carbon_all": pd.DataFrame(
+                {
+                    "StandID": ["A", "A", "B", "B"],
+                    "Year": [2023, 2033, 2023, 2033],
+                    "Aboveground_Total_Live": [40, 42, 38, 41],
+                }
+            ),
+            "run_status": pd.DataFrame({"success": [True, True]}),
+        }
+
+        combined = combine_results(results)
+
+        assert extract_run_summary(results, combined=combined) == (
+            extract_run_summary(results)
+        )
+        pd.testing.assert_frame_equal(
+            extract_time_series(results, combined=combined),
+            extract_time_series(results),
+        )
+
     def test_validation_catches_non_monotonic(self):
         """Test that validation catches incorrectly computed cumulative."""
         # This shouldn't happen with correct implementation, but tests the validator
@@ -381,6 +416,15 @@ class TestColumnMapping:
         col = _find_column(df, ["NotPresent", "AlsoNotPresent"])
         assert col is None
 
+    def test_find_column_accepts_column_set(self):
+        """Test _find_column searches a precomputed set of column names."""
+        from fvs_tools.monte_carlo.outputs import _find_column
+
+        cols = {"BA", "Standing_Dead", "PC_CAN_C"}
+
+        assert _find_column(cols, ["Pc_can_cover", "PC_CAN_C"]) == "PC_CAN_C"
+        assert _find_column(cols, ["Aboveground_Total_Live"]) is None
+
     def test_alternative_carbon_column_names(self):
         """Test extraction works with standard FVS carbon column names."""
         results = {
@@ -0,0 +1,37 @@
+"""
+Unit tests for the Monte Carlo driver script and its presets.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import demo_parallel_batch
+import run_large_mc
+from run_mc import build_base_config, build_parser
+
+
+class TestBaseConfig:
+    def test_demo_preset_keeps_carbon_and_canopy(self):
+        """The demo preset (no --treelist) still outputs carbon and canopy."""
+        args = build_parser().parse_args(demo_parallel_batch.PRESET)
+
+        config = build_base_config(args)
+
+        assert config.output_carbon
+        assert config.compute_canopy_cover
+        assert not config.output_treelist
+        assert config.name == "parallel_demo"
+
+    def test_treelist_flag_only_toggles_treelist(self):
+        """--treelist turns on the tree list without changing carbon output."""
+        args = build_parser().parse_args(run_large_mc.PRESET)
+
+        config = build_base_config(args)
+
+        assert config.output_treelist
+        assert config.output_carbon
+        assert config.compute_canopy_cover
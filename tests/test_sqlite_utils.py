@@ -0,0 +1,89 @@
+"""
+Unit tests for SQLite connection helpers.
+"""
+
+import sqlite3
+
+import pytest
+
+from fvs_tools.sqlite_utils import bulk_load_mode, open_sqlite
+
+
+class TestOpenSqlite:
+    def test_write_connection_uses_wal(self, tmp_path):
+        """Read-write connections are switched to WAL mode."""
+        conn = open_sqlite(tmp_path / "test.db")
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+
+    def test_in_memory_write_connection(self):
+        """In-memory databases open without WAL and accept writes."""
+        conn = open_sqlite(":memory:")
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.close()
+
+        assert mode == "memory"
+
+    def test_read_only_connection_rejects_writes(self, tmp_path):
+        """Read-only connections can query but not modify the database."""
+        db_path = tmp_path / "test.db"
+        conn = open_sqlite(db_path)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.commit()
+        conn.close()
+
+        ro = open_sqlite(db_path, read_only=True)
+        assert ro.execute("SELECT x FROM t").fetchall() == [(1,)]
+        with pytest.raises(sqlite3.OperationalError):
+            ro.execute("INSERT INTO t VALUES (2)")
+        ro.close()
+
+    def test_immutable_read(self, tmp_path):
+        """Immutable read-only connections read a closed database."""
+        db_path = tmp_path / "test db.db"  # Space exercises URI quoting
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.close()
+
+        ro = open_sqlite(db_path, read_only=True, immutable=True)
+        tables = ro.execute("SELECT name FROM sqlite_master").fetchall()
+        ro.close()
+
+        assert tables == [("t",)]
+
+    def test_scratch_connection(self, tmp_path):
+        """Scratch connections use an in-memory journal and no fsync."""
+        conn = open_sqlite(tmp_path / "scratch.db", scratch=True)
+        journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+        assert journal == "memory"
+        assert sync == 0
+
+
+class TestBulkLoadMode:
+    def test_settings_restored(self, tmp_path):
+        """Journaling is off inside the block and restored afterwards."""
+        conn = open_sqlite(tmp_path / "test.db")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+        with bulk_load_mode(conn):
+            inside = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+        count = conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+        conn.close()
+
+        assert inside == "off"
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+        assert count == 10